@@ -0,0 +1,99 @@
+"""get_current_user 의존성 마이크로벤치마크 (AT 캐시 사용/미사용, 세션 denylist 확인 비용 비교)
+
+실행: python -m benchmarks.bench_auth_dependency [--iterations 20000] [--tokens 100] [--revoked 10000]
+(REDIS_URL이 실제 Redis를 가리키면 Redis 조회 비용에 네트워크 왕복이 포함됨)
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from infra.redis_client import async_redis_client, close_redis
+from lib.auth import create_access_token
+from lib.dependencies import get_current_user
+from lib.token_cache import access_token_cache
+from repositories.session_denylist import session_denylist
+
+async def run(credentials: list, iterations: int) -> float:
+    started = time.perf_counter()
+    for i in range(iterations):
+        await get_current_user(credentials[i % len(credentials)])
+    return (time.perf_counter() - started) / iterations
+
+async def run_denied(credentials: HTTPAuthorizationCredentials, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        try:
+            await get_current_user(credentials)
+        except HTTPException:
+            pass
+    return (time.perf_counter() - started) / iterations
+
+def run_filter(session_ids: list, iterations: int) -> float:
+    started = time.perf_counter()
+    for i in range(iterations):
+        session_denylist.might_be_revoked(session_ids[i % len(session_ids)])
+    return (time.perf_counter() - started) / iterations
+
+async def run_redis(session_ids: list, iterations: int) -> float:
+    """Bloom filter 없이 요청마다 Redis를 확인하는 경우"""
+    started = time.perf_counter()
+    for i in range(iterations):
+        await async_redis_client.zscore(session_denylist.KEY, session_ids[i % len(session_ids)])
+    return (time.perf_counter() - started) / iterations
+
+def credential(session_id: str, user_id: int) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(
+        scheme="Bearer",
+        credentials=create_access_token({"sub": str(user_id), "sid": session_id})
+    )
+
+async def main_async(args):
+    session_ids = [str(uuid.uuid4()) for _ in range(args.tokens)]
+    credentials = [credential(session_id, i) for i, session_id in enumerate(session_ids)]
+
+    max_size = access_token_cache.max_size
+    access_token_cache.max_size = 0
+    uncached = await run(credentials, args.iterations)
+
+    access_token_cache.max_size = max_size or 10000
+    access_token_cache.clear()
+    cached = await run(credentials, args.iterations)
+
+    # 다른 세션들이 무효화된 상태 (filter에 항목이 있어도 정상 세션은 대부분 메모리 확인으로 끝남)
+    await session_denylist.revoke(str(uuid.uuid4()) for _ in range(args.revoked))
+    session_denylist.checks = session_denylist.filter_positives = session_denylist.redis_checks = 0
+    with_revocations = await run(credentials, args.iterations)
+    positives, redis_checks = session_denylist.filter_positives, session_denylist.redis_checks
+
+    filter_only = run_filter(session_ids, args.iterations)
+    redis_every_call = await run_redis(session_ids, args.iterations)
+
+    revoked_session = str(uuid.uuid4())
+    await session_denylist.revoke([revoked_session])
+    denied = await run_denied(credential(revoked_session, 0), args.iterations)
+
+    print(f"iterations: {args.iterations}, distinct tokens: {args.tokens}, revoked sessions: {args.revoked}")
+    print(f"jwt.decode every call          : {uncached * 1e6:8.2f} µs/call")
+    print(f"token cache                    : {cached * 1e6:8.2f} µs/call")
+    print(f"{f'token cache + {args.revoked} revoked':<31}: {with_revocations * 1e6:8.2f} µs/call "
+          f"(filter positives: {positives}, redis checks: {redis_checks})")
+    print(f"denylist filter check only     : {filter_only * 1e6:8.2f} µs/call")
+    print(f"redis check every call         : {redis_every_call * 1e6:8.2f} µs/call")
+    print(f"revoked token (filter + redis) : {denied * 1e6:8.2f} µs/call")
+    print(f"cache stats                    : {access_token_cache.stats()}")
+    print(f"denylist stats                 : {session_denylist.stats()}")
+    await async_redis_client.delete(session_denylist.KEY)
+    await close_redis()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--tokens", type=int, default=100, help="서로 다른 AT 개수 (동시 접속 클라이언트 수)")
+    parser.add_argument("--revoked", type=int, default=10000, help="AT 수명 안에 무효화된 다른 세션 수")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+if __name__ == "__main__":
+    main()
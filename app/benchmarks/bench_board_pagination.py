@@ -0,0 +1,64 @@
+"""게시판 목록 깊은 페이지 조회 벤치마크 (OFFSET vs keyset)
+
+게시판 수를 늘려가며 전체의 80% 지점 페이지를 조회하는 시간을 비교한다.
+
+실행: python -m benchmarks.bench_board_pagination [--sizes 10000 50000 200000] (DB 기본값은 benchmarks/common.py)
+"""
+import argparse
+import asyncio
+import random
+import time
+from sqlalchemy.orm import Session
+from benchmarks.common import parse_args, reset_database, insert_users, insert_boards
+from infra.database import engine
+from repositories.board_repository import board_repository
+
+USERS = 1000
+PAGE_SIZE = 20
+
+def seed(boards: int):
+    reset_database()
+    rng = random.Random(boards)
+    with engine.begin() as conn:
+        user_ids = insert_users(conn, USERS)
+        insert_boards(conn, [int(rng.paretovariate(1.2)) for _ in range(boards)], user_ids, rng, private_ratio=0.1)
+
+async def timed(coro_factory, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await coro_factory()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+async def measure(engine, user_id: int, boards: int, repeat: int) -> dict:
+    with Session(engine) as db:
+        # 80% 지점 바로 앞 페이지의 마지막 게시판을 cursor로 사용
+        offset = int(boards * 0.8) // PAGE_SIZE * PAGE_SIZE
+        previous = await board_repository.get_accessible_boards_by_offset(db, user_id, PAGE_SIZE, offset - 1)
+        cursor = previous[0]
+
+        by_offset = await board_repository.get_accessible_boards_by_offset(db, user_id, PAGE_SIZE, offset)
+        by_keyset = await board_repository.get_accessible_boards(db, user_id, PAGE_SIZE, cursor.post_count, cursor.id)
+        assert [b.id for b in by_offset] == [b.id for b in by_keyset], "keyset page differs from offset page"
+
+        return {
+            "offset": offset,
+            "offset_ms": await timed(lambda: board_repository.get_accessible_boards_by_offset(db, user_id, PAGE_SIZE, offset), repeat) * 1000,
+            "keyset_ms": await timed(lambda: board_repository.get_accessible_boards(db, user_id, PAGE_SIZE, cursor.post_count, cursor.id), repeat) * 1000,
+        }
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000, 200000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parse_args(parser)
+
+    print(f"{'boards':>8} {'offset':>8} {'OFFSET ms':>10} {'keyset ms':>10}")
+    for boards in args.sizes:
+        seed(boards)
+        result = asyncio.run(measure(engine, 1, boards, args.repeat))
+        print(f"{boards:>8} {result['offset']:>8} {result['offset_ms']:>10.2f} {result['keyset_ms']:>10.2f}")
+
+if __name__ == "__main__":
+    main()
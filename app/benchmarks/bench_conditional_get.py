@@ -0,0 +1,86 @@
+"""조건부 GET 벤치마크 (전체 응답 vs If-None-Match 일치 시 304)
+
+게시글 상세, 게시판 상세, 게시글 목록(Redis 페이지 캐시 / SQL)을 폴링하는 클라이언트를 가정하고
+같은 요청을 If-None-Match 없이 보낼 때와 직전 ETag를 붙여 보낼 때의 처리량을 비교한다.
+마지막에 게시글을 수정해서 이전 ETag로는 304가 아닌 200이 오는지 확인한다.
+
+실행: python -m benchmarks.bench_conditional_get [--iterations 500] (DB/Redis 기본값은 benchmarks/common.py)
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+import httpx
+from sqlalchemy import insert
+from benchmarks.common import parse_args, reset_database, insert_users, insert_boards
+from entities import Post
+from infra.database import engine, dispose_engines
+from infra.redis_client import close_redis
+from lib.auth import create_access_token
+from main import app
+
+POSTS = 1000
+CREATED = datetime(2024, 1, 1)
+
+def seed():
+    reset_database()
+    rng = random.Random(0)
+    with engine.begin() as conn:
+        insert_boards(conn, [POSTS], insert_users(conn, 1))
+        conn.execute(insert(Post), [
+            {"title": f"게시글 {i}", "content": "본문 " * rng.randint(100, 1000), "board_id": 1, "author_id": 1, "created_at": CREATED + timedelta(seconds=i)}
+            for i in range(POSTS)
+        ])
+
+async def throughput(client: httpx.AsyncClient, url: str, headers: dict, expected: int, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        response = await client.get(url, headers=headers)
+        assert response.status_code == expected, (url, response.status_code)
+    return iterations / (time.perf_counter() - started)
+
+async def main_async(args):
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': '1', 'sid': str(uuid.uuid4())})}"}
+    # cursor를 최신 window 밖으로 두면 페이지 캐시 대신 SQL 경로
+    cursor_time = (CREATED + timedelta(seconds=POSTS // 2)).isoformat()
+    endpoints = {
+        "post detail": f"/posts/{POSTS // 2}",
+        "board detail": "/boards/1",
+        "posts (page cache)": "/boards/1/posts?limit=20",
+        "posts (SQL)": f"/boards/1/posts?limit=20&cursor_time={cursor_time}&cursor_id={POSTS // 2 + 1}",
+    }
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        print(f"{'endpoint':<20} {'body':>9}  {'200 req/s':>10}  {'304 req/s':>10}")
+        for name, url in endpoints.items():
+            # warm-up: 첫 요청이 페이지 캐시를 채우면서 게시판 쓰기 버전이 생기므로 ETag는 두 번째 응답 기준
+            await client.get(url, headers=headers)
+            first = await client.get(url, headers=headers)
+            etag = first.headers["etag"]
+            full = await throughput(client, url, headers, 200, args.iterations)
+            cached = await throughput(client, url, {**headers, "If-None-Match": etag}, 304, args.iterations)
+            print(f"{name:<20} {len(first.content):>8}B  {full:>10.0f}  {cached:>10.0f}  (x{cached / full:.1f})")
+
+        # 수정 후에는 이전 ETag로 304가 나오면 안 됨
+        post_url = endpoints["post detail"]
+        stale = {**headers, "If-None-Match": (await client.get(post_url, headers=headers)).headers["etag"]}
+        list_url = endpoints["posts (page cache)"]
+        stale_list = {**headers, "If-None-Match": (await client.get(list_url, headers=headers)).headers["etag"]}
+        await client.put(post_url, json={"title": "수정", "content": "수정된 본문"}, headers=headers)
+        after = [(await client.get(url, headers=h)).status_code for url, h in ((post_url, stale), (list_url, stale_list))]
+        print(f"after edit with previous ETag: post detail {after[0]}, posts list {after[1]}")
+    await close_redis()
+    await dispose_engines()
+    if after != [200, 200]:
+        raise SystemExit("stale ETag answered with 304")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parse_args(parser)
+    seed()
+    asyncio.run(main_async(args))
+
+if __name__ == "__main__":
+    main()
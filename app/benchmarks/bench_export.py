@@ -0,0 +1,108 @@
+"""게시판 내보내기(NDJSON 스트리밍) 메모리/처리량 벤치마크
+
+게시판 크기를 늘려가며 GET /boards/{board_id}/posts/export 응답을 끝까지 읽으면서
+- tracemalloc 최대 할당량 (스트리밍: fetch batch 하나 분량, 게시판 크기와 무관해야 함)
+- 같은 게시판을 한 번에 읽어서 직렬화했을 때의 최대 할당량 (비교용)
+- 초당 내보낸 게시글 수
+를 비교한다. httpx ASGITransport는 응답 본문을 모아서 반환하므로 ASGI 앱을 직접 호출하고 받은 chunk는 바로 버린다.
+
+실행: python -m benchmarks.bench_export [--sizes 2000,10000,40000] (DB/Redis 기본값은 benchmarks/common.py)
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+from sqlalchemy import insert
+from benchmarks.common import parse_args, reset_database, insert_users, insert_boards
+from entities import Post
+from infra.database import engine, open_session, dispose_engines
+from infra.redis_client import close_redis
+from lib.auth import create_access_token
+from main import app
+from repositories.post_repository import post_repository, POST_EXPORT_BATCH_SIZE
+from services.post_service import post_service
+
+CREATED = datetime(2024, 1, 1)
+CONTENT = "내보내기 벤치마크 본문 " * 80  # 약 1KB
+
+def seed(sizes: list):
+    reset_database()
+    with engine.begin() as conn:
+        insert_boards(conn, sizes, insert_users(conn, 1))
+        for board_id, size in enumerate(sizes, start=1):
+            conn.execute(insert(Post), [
+                {"title": f"게시글 {i}", "content": CONTENT, "board_id": board_id, "author_id": 1, "created_at": CREATED + timedelta(seconds=i)}
+                for i in range(size)
+            ])
+
+async def stream_export(board_id: int, token: str) -> tuple:
+    """ASGI 앱을 직접 호출해서 NDJSON 줄 수와 바이트 수만 세고 chunk는 버림"""
+    counted = {"requested": False, "status": None, "lines": 0, "size": 0}
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": f"/boards/{board_id}/posts/export", "raw_path": f"/boards/{board_id}/posts/export".encode(),
+        "query_string": b"", "root_path": "", "headers": [(b"host", b"bench"), (b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 0), "server": ("bench", 80),
+    }
+    finished = asyncio.Event()
+    
+    async def receive():
+        if not counted["requested"]:
+            counted["requested"] = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+    
+    async def send(message):
+        if message["type"] == "http.response.start":
+            counted["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            counted["lines"] += message.get("body", b"").count(b"\n")
+            counted["size"] += len(message.get("body", b""))
+            if not message.get("more_body", False):
+                finished.set()
+    
+    await app(scope, receive, send)
+    assert counted["status"] == 200, counted["status"]
+    return counted["lines"], counted["size"]
+
+async def load_all(board_id: int) -> int:
+    """비교용: 게시판 전체를 한 번에 읽어서 한 번에 직렬화"""
+    async with open_session() as db:
+        posts = await post_repository._select_posts_by_board(db, board_id, None, None, None)
+    return len(post_service.posts_to_ndjson(posts))
+
+async def measure(run) -> tuple:
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = await run()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1024 / 1024
+
+async def main_async(sizes: list):
+    token = create_access_token({"sub": "1", "sid": str(uuid.uuid4())})
+    await stream_export(1, token)  # warm-up (쿼리 컴파일, 캐시)
+    print(f"{'posts':>8} {'NDJSON':>10}  {'stream peak':>11}  {'load-all peak':>13}  {'stream posts/s':>14}")
+    for board_id, size in enumerate(sizes, start=1):
+        (lines, body), elapsed, stream_peak = await measure(lambda: stream_export(board_id, token))
+        assert lines == size, (lines, size)
+        _, _, load_peak = await measure(lambda: load_all(board_id))
+        print(f"{size:>8} {body / 1024 / 1024:>8.1f}MB  {stream_peak:>9.1f}MB  {load_peak:>11.1f}MB  {size / elapsed:>14.0f}")
+    await close_redis()
+    await dispose_engines()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="2000,10000,40000", help="게시판별 게시글 수 (쉼표로 구분)")
+    args = parse_args(parser)
+    sizes = [int(size) for size in args.sizes.split(",")]
+    seed(sizes)
+    print(f"batch size: {POST_EXPORT_BATCH_SIZE}")
+    asyncio.run(main_async(sizes))
+
+if __name__ == "__main__":
+    main()
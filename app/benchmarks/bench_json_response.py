@@ -0,0 +1,100 @@
+"""목록 API 응답 직렬화 벤치마크 (FastAPI 기본 경로 vs fast_json 라우터)
+
+같은 라우터를 기본 경로로 등록한 앱과 fast_json()으로 등록한 앱에 같은 요청을 보내서
+응답 본문이 바이트 단위로 같은지 확인하고 요청당 CPU 시간을 비교한다. (ASGI 앱을 프로세스 안에서 직접 호출)
+
+실행: python -m benchmarks.bench_json_response [--page-size 100] [--iterations 300] (DB/Redis 기본값은 benchmarks/common.py)
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import insert
+from benchmarks.common import parse_args, reset_database, insert_users, insert_boards
+from entities import Post
+from infra.database import engine, dispose_engines
+from infra.redis_client import close_redis
+from lib.auth import create_access_token
+from lib.fast_json import fast_json, FAST_JSON_RESPONSES
+from routers import board_router, post_router
+
+USERS = 100
+BOARDS = 2000
+POSTS = 1000
+CREATED = datetime(2024, 1, 1)
+
+def seed():
+    reset_database()
+    rng = random.Random(0)
+    with engine.begin() as conn:
+        user_ids = insert_users(conn, USERS)
+        # 이름에 한글을 넣어서 non-ASCII 문자열 직렬화도 측정
+        insert_boards(conn, [int(rng.paretovariate(1.2)) for _ in range(BOARDS)], user_ids, rng, private_ratio=0.1, prefix="게시판")
+        conn.execute(insert(Post), [
+            {"title": f"게시글 {i}", "content": "긴 본문 \"인용\"\n" * rng.randint(50, 300), "board_id": 1, "author_id": rng.randint(1, USERS), "created_at": CREATED + timedelta(seconds=i)}
+            for i in range(POSTS)
+        ])
+
+def build_app(fast: bool) -> FastAPI:
+    app = FastAPI()
+    for router in (board_router.router, post_router.router):
+        app.include_router(fast_json(router) if fast else router)
+    return app
+
+async def measure(client: httpx.AsyncClient, url: str, headers: dict, iterations: int) -> dict:
+    body = (await client.get(url, headers=headers)).content  # warm-up (캐시 채우기, 쿼리 컴파일)
+    cpu = []
+    for _ in range(iterations):
+        started = time.process_time()
+        response = await client.get(url, headers=headers)
+        cpu.append((time.process_time() - started) * 1000)
+        assert response.status_code == 200, response.text
+    return {"body": body, "cpu_ms": statistics.median(cpu)}
+
+async def main_async(args):
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': '1', 'sid': str(uuid.uuid4())})}"}
+    # cursor를 최신 window(POST_PAGE_CACHE_SIZE) 밖으로 두면 Redis 캐시 대신 SQL 경로로 조회됨
+    cursor_time = (CREATED + timedelta(seconds=POSTS // 2)).isoformat()
+    endpoints = {
+        "posts (page cache)": f"/boards/1/posts?limit={args.page_size}",
+        "posts (SQL)": f"/boards/1/posts?limit={args.page_size}&cursor_time={cursor_time}&cursor_id={POSTS // 2 + 1}",
+        "boards": f"/boards/?limit={args.page_size}",
+    }
+    clients = {
+        name: httpx.AsyncClient(transport=httpx.ASGITransport(app=build_app(fast)), base_url="http://bench")
+        for name, fast in (("default", False), ("fast", True))
+    }
+    failed = False
+    for endpoint, url in endpoints.items():
+        default = await measure(clients["default"], url, headers, args.iterations)
+        fast = await measure(clients["fast"], url, headers, args.iterations)
+        identical = default["body"] == fast["body"]
+        failed |= not identical
+        print(f"{endpoint:<18} {len(default['body']):>8} bytes  default {default['cpu_ms']:7.3f} ms CPU/req  "
+              f"fast {fast['cpu_ms']:7.3f} ms CPU/req ({fast['cpu_ms'] / default['cpu_ms'] * 100:.0f}%)  "
+              f"byte-identical: {identical}")
+    for client in clients.values():
+        await client.aclose()
+    await close_redis()
+    await dispose_engines()
+    if failed:
+        raise SystemExit("responses differ")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=300)
+    args = parse_args(parser)
+    if not FAST_JSON_RESPONSES:
+        raise SystemExit("FAST_JSON_RESPONSES=false, nothing to compare")
+    seed()
+    print(f"page size: {args.page_size}, iterations: {args.iterations}")
+    asyncio.run(main_async(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""목록 조회 페이지당 CPU/메모리 벤치마크 (ORM 인스턴스 조회 vs 응답 컬럼만 Row로 조회)
+
+게시글 목록(SQL 경로)과 게시판 keyset 목록을 각각 조회해서 응답 JSON까지 만드는 비용을 비교한다.
+- CPU: 페이지당 process_time (DB 드라이버 포함, 같은 프로세스의 SQLite라 I/O 대기 없음)
+- 메모리: 페이지당 tracemalloc 최대 할당량 (조회 결과 + 직렬화)
+
+실행: python -m benchmarks.bench_list_projection [--page-size 100] [--iterations 300] (DB 기본값은 benchmarks/common.py)
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from sqlalchemy import insert, select, desc, and_, union_all
+from sqlalchemy.orm import aliased
+from benchmarks.common import parse_args, reset_database, insert_users, insert_boards
+from entities import Board, Post
+from infra.database import engine, open_session, db_scalars, dispose_engines
+from repositories.board_repository import board_repository
+from repositories.post_repository import post_repository
+from schemas.board import BoardResponse
+from schemas.post import PostListResponse
+
+USERS = 100
+BOARDS = 2000
+POSTS = 5000
+
+def seed():
+    reset_database()
+    rng = random.Random(0)
+    created = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        user_ids = insert_users(conn, USERS)
+        insert_boards(conn, [int(rng.paretovariate(1.2)) for _ in range(BOARDS)], user_ids, rng, private_ratio=0.1)
+        conn.execute(insert(Post), [
+            {"title": f"post {i}", "content": "본문 " * rng.randint(20, 200), "board_id": 1, "author_id": rng.randint(1, USERS), "created_at": created + timedelta(seconds=i)}
+            for i in range(POSTS)
+        ])
+
+async def orm_posts(db, page_size: int) -> list:
+    """변경 전 경로: select(Post)로 ORM 인스턴스 조회"""
+    return await db_scalars(db, select(Post).where(Post.board_id == 1)
+        .order_by(Post.created_at.desc(), Post.id.desc()).limit(page_size))
+
+async def orm_boards(db, page_size: int) -> list:
+    """변경 전 경로: aliased(Board, UNION ALL)로 ORM 인스턴스 조회"""
+    public_q = select(Board).where(and_(Board.public.is_(True), Board.owner_id != 1))
+    mine_q = select(Board).where(Board.owner_id == 1)
+    streams = [select(q.order_by(desc(Board.post_count), Board.id).limit(page_size).subquery()) for q in (public_q, mine_q)]
+    accessible = aliased(Board, union_all(*streams).subquery())
+    return await db_scalars(db, select(accessible).order_by(desc(accessible.post_count), accessible.id).limit(page_size))
+
+def render_posts(posts: list) -> str:
+    return PostListResponse.model_validate({"posts": posts}, from_attributes=True).model_dump_json()
+
+def render_boards(boards: list) -> str:
+    return "[" + ",".join(BoardResponse.model_validate(board).model_dump_json() for board in boards) + "]"
+
+async def page(fetch, render) -> str:
+    # 요청마다 새 세션 (identity map이 요청 사이에 재사용되지 않도록)
+    async with open_session() as db:
+        return render(await fetch(db))
+
+async def measure(fetch, render, iterations: int) -> dict:
+    body = await page(fetch, render)  # warm-up (쿼리 컴파일 캐시)
+    cpu = []
+    for _ in range(iterations):
+        started = time.process_time()
+        await page(fetch, render)
+        cpu.append((time.process_time() - started) * 1000)
+
+    peaks = []
+    for _ in range(min(iterations, 30)):
+        tracemalloc.start()
+        await page(fetch, render)
+        peaks.append(tracemalloc.get_traced_memory()[1] / 1024)
+        tracemalloc.stop()
+    return {"body": body, "cpu_ms": statistics.median(cpu), "peak_kib": statistics.median(peaks)}
+
+def report(name: str, orm: dict, core: dict):
+    if orm["body"] != core["body"]:
+        raise SystemExit(f"{name}: responses differ")
+    print(f"{name:<6} ORM  : {orm['cpu_ms']:7.3f} ms CPU/page, peak {orm['peak_kib']:8.1f} KiB/page")
+    print(f"{name:<6} Core : {core['cpu_ms']:7.3f} ms CPU/page, peak {core['peak_kib']:8.1f} KiB/page "
+          f"(CPU {core['cpu_ms'] / orm['cpu_ms'] * 100:.0f}%, memory {core['peak_kib'] / orm['peak_kib'] * 100:.0f}%)")
+
+async def main_async(args):
+    size = args.page_size
+    report(
+        "posts",
+        await measure(lambda db: orm_posts(db, size), render_posts, args.iterations),
+        await measure(lambda db: post_repository._select_posts_by_board(db, 1, None, None, size), render_posts, args.iterations),
+    )
+    report(
+        "boards",
+        await measure(lambda db: orm_boards(db, size), render_boards, args.iterations),
+        await measure(lambda db: board_repository.get_accessible_boards(db, 1, size), render_boards, args.iterations),
+    )
+    await dispose_engines()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=300)
+    args = parse_args(parser)
+    seed()
+    print(f"page size: {args.page_size}, iterations: {args.iterations}")
+    asyncio.run(main_async(args))
+
+if __name__ == "__main__":
+    main()
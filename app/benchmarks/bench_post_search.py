@@ -0,0 +1,85 @@
+"""게시글 검색 벤치마크 (전문 검색 인덱스 vs LIKE '%단어%' 전체 스캔)
+
+여러 게시판에 무작위 단어로 만든 게시글을 넣고, 같은 검색어(모든 단어 포함, 관련도/최신순 상위 limit개)를
+- post_search.search (PostgreSQL GIN / SQLite FTS5)
+- 제목/본문 LIKE '%단어%' AND ... (인덱스를 쓸 수 없어 posts 전체 스캔, 정렬은 최신순)
+로 조회한 시간을 비교한다. 검색어는 흔한 단어/드문 단어/두 단어 조합으로 나눠서 측정한다.
+
+실행: python -m benchmarks.bench_post_search [--posts 100000] [--iterations 50] (DB/Redis 기본값은 benchmarks/common.py)
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import insert, select, and_, or_
+from benchmarks.common import parse_args, reset_database, insert_users, insert_boards
+from entities import Post
+from infra.database import engine, open_session, dispose_engines, db_execute
+from repositories.post_repository import posts_table, POST_SUMMARY_COLUMNS
+from repositories.post_search import post_search
+
+BOARDS = 50
+CREATED = datetime(2024, 1, 1)
+# 같은 길이의 세 음절 단어 (서로의 접두어가 되지 않음), Zipf 분포로 뽑아서 흔한 단어와 드문 단어가 섞이도록 함
+SYLLABLES = "가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초코토포호"
+VOCABULARY = random.Random(1).sample([a + b + c for a in SYLLABLES for b in SYLLABLES for c in SYLLABLES], 5000)
+QUERIES = {
+    "common": [VOCABULARY[0]],
+    "rare": [VOCABULARY[3000]],
+    "two terms": [VOCABULARY[5], VOCABULARY[40]],
+}
+
+def seed(posts: int):
+    reset_database()
+    rng = random.Random(0)
+    weights = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+    with engine.begin() as conn:
+        insert_boards(conn, [0] * BOARDS, insert_users(conn, 1))
+        for start in range(0, posts, 10000):
+            conn.execute(insert(Post), [
+                {
+                    "title": " ".join(rng.choices(VOCABULARY, weights, k=5)),
+                    "content": " ".join(rng.choices(VOCABULARY, weights, k=rng.randint(20, 200))),
+                    "board_id": rng.randint(1, BOARDS), "author_id": 1, "created_at": CREATED + timedelta(seconds=i),
+                }
+                for i in range(start, min(posts, start + 10000))
+            ])
+
+async def like_search(db, terms: list, limit: int) -> list:
+    conditions = [or_(posts_table.c.title.like(f"%{term}%"), posts_table.c.content.like(f"%{term}%")) for term in terms]
+    query = select(*POST_SUMMARY_COLUMNS).where(and_(*conditions)).order_by(posts_table.c.created_at.desc(), posts_table.c.id.desc()).limit(limit)
+    return list(await db_execute(db, query))
+
+async def timed(run, iterations: int) -> tuple:
+    elapsed = []
+    rows = 0
+    for _ in range(iterations):
+        started = time.perf_counter()
+        rows = len(await run())
+        elapsed.append((time.perf_counter() - started) * 1000)
+    return statistics.median(elapsed), rows
+
+async def main_async(args):
+    async with open_session() as db:
+        print(f"{'query':<10} {'FTS ms':>9} {'LIKE ms':>9}  {'rows':>5}")
+        for name, terms in QUERIES.items():
+            fts_ms, rows = await timed(lambda: post_search.search(db, " ".join(terms), 1, limit=args.limit), args.iterations)
+            like_ms, _ = await timed(lambda: like_search(db, terms, args.limit), args.iterations)
+            print(f"{name:<10} {fts_ms:>9.2f} {like_ms:>9.2f}  {rows:>5}  (x{like_ms / fts_ms:.1f})")
+    await dispose_engines()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=100000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parse_args(parser)
+    started = time.perf_counter()
+    seed(args.posts)
+    print(f"posts: {args.posts}, boards: {BOARDS}, seeded in {time.perf_counter() - started:.1f}s")
+    asyncio.run(main_async(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""게시글 목록 페이지당 바이트 비교 (view=full vs view=summary)
+
+본문 길이가 로그 정규 분포(중앙값 --median-chars자, 긴 꼬리)인 게시판을 처음부터 끝까지 넘기면서
+- DB에서 읽은 텍스트 컬럼 바이트 (UTF-8 기준, title + content 또는 title + excerpt)
+- 응답 본문 바이트
+- 페이지당 조회 + 직렬화 시간
+을 비교한다.
+
+실행: python -m benchmarks.bench_post_summary [--posts 5000] [--page-size 20] (DB/Redis 기본값은 benchmarks/common.py)
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import insert
+from benchmarks.common import parse_args, reset_database, insert_users, insert_boards
+from entities import Post
+from infra.database import engine, open_session, dispose_engines
+from repositories.post_repository import post_repository, POST_EXCERPT_LENGTH
+from schemas.post import PostListResponse, PostSummaryListResponse
+
+WORDS = ["게시판", "오늘", "질문", "답변", "감사합니다", "FastAPI", "Redis", "확인", "문제", "해결", "코드", "예시", "\n"]
+MAX_CHARS = 50000
+
+def body(rng: random.Random, chars: int) -> str:
+    words = []
+    length = 0
+    while length < chars:
+        word = rng.choice(WORDS)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)[:chars]
+
+def seed(posts: int, median_chars: int) -> list:
+    reset_database()
+    rng = random.Random(0)
+    created = datetime(2024, 1, 1)
+    lengths = [min(MAX_CHARS, max(10, int(rng.lognormvariate(0, 1.0) * median_chars))) for _ in range(posts)]
+    with engine.begin() as conn:
+        insert_boards(conn, [posts], insert_users(conn, 1))
+        conn.execute(insert(Post), [
+            {"title": f"게시글 제목 {i}", "content": body(rng, length), "board_id": 1, "author_id": 1, "created_at": created + timedelta(seconds=i)}
+            for i, length in enumerate(lengths)
+        ])
+    return lengths
+
+def text_bytes(record) -> int:
+    text = record.content if hasattr(record, "content") else record.excerpt
+    return len(record.title.encode()) + len(text.encode())
+
+async def walk(fetch, response_model, page_size: int) -> dict:
+    """게시판 전체를 cursor로 넘기면서 페이지별 바이트/시간 기록"""
+    db_bytes, response_bytes, elapsed = [], [], []
+    cursor_time = cursor_id = None
+    while True:
+        started = time.perf_counter()
+        async with open_session() as db:
+            posts = await fetch(db, 1, cursor_time, cursor_id, page_size)
+        payload = response_model.model_validate({"posts": posts}, from_attributes=True).model_dump_json()
+        elapsed.append((time.perf_counter() - started) * 1000)
+        if not posts:
+            break
+        db_bytes.append(sum(text_bytes(post) for post in posts))
+        response_bytes.append(len(payload.encode()))
+        cursor_time, cursor_id = posts[-1].created_at, posts[-1].id
+    return {
+        "pages": len(db_bytes),
+        "db_kib": statistics.mean(db_bytes) / 1024,
+        "response_kib": statistics.mean(response_bytes) / 1024,
+        "response_p95_kib": sorted(response_bytes)[int(len(response_bytes) * 0.95)] / 1024,
+        "ms": statistics.median(elapsed),
+    }
+
+async def main_async(args):
+    full = await walk(post_repository._select_posts_by_board, PostListResponse, args.page_size)
+    summary = await walk(post_repository.get_post_summaries_by_board, PostSummaryListResponse, args.page_size)
+    for name, result in (("full", full), ("summary", summary)):
+        print(f"{name:<8} DB text {result['db_kib']:8.1f} KiB/page  response {result['response_kib']:8.1f} KiB/page "
+              f"(p95 {result['response_p95_kib']:8.1f})  {result['ms']:6.2f} ms/page")
+    print(f"summary / full: DB text {summary['db_kib'] / full['db_kib'] * 100:.1f}%, "
+          f"response {summary['response_kib'] / full['response_kib'] * 100:.1f}%")
+    await dispose_engines()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=5000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--median-chars", type=int, default=800, help="본문 길이 중앙값 (문자 수)")
+    args = parse_args(parser)
+    lengths = seed(args.posts, args.median_chars)
+    print(f"posts: {args.posts}, page size: {args.page_size}, excerpt: {POST_EXCERPT_LENGTH} chars, "
+          f"content chars median {int(statistics.median(lengths))} / mean {int(statistics.mean(lengths))} / max {max(lengths)}")
+    asyncio.run(main_async(args))
+
+if __name__ == "__main__":
+    main()
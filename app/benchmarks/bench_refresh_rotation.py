@@ -0,0 +1,133 @@
+"""RT 갱신 동시성 테스트 + 지연 시간 비교 (기존 SELECT 후 UPDATE 경로 vs 조건부 UPDATE ... RETURNING)
+
+1. 같은 RT로 동시에 여러 번 갱신했을 때 새 RT가 몇 번 발급되는지 (한 번이어야 함)
+2. 교체된 RT를 다시 사용하면 세션이 무효화되는지
+3. 갱신 한 번의 지연 시간
+
+실행: python -m benchmarks.bench_refresh_rotation (DB 기본값은 benchmarks/common.py)
+"""
+import argparse
+import asyncio
+import hashlib
+import logging
+import statistics
+import time
+from datetime import datetime, timedelta
+from fastapi import HTTPException
+from sqlalchemy import and_, insert, select, update
+from benchmarks.common import parse_args, reset_database, insert_users
+from entities.session import Session as SessionModel
+from infra.database import engine, open_session, db_execute, db_scalar, db_commit, dispose_engines
+from lib.auth import create_refresh_token, REFRESH_TOKEN_EXPIRE_SECONDS
+from services.auth_service import auth_service
+
+def token_hash(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+def seed(sessions: int) -> list:
+    reset_database()
+    tokens = [create_refresh_token() for _ in range(sessions)]
+    expires_at = datetime.now() + timedelta(days=7)
+    with engine.begin() as conn:
+        user_id = insert_users(conn, 1)[0]
+        conn.execute(insert(SessionModel), [
+            {"user_id": user_id, "device_name": "bench", "ip_address": "127.0.0.1", "refresh_token_hash": token_hash(token), "expires_at": expires_at}
+            for token in tokens
+        ])
+    return tokens
+
+async def legacy_refresh(refresh_token: str) -> bool:
+    """변경 전 경로: RT로 세션 조회 → id로 UPDATE (두 번 왕복, 조회와 갱신 사이 경쟁 구간 존재)"""
+    async with open_session() as db:
+        session = await db_scalar(db, select(SessionModel).where(
+            and_(
+                SessionModel.refresh_token_hash == token_hash(refresh_token),
+                SessionModel.revoked_at.is_(None),
+                SessionModel.expires_at > datetime.now()
+            )
+        ))
+        if not session:
+            return False
+        await db_execute(db, update(SessionModel).where(SessionModel.id == session.id).values(
+            refresh_token_hash=token_hash(create_refresh_token()),
+            last_seen_at=datetime.now(),
+            expires_at=datetime.now() + timedelta(seconds=REFRESH_TOKEN_EXPIRE_SECONDS)
+        ))
+        await db_commit(db)
+        return True
+
+async def rotate_refresh(refresh_token: str) -> bool:
+    async with open_session() as db:
+        try:
+            await auth_service.refresh_access_token(db, refresh_token)
+            return True
+        except HTTPException:
+            return False
+
+async def concurrency(name: str, refresh, tokens: list, concurrency: int):
+    issued = []
+    for token in tokens:
+        results = await asyncio.gather(*[refresh(token) for _ in range(concurrency)])
+        issued.append(sum(results))
+    double = sum(1 for count in issued if count > 1)
+    print(f"{name:<8} concurrency: {len(tokens)} tokens x {concurrency} requests, "
+          f"new RT issued per token max {max(issued)}, tokens issued more than once: {double}")
+    return double
+
+async def reuse_detection(token: str) -> bool:
+    async with open_session() as db:
+        new_token = (await auth_service.refresh_access_token(db, token))["refresh_token"]
+    reused = await rotate_refresh(token)  # 이미 교체된 RT 재사용 → 거절 + 세션 무효화
+    still_valid = await rotate_refresh(new_token)  # 재사용 감지 후에는 새 RT도 거절
+    async with open_session() as db:
+        reason = await db_scalar(db, select(SessionModel.revocation_reason).where(SessionModel.refresh_token_hash == token_hash(new_token)))
+    ok = not reused and not still_valid and reason == "refresh_token_reuse"
+    print(f"reuse detection: old RT rejected={not reused}, new RT rejected={not still_valid}, revocation_reason={reason} -> {'ok' if ok else 'FAILED'}")
+    return ok
+
+async def latency(refresh, tokens: list) -> list:
+    samples = []
+    for token in tokens:
+        started = time.perf_counter()
+        await refresh(token)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+def report(name: str, samples: list):
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"{name:<8} latency: mean {statistics.mean(samples):.3f} ms, p50 {statistics.median(samples):.3f} ms, p95 {p95:.3f} ms")
+
+async def main_async(args, tokens: list):
+    # 세션마다 한 번씩만 사용 (같은 RT를 두 번 쓰면 재사용으로 처리되므로)
+    remaining = iter(tokens)
+    def take(count: int) -> list:
+        return [next(remaining) for _ in range(count)]
+
+    legacy_double = await concurrency("legacy", legacy_refresh, take(args.rounds), args.concurrency)
+    rotate_double = await concurrency("rotate", rotate_refresh, take(args.rounds), args.concurrency)
+    reuse_ok = await reuse_detection(next(remaining))
+
+    report("legacy", await latency(legacy_refresh, take(args.iterations)))
+    report("rotate", await latency(rotate_refresh, take(args.iterations)))
+    await dispose_engines()
+
+    if legacy_double == 0:
+        print("(legacy race not reproduced in this run)")
+    if rotate_double or not reuse_ok:
+        raise SystemExit("refresh rotation check failed")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=50, help="동시성 테스트에 쓸 RT 수")
+    parser.add_argument("--concurrency", type=int, default=8, help="RT 하나로 동시에 보내는 갱신 요청 수")
+    parser.add_argument("--iterations", type=int, default=1000, help="지연 시간 측정 횟수")
+    args = parse_args(parser)
+
+    # 동시 요청 중 진 쪽은 재사용으로 감지되어 경고 로그가 대량으로 나오므로 숨김
+    logging.getLogger("repositories.session_repository").setLevel(logging.ERROR)
+    tokens = seed(args.rounds * 2 + 1 + args.iterations * 2)
+    asyncio.run(main_async(args, tokens))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+"""주요 API 경로 부하 벤치마크 (프로세스 안에서 FastAPI 앱을 띄워 측정, 결과는 JSON 파일)
+
+데이터를 설정한 규모로 넣은 뒤 main.app의 startup을 실행하고 httpx ASGITransport로 요청을 보낸다.
+시나리오마다 warm-up 후 --concurrency개의 클라이언트가 요청을 나눠 보내고 처리량과 p50/p95/p99 지연 시간을 기록한다.
+
+- login: POST /auth/login (bcrypt 검증 포함)
+- refresh: POST /auth/refresh (클라이언트마다 RT를 교체하면서 이어서 사용)
+- boards: GET /boards/ 첫 페이지
+- posts: GET /boards/{id}/posts 첫 페이지 (게시글 수에 비례해서 게시판 선택)
+- posts_cursor: GET /boards/{id}/posts?cursor_time=&cursor_id= (임의 위치, 대부분 페이지 캐시 밖)
+- create_post: POST /boards/{id}/posts
+
+실행: python -m benchmarks.bench_suite [--posts 20000] [--requests 500] [--concurrency 8] [--output bench.json] [--compare previous.json]
+기본값은 SQLite 파일(./bench_suite.db) + fakeredis이고 DATABASE_URL로 로컬 PostgreSQL도 지정할 수 있다 (--allow-drop 필요, benchmarks/common.py).
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timedelta, timezone
+import httpx
+from sqlalchemy import func, insert, select
+from benchmarks.common import parse_args, reset_database, insert_users, insert_boards
+from entities import Post
+from entities.session import Session as SessionModel
+from infra.database import engine, open_session, DB_ASYNC_MODE
+from lib.auth import create_access_token, create_refresh_token, get_password_hash
+from lib.metrics import percentile
+from main import app
+from repositories.board_repository import board_repository
+
+SCENARIOS = ["login", "refresh", "boards", "posts", "posts_cursor", "create_post"]
+PASSWORD = "bench-password"
+CREATED = datetime(2024, 1, 1, tzinfo=timezone.utc)
+PRIVATE_BOARD_RATIO = 0.1
+CURSOR_SAMPLE_SIZE = 2000
+
+def seed(args, rng: random.Random) -> dict:
+    """사용자/게시판/게시글/세션 일괄 입력 (비밀번호 해시는 하나만 만들어서 공유)"""
+    reset_database()
+    hashed_password = get_password_hash(PASSWORD)
+    # 게시판별 게시글 수는 Zipf(s=1) 분포 (소수의 인기 게시판에 집중)
+    weights = [1 / rank for rank in range(1, args.boards + 1)]
+    rng.shuffle(weights)
+    per_board = [0] * args.boards
+    for index in rng.choices(range(args.boards), weights, k=args.posts):
+        per_board[index] += 1
+
+    sessions = []
+    with engine.begin() as conn:
+        user_ids = insert_users(conn, args.users, hashed_password)
+        boards = insert_boards(conn, per_board, user_ids, rng, PRIVATE_BOARD_RATIO)
+        offset = 0
+        rows = []
+        for board in boards:
+            for _ in range(board.post_count):
+                rows.append({
+                    "title": f"게시글 {offset}", "content": "벤치마크 본문 " * rng.randint(10, 100),
+                    "board_id": board.id, "author_id": rng.choice(user_ids), "created_at": CREATED + timedelta(seconds=offset),
+                })
+                offset += 1
+            if len(rows) >= 10000:
+                conn.execute(insert(Post), rows)
+                rows = []
+        if rows:
+            conn.execute(insert(Post), rows)
+
+        expires_at = datetime.now(timezone.utc) + timedelta(days=7)
+        for _ in range(args.sessions):
+            sessions.append({"id": uuid.uuid4(), "user_id": rng.choice(user_ids), "refresh_token": create_refresh_token()})
+        conn.execute(insert(SessionModel), [
+            {
+                "id": session["id"], "user_id": session["user_id"], "device_name": "bench", "ip_address": "127.0.0.1",
+                "refresh_token_hash": hashlib.sha256(session["refresh_token"].encode()).hexdigest(), "expires_at": expires_at,
+            }
+            for session in sessions
+        ])
+
+        public_boards = [board for board in boards if board.public and board.post_count]
+        cursors = list(conn.execute(
+            select(Post.board_id, Post.created_at, Post.id)
+            .where(Post.board_id.in_([board.id for board in public_boards]))
+            .order_by(func.random()).limit(CURSOR_SAMPLE_SIZE)
+        ))
+    return {"user_ids": user_ids, "public_boards": public_boards, "sessions": sessions, "cursors": cursors}
+
+class Scenarios:
+    """시나리오별 요청 생성 (method, url, 요청 옵션, 기대 상태 코드)"""
+
+    def __init__(self, data: dict, rng: random.Random):
+        self.rng = rng
+        self.user_ids = data["user_ids"]
+        self.boards = data["public_boards"]
+        self.board_weights = [board.post_count for board in self.boards]
+        self.cursors = data["cursors"]
+        # AT는 seed한 활성 세션 중 하나의 ID를 담아서 발급 (denylist/활동 기록 경로도 실제와 같게)
+        self.sessions = data["sessions"]
+        self.refresh_tokens = deque(session["refresh_token"] for session in self.sessions)
+
+    def auth_headers(self) -> dict:
+        session = self.rng.choice(self.sessions)
+        token = create_access_token({"sub": str(session["user_id"]), "sid": str(session["id"])})
+        return {"Authorization": f"Bearer {token}"}
+
+    def login(self):
+        user_id = self.rng.choice(self.user_ids)
+        return "POST", "/auth/login", {"json": {"email": f"user{user_id}@bench.example.com", "password": PASSWORD}}, 200
+
+    def refresh(self):
+        # 같은 RT를 두 요청이 동시에 쓰지 않도록 꺼내서 쓰고, 응답의 새 RT를 다시 넣음
+        token = self.refresh_tokens.popleft()
+        return "POST", "/auth/refresh", {"headers": {"Cookie": f"refresh_token={token}"}}, 200
+
+    def after_refresh(self, response: httpx.Response):
+        token = response.cookies.get("refresh_token")
+        if token:
+            self.refresh_tokens.append(token)
+
+    def boards_page(self):
+        return "GET", "/boards/?limit=20", {"headers": self.auth_headers()}, 200
+
+    def posts(self):
+        board = self.rng.choices(self.boards, self.board_weights)[0]
+        return "GET", f"/boards/{board.id}/posts?limit=20", {"headers": self.auth_headers()}, 200
+
+    def posts_cursor(self):
+        board_id, created_at, post_id = self.rng.choice(self.cursors)
+        params = {"limit": 20, "cursor_time": created_at.isoformat(), "cursor_id": post_id}
+        return "GET", f"/boards/{board_id}/posts", {"params": params, "headers": self.auth_headers()}, 200
+
+    def create_post(self):
+        board = self.rng.choices(self.boards, self.board_weights)[0]
+        body = {"title": "벤치마크 새 글", "content": "새 글 본문 " * self.rng.randint(10, 100)}
+        return "POST", f"/boards/{board.id}/posts", {"json": body, "headers": self.auth_headers()}, 200
+
+    def get(self, name: str):
+        return {
+            "login": self.login,
+            "refresh": self.refresh,
+            "boards": self.boards_page,
+            "posts": self.posts,
+            "posts_cursor": self.posts_cursor,
+            "create_post": self.create_post,
+        }[name]
+
+async def run_scenario(client: httpx.AsyncClient, scenarios: Scenarios, name: str, requests: int, warmup: int, concurrency: int) -> dict:
+    make_request = scenarios.get(name)
+    latencies = []
+    errors = {}
+
+    async def phase(count: int, record: bool):
+        remaining = count
+
+        async def worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                method, url, options, expected = make_request()
+                started = time.perf_counter()
+                response = await client.request(method, url, **options)
+                elapsed = time.perf_counter() - started
+                if name == "refresh":
+                    scenarios.after_refresh(response)
+                if not record:
+                    continue
+                latencies.append(elapsed)
+                if response.status_code != expected:
+                    errors[response.status_code] = errors.get(response.status_code, 0) + 1
+
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+
+    # warm-up (캐시 채우기, 쿼리 컴파일)은 통계에서 제외
+    await phase(warmup, record=False)
+    started = time.perf_counter()
+    await phase(requests, record=True)
+    wall = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": {str(status): count for status, count in sorted(errors.items())},
+        "throughput_rps": round(len(latencies) / wall, 1),
+        "mean_ms": round(statistics.mean(latencies) * 1000, 3),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3),
+    }
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"], cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def compare(previous: dict, current: dict, max_regression: float = None) -> bool:
+    """두 결과 파일의 시나리오별 변화율 출력, max_regression(%)을 넘는 악화가 있으면 False"""
+    print(f"\ncompared with {previous['meta'].get('git_revision')} ({previous['meta'].get('started_at')})")
+    print(f"{'scenario':<14} {'rps':>24} {'p50 ms':>24} {'p95 ms':>24} {'p99 ms':>24}")
+    ok = True
+    for name, result in current["scenarios"].items():
+        before = previous["scenarios"].get(name)
+        if before is None:
+            continue
+        cells = []
+        for key, higher_is_better in (("throughput_rps", True), ("p50_ms", False), ("p95_ms", False), ("p99_ms", False)):
+            change = (result[key] - before[key]) / before[key] * 100 if before[key] else 0.0
+            worse = -change if higher_is_better else change
+            if max_regression is not None and key in ("throughput_rps", "p95_ms") and worse > max_regression:
+                ok = False
+            cells.append(f"{before[key]:.1f} → {result[key]:.1f} ({change:+.0f}%)")
+        print(f"{name:<14} " + " ".join(f"{cell:>24}" for cell in cells))
+    return ok
+
+async def main_async(args, data: dict, rng: random.Random) -> dict:
+    await app.router.startup()
+    # 운영 배포처럼 순위 인덱스를 만든 상태에서 측정 (없으면 게시판 목록이 SQL 경로로 동작)
+    async with open_session() as db:
+        await board_repository.rebuild_ranking(db)
+
+    scenarios = Scenarios(data, rng)
+    results = {}
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            for name in args.scenarios:
+                requests = args.login_requests if name == "login" else args.requests
+                warmup = min(args.warmup, requests)
+                results[name] = await run_scenario(client, scenarios, name, requests, warmup, args.concurrency)
+                result = results[name]
+                print(f"{name:<14} {result['throughput_rps']:>9.1f} rps  p50 {result['p50_ms']:>8.2f}  p95 {result['p95_ms']:>8.2f}  "
+                      f"p99 {result['p99_ms']:>8.2f} ms  errors {result['errors'] or 0}")
+    finally:
+        await app.router.shutdown()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--boards", type=int, default=1000)
+    parser.add_argument("--posts", type=int, default=20000, help="전체 게시글 수 (게시판별로 Zipf 분포)")
+    parser.add_argument("--sessions", type=int, default=2000, help="refresh 시나리오와 AT에 쓰는 활성 세션 수")
+    parser.add_argument("--requests", type=int, default=500, help="시나리오별 측정 요청 수")
+    parser.add_argument("--login-requests", type=int, default=40, help="login 측정 요청 수 (bcrypt 때문에 느림)")
+    parser.add_argument("--warmup", type=int, default=20, help="시나리오별 warm-up 요청 수 (통계 제외)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="쉼표로 구분, 기본은 전체")
+    parser.add_argument("--seed", type=int, default=0, help="데이터/요청 난수 시드")
+    parser.add_argument("--output", default="bench_suite.json", help="결과 JSON 파일")
+    parser.add_argument("--compare", help="이전 결과 JSON 파일과 비교")
+    parser.add_argument("--max-regression", type=float, help="비교 시 rps/p95가 이 비율(%%)보다 나빠지면 종료 코드 1")
+    args = parse_args(parser)
+    args.scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    if args.sessions < args.concurrency:
+        parser.error("--sessions must be at least --concurrency")
+
+    rng = random.Random(args.seed)
+    started_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    seed_started = time.perf_counter()
+    data = seed(args, rng)
+    seed_seconds = time.perf_counter() - seed_started
+    print(f"seeded {args.users} users, {args.boards} boards, {args.posts} posts, {args.sessions} sessions "
+          f"in {seed_seconds:.1f}s ({engine.dialect.name}, async mode {DB_ASYNC_MODE})")
+
+    results = asyncio.run(main_async(args, data, rng))
+    report = {
+        "meta": {
+            "started_at": started_at,
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": engine.dialect.name,
+            "async_mode": DB_ASYNC_MODE,
+            "seed_seconds": round(seed_seconds, 1),
+            "params": {key: getattr(args, key) for key in (
+                "users", "boards", "posts", "sessions", "requests", "login_requests", "warmup", "concurrency", "seed"
+            )},
+        },
+        "scenarios": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False, sort_keys=True)
+        f.write("\n")
+    print(f"results written to {args.output}")
+
+    failed = any(result["errors"] for result in results.values())
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+        if not compare(previous, report, args.max_regression):
+            print(f"regression over {args.max_regression}%")
+            failed = True
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""벤치마크 공통 준비 (DB/Redis 기본값, 전용 DB 확인, 테이블 초기화, 사용자/게시판 입력)
+
+벤치마크는 모든 테이블을 지우고 다시 만들고 Redis 키도 덮어쓰므로 기본값은
+작업 디렉터리의 SQLite 파일(./<벤치마크 이름>.db) + fakeredis이다.
+DATABASE_URL/REDIS_URL로 SQLite가 아닌 DB나 실제 Redis를 지정하면 --allow-drop을 줘야 실행된다.
+
+환경 변수 기본값을 정하므로 infra.database 등 앱 모듈보다 먼저 import해야 한다.
+"""
+import os
+import sys
+
+_BENCH_NAME = os.path.splitext(os.path.basename(sys.argv[0]))[0] or "bench"
+os.environ.setdefault("DATABASE_URL", f"sqlite:///./{_BENCH_NAME}.db")
+os.environ.setdefault("REDIS_URL", "fakeredis://")
+# 스케줄러 작업이 측정에 섞이지 않도록 끔
+os.environ.setdefault("SCHEDULER_ENABLED", "false")
+
+import argparse
+import random
+from typing import List, Optional, Sequence
+from sqlalchemy import insert, select
+from entities import Base, User, Board
+from entities.session import Session as SessionModel  # noqa: F401 (User.sessions 매퍼 설정용)
+from infra.database import engine
+from infra.redis_client import REDIS_URL
+
+def parse_args(parser: argparse.ArgumentParser) -> argparse.Namespace:
+    """--allow-drop을 추가해서 파싱, 전용 DB/Redis가 아닌데 --allow-drop이 없으면 종료"""
+    parser.add_argument("--allow-drop", action="store_true", help="SQLite/fakeredis가 아니어도 테이블과 Redis 키를 지우고 실행")
+    args = parser.parse_args()
+    targets = []
+    if engine.dialect.name != "sqlite":
+        targets.append(f"{engine.dialect.name} database {engine.url.render_as_string(hide_password=True)}")
+    if not REDIS_URL.startswith("fakeredis://"):
+        targets.append("a real Redis server (REDIS_URL)")
+    if targets and not args.allow_drop:
+        parser.error(f"benchmarks drop all tables and overwrite Redis keys; refusing to run against {' and '.join(targets)} without --allow-drop")
+    return args
+
+def reset_database():
+    """모든 테이블을 지우고 다시 만듦 (parse_args에서 전용 DB인지 확인한 뒤 호출)"""
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+def insert_users(conn, count: int, hashed_password: str = "x") -> List[int]:
+    """사용자 입력 (이메일 user<id>@bench.example.com), id 순 목록 반환 (빈 테이블이면 1..count)"""
+    conn.execute(insert(User), [
+        {"fullname": f"user{i}", "email": f"user{i}@bench.example.com", "hashed_password": hashed_password}
+        for i in range(1, count + 1)
+    ])
+    return list(conn.execute(select(User.id).order_by(User.id)).scalars())
+
+def insert_boards(conn, post_counts: Sequence[int], owner_ids: Sequence[int], rng: Optional[random.Random] = None, private_ratio: float = 0.0, prefix: str = "board") -> list:
+    """post_counts 순서대로 게시판 입력, (id, public, owner_id, post_count) 행을 id 순으로 반환
+
+    rng가 있으면 소유자를 owner_ids에서 고르고 private_ratio만큼 비공개, 없으면 모두 첫 사용자 소유의 공개 게시판
+    """
+    conn.execute(insert(Board), [
+        {
+            "name": f"{prefix}-{i}",
+            "public": rng.random() >= private_ratio if rng else True,
+            "owner_id": rng.choice(owner_ids) if rng else owner_ids[0],
+            "post_count": post_count,
+        }
+        for i, post_count in enumerate(post_counts, start=1)
+    ])
+    return list(conn.execute(select(Board.id, Board.public, Board.owner_id, Board.post_count).order_by(Board.id)))
@@ -0,0 +1,124 @@
+"""post_count 동기화 부하 테스트 (동기화 도중 들어오는 증감량 유실/중복 여부 확인)
+
+여러 작업자가 게시글 수 증감을 계속 기록하는 동안 동기화를 반복 실행하고,
+일부 동기화는 chunk 반영 도중 실패시켜 다음 실행이 이어서 처리하도록 한다.
+끝나면 DB의 post_count와 실제로 기록한 증감량 합계를 비교한다.
+
+실행: python -m benchmarks.load_post_count_sync (DB/Redis 기본값은 benchmarks/common.py)
+"""
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter
+from sqlalchemy import select
+from benchmarks.common import parse_args, reset_database, insert_users, insert_boards
+from entities import Board
+from infra.database import engine, SessionLocal
+from infra.redis_client import async_redis_client, close_redis
+from repositories.board_cache import BoardMeta
+from repositories.board_repository import board_repository
+from repositories.post_count_sync import PostCountSync
+
+class FlakyPostCountSync(PostCountSync):
+    """chunk 반영 중 일정 확률로 실패하는 동기화 (프로세스 중단 흉내)"""
+
+    def __init__(self, chunk_size: int, failure_rate: float, rng: random.Random):
+        super().__init__(chunk_size)
+        self.failure_rate = failure_rate
+        self.rng = rng
+
+    async def _apply_chunk(self, db, chunk):
+        await super()._apply_chunk(db, chunk)
+        if self.rng.random() < self.failure_rate:
+            raise RuntimeError("injected failure")
+
+def seed(boards: int):
+    reset_database()
+    with engine.begin() as conn:
+        insert_boards(conn, [0] * boards, insert_users(conn, 1))
+
+async def writer(metas, expected: Counter, operations: int, rng: random.Random):
+    for _ in range(operations):
+        board = rng.choice(metas)
+        # 기록한 증가량보다 많이 감소시키지 않음 (실제 게시글 삭제와 같은 조건)
+        if expected[board.id] > 0 and rng.random() < 0.3:
+            expected[board.id] -= 1
+            await board_repository.decrement_post_count_delta(board)
+        else:
+            expected[board.id] += 1
+            await board_repository.increment_post_count_delta(board)
+
+async def syncer(sync: PostCountSync, stop: asyncio.Event, stats: Counter):
+    while not stop.is_set():
+        await run_once(sync, stats)
+        await asyncio.sleep(0.01)
+
+async def run_once(sync: PostCountSync, stats: Counter):
+    db = SessionLocal()
+    try:
+        result = await sync.run(db)
+        if result.sync_id is not None:
+            stats["syncs"] += 1
+            stats["boards"] += result.boards
+            stats["resumed_chunks"] += result.skipped_chunks
+            stats["sync_ms"] += int(result.seconds * 1000)
+    except RuntimeError:
+        stats["failures"] += 1
+    finally:
+        db.close()
+
+async def main_async(args):
+    await async_redis_client.delete(PostCountSync.LIVE_KEY, PostCountSync.POINTER_KEY)
+    rng = random.Random(args.seed)
+    sync = FlakyPostCountSync(args.chunk_size, args.failure_rate, rng)
+    metas = [BoardMeta(id=i, name=f"board-{i}", public=True, owner_id=1, post_count=0, created_at=None) for i in range(1, args.boards + 1)]
+
+    expected = Counter()
+    stats = Counter()
+    stop = asyncio.Event()
+    started = time.perf_counter()
+    sync_task = asyncio.create_task(syncer(sync, stop, stats))
+    await asyncio.gather(*[
+        writer(metas, expected, args.operations, random.Random(args.seed + i))
+        for i in range(args.writers)
+    ])
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await sync_task
+
+    # 남은 증감량(실패로 남은 스냅샷 포함)을 모두 반영
+    sync.failure_rate = 0
+    while await async_redis_client.exists(PostCountSync.LIVE_KEY, PostCountSync.POINTER_KEY):
+        await run_once(sync, stats)
+
+    with SessionLocal() as db:
+        actual = dict(db.execute(select(Board.id, Board.post_count)).all())
+    drift = {board_id: (expected[board_id], count) for board_id, count in actual.items() if expected[board_id] != count}
+
+    total_ops = args.writers * args.operations
+    print(f"writers: {args.writers}, operations: {total_ops}, boards: {args.boards}, chunk size: {args.chunk_size}")
+    print(f"write throughput    : {total_ops / elapsed:,.0f} ops/s over {elapsed:.2f}s")
+    print(f"syncs completed     : {stats['syncs']} (injected failures: {stats['failures']}, resumed chunks: {stats['resumed_chunks']})")
+    print(f"boards updated      : {stats['boards']} in {stats['sync_ms']} ms total")
+    print(f"expected posts      : {sum(expected.values())}, in DB: {sum(actual.values())}")
+    print(f"drifted boards      : {len(drift)}")
+    await close_redis()
+    if drift:
+        raise SystemExit(f"post_count drift detected: {list(drift.items())[:10]}")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--boards", type=int, default=2000)
+    parser.add_argument("--writers", type=int, default=20)
+    parser.add_argument("--operations", type=int, default=1000, help="작업자당 증감 횟수")
+    parser.add_argument("--chunk-size", type=int, default=100)
+    parser.add_argument("--failure-rate", type=float, default=0.05, help="chunk 반영 후 실패시킬 확률")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parse_args(parser)
+
+    seed(args.boards)
+    asyncio.run(main_async(args))
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,111 @@
+import asyncio
+import sys
+import time
+from datetime import datetime
+from typing import Optional
 import typer
 from infra.database import SessionLocal
+from infra.redis_client import close_redis
 from repositories.board_repository import board_repository
+from repositories.post_repository import post_repository, POST_EXPORT_BATCH_SIZE
+from services.post_service import post_service
 
 app = typer.Typer()
 
+async def _sync_post_counts(db):
+    try:
+        return await board_repository.update_board_post_counts(db)
+    finally:
+        await close_redis()
+
 @app.command()
 def syncwithredis():
     """Redis 증감량을 읽어서 게시판 post_count 동기화"""
     db = SessionLocal()
     try:
-        deltas = board_repository.get_all_post_count_deltas()
-        if not deltas:
+        result = asyncio.run(_sync_post_counts(db))
+        if result.sync_id is None:
             typer.echo("No post count changes to sync")
             return
-            
-        board_repository.update_board_post_counts(db)
-        typer.echo(f"Successfully synced post counts for {len(deltas)} boards")
+        
+        if result.skipped_chunks:
+            typer.echo(f"Resumed interrupted sync {result.sync_id}: skipped {result.skipped_chunks} already applied chunks")
+        typer.echo(f"Successfully synced post counts for {result.boards} boards in {result.chunks} chunks ({result.seconds:.2f}s)")
         
     except Exception as e:
         typer.echo(f"Error during post count sync: {e}", err=True)
         db.rollback()
         raise typer.Exit(1)
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def _rebuild_ranking(db):
+    try:
+        return await board_repository.rebuild_ranking(db)
+    finally:
+        await close_redis()
+
+@app.command()
+def rebuildranking():
+    """DB 기준으로 Redis 게시판 순위 인덱스 재구성"""
+    db = SessionLocal()
+    try:
+        count = asyncio.run(_rebuild_ranking(db))
+        typer.echo(f"Rebuilt board ranking index with {count} boards")
+    except Exception as e:
+        typer.echo(f"Error during ranking rebuild: {e}", err=True)
+        raise typer.Exit(1)
+    finally:
+        db.close()
+
+async def _export_posts(db, board_id: int, out, cursor_time: Optional[datetime], cursor_id: Optional[int], batch_size: int):
+    try:
+        if await board_repository.get_board_meta(db, board_id) is None:
+            return None
+        count = 0
+        last = None
+        async for posts in post_repository.stream_posts_by_board(db, board_id, cursor_time, cursor_id, batch_size):
+            out.write(post_service.posts_to_ndjson(posts))
+            count += len(posts)
+            last = posts[-1]
+        return count, last
+    finally:
+        await close_redis()
+
+@app.command()
+def export(
+    board_id: int,
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="저장할 파일 (없으면 stdout)"),
+    cursor_time: Optional[str] = typer.Option(None, help="이어받기: 마지막으로 받은 게시글의 created_at (ISO 8601)"),
+    cursor_id: Optional[int] = typer.Option(None, help="이어받기: 마지막으로 받은 게시글의 id"),
+    batch_size: int = typer.Option(POST_EXPORT_BATCH_SIZE, help="한 번에 fetch할 게시글 수"),
+):
+    """게시판의 모든 게시글을 NDJSON으로 내보내기 (GET /boards/{board_id}/posts/export와 같은 형식)"""
+    try:
+        # 응답 JSON의 created_at 그대로 (마이크로초, 타임존 포함)
+        cursor = datetime.fromisoformat(cursor_time) if cursor_time else None
+    except ValueError:
+        raise typer.BadParameter(f"invalid ISO 8601 datetime: {cursor_time}", param_hint="--cursor-time")
+    
+    db = SessionLocal()
+    out = open(output, "wb") if output else sys.stdout.buffer
+    started = time.perf_counter()
+    try:
+        result = asyncio.run(_export_posts(db, board_id, out, cursor, cursor_id, batch_size))
+        if result is None:
+            typer.echo(f"Board {board_id} not found", err=True)
+            raise typer.Exit(1)
+        
+        count, last = result
+        typer.echo(f"Exported {count} posts from board {board_id} ({time.perf_counter() - started:.2f}s)", err=True)
+        if last is not None:
+            typer.echo(f"Resume with --cursor-time {last.created_at.isoformat()} --cursor-id {last.id}", err=True)
+    except typer.Exit:
+        raise
+    except Exception as e:
+        typer.echo(f"Error during post export: {e}", err=True)
+        raise typer.Exit(1)
+    finally:
+        if output:
+            out.close()
+        db.close()
@@ -0,0 +1,66 @@
+import os
+import json
+import urllib.request
+import urllib.error
+import typer
+from entities.post import create_post_search, rebuild_post_search
+from infra.database import engine, get_pool_settings, upgrade_schema
+
+app = typer.Typer()
+
+API_INTERNAL_URL = os.getenv("API_INTERNAL_URL", "http://localhost:8000")
+
+def fetch_internal(path: str, url: str) -> dict:
+    """실행 중인 API 워커의 /internal 엔드포인트 조회"""
+    request = urllib.request.Request(f"{url.rstrip('/')}{path}")
+    token = os.getenv("INTERNAL_API_TOKEN", "")
+    if token:
+        request.add_header("X-Internal-Token", token)
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return json.loads(response.read())
+
+@app.command()
+def pool(url: str = typer.Option(API_INTERNAL_URL, help="API 서버 주소")):
+    """DB 커넥션 풀 설정과 실행 중인 워커의 풀 통계를 보여줍니다"""
+    typer.echo("⚙️  풀 설정:")
+    for key, value in get_pool_settings().items():
+        typer.echo(f"  {key}: {value}")
+
+    try:
+        stats = fetch_internal("/internal/db-pool", url)
+    except (urllib.error.URLError, OSError) as e:
+        typer.echo(f"❌ 풀 통계 조회 실패 ({url}): {e}", err=True)
+        raise typer.Exit(1)
+
+    for name in ("sync", "async"):
+        if name not in stats:
+            continue
+        typer.echo(f"📊 {name} 엔진 풀 (pid {stats[name]['pid']}):")
+        for key, value in stats[name].items():
+            if key != "pid":
+                typer.echo(f"  {key}: {value}")
+
+@app.command()
+def searchindex():
+    """게시글 전문 검색 인덱스 생성 (없는 것만) 후 기존 게시글로 다시 채웁니다 (없는 인덱스 생성은 db upgrade / API 시작 시에도 실행)"""
+    try:
+        with engine.begin() as conn:
+            create_post_search(conn)
+            rebuild_post_search(conn)
+    except Exception as e:
+        typer.echo(f"❌ 검색 인덱스 생성 실패: {e}", err=True)
+        raise typer.Exit(1)
+    typer.echo(f"✅ 게시글 검색 인덱스 준비 완료 ({engine.dialect.name})")
+
+@app.command()
+def upgrade():
+    """기존 테이블에 나중에 추가된 컬럼/인덱스를 반영합니다 (API 시작 시에도 자동 실행)"""
+    try:
+        with engine.begin() as conn:
+            statements = upgrade_schema(conn)
+    except Exception as e:
+        typer.echo(f"❌ 스키마 변경 실패: {e}", err=True)
+        raise typer.Exit(1)
+    for statement in statements:
+        typer.echo(f"  {statement}")
+    typer.echo(f"✅ 스키마 최신 상태 ({len(statements)}개 변경)")
@@ -0,0 +1,187 @@
+import asyncio
+import hashlib
+import random
+import secrets
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+import typer
+from sqlalchemy import select
+from entities import Base, User, Board, Post
+from entities.session import Session as SessionModel
+from infra.database import SessionLocal, engine, bulk_insert
+from infra.redis_client import close_redis
+from lib.auth import get_password_hash
+from repositories.board_repository import board_repository
+
+USER_COLUMNS = ("fullname", "email", "hashed_password")
+BOARD_COLUMNS = ("name", "public", "owner_id", "post_count", "created_at")
+POST_COLUMNS = ("title", "content", "board_id", "author_id", "created_at")
+SESSION_COLUMNS = ("id", "user_id", "device_name", "ip_address", "user_agent", "refresh_token_hash", "expires_at")
+
+WORDS = ["게시판", "오늘", "질문", "답변", "감사합니다", "FastAPI", "Redis", "PostgreSQL", "확인", "문제", "해결", "코드", "예시", "공유", "후기"]
+CONTENT_POOL_SIZE = 1000
+DEVICES = ["Chrome on Windows", "Safari on iPhone", "Chrome on Android", "Firefox on Linux", "Safari on Mac"]
+
+def zipf_counts(total: int, buckets: int, skew: float, rng: random.Random) -> List[int]:
+    """total을 buckets개로 나눔 (k번째로 큰 값이 1/k^skew에 비례, skew=0이면 균등), 합계는 정확히 total"""
+    weights = [1 / rank ** skew for rank in range(1, buckets + 1)]
+    rng.shuffle(weights)
+    scale = total / sum(weights)
+    shares = [weight * scale for weight in weights]
+    counts = [int(share) for share in shares]
+    # 내림으로 생긴 나머지는 소수부가 큰 쪽부터 하나씩
+    by_fraction = sorted(range(buckets), key=lambda i: shares[i] - counts[i], reverse=True)
+    for i in by_fraction[:total - sum(counts)]:
+        counts[i] += 1
+    return counts
+
+def content_pool(rng: random.Random) -> List[str]:
+    """본문 후보 (길이는 중앙값 약 300자의 로그 정규 분포), 게시글마다 여기서 골라서 생성 비용을 줄임"""
+    pool = []
+    for _ in range(CONTENT_POOL_SIZE):
+        length = min(20000, max(20, int(rng.lognormvariate(0, 1.0) * 300)))
+        words = []
+        size = 0
+        while size < length:
+            word = rng.choice(WORDS)
+            words.append(word)
+            size += len(word) + 1
+        pool.append(" ".join(words)[:length])
+    return pool
+
+class LoadReport:
+    def __init__(self):
+        self.tables = {}
+
+    def add(self, table: str, rows: int, seconds: float):
+        self.tables[table] = (rows, seconds)
+        typer.echo(f"  {table:<9} {rows:>10,} rows  {seconds:>7.1f}s  {rows / seconds if seconds else 0:>10,.0f} rows/s")
+
+    def total(self):
+        rows = sum(rows for rows, _ in self.tables.values())
+        seconds = sum(seconds for _, seconds in self.tables.values())
+        typer.echo(f"  {'total':<9} {rows:>10,} rows  {seconds:>7.1f}s  {rows / seconds if seconds else 0:>10,.0f} rows/s")
+
+def load_in_chunks(table, columns, rows, chunk_size: int, label: str) -> int:
+    """chunk_size행씩 한 트랜잭션으로 입력 (중간에 실패해도 앞 chunk는 남음)"""
+    loaded = 0
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            with engine.begin() as conn:
+                loaded += bulk_insert(conn, table, columns, chunk)
+            chunk = []
+            typer.echo(f"    {label}: {loaded:,}", err=True)
+    if chunk:
+        with engine.begin() as conn:
+            loaded += bulk_insert(conn, table, columns, chunk)
+    return loaded
+
+async def _rebuild_ranking() -> int:
+    db = SessionLocal()
+    try:
+        return await board_repository.rebuild_ranking(db)
+    finally:
+        db.close()
+        await close_redis()
+
+def seed(
+    users: int = typer.Option(1000, help="사용자 수"),
+    boards: int = typer.Option(100, help="게시판 수"),
+    posts_per_board: float = typer.Option(100, help="게시판당 평균 게시글 수 (전체 = boards x posts_per_board)"),
+    skew: float = typer.Option(1.0, help="게시판별 게시글 수 Zipf 지수 (0이면 균등, 클수록 인기 게시판에 집중)"),
+    sessions: int = typer.Option(0, help="활성 세션 수 (사용자 무작위)"),
+    private_ratio: float = typer.Option(0.1, help="비공개 게시판 비율"),
+    days: int = typer.Option(365, help="게시글 작성 시각 범위 (최근 N일)"),
+    password: str = typer.Option("password123", help="모든 사용자의 비밀번호 (bcrypt 해시는 한 번만 계산)"),
+    prefix: Optional[str] = typer.Option(None, help="이메일/게시판 이름 접두어 (기본: seed-<시각>, 여러 번 실행해도 겹치지 않음)"),
+    chunk_size: int = typer.Option(50000, help="한 번에 입력하는 행 수 (COPY / executemany 단위)"),
+    random_seed: int = typer.Option(0, "--seed", help="난수 시드"),
+    ranking: bool = typer.Option(True, help="입력 후 Redis 게시판 순위 인덱스 재구성"),
+    reset: bool = typer.Option(False, help="모든 테이블을 지우고 다시 만든 뒤 입력"),
+    yes: bool = typer.Option(False, "--yes", "-y", help="--reset 확인 생략"),
+):
+    """용량 테스트용 합성 데이터 대량 입력 (PostgreSQL은 COPY, SQLite는 executemany)"""
+    if reset and not yes:
+        typer.confirm(f"Drop and recreate all tables in {engine.url.render_as_string(hide_password=True)}?", abort=True)
+
+    rng = random.Random(random_seed)
+    prefix = prefix or f"seed-{int(time.time())}"
+    total_posts = int(boards * posts_per_board)
+    report = LoadReport()
+    now = datetime.now(timezone.utc)
+    typer.echo(f"Seeding {engine.dialect.name} with prefix '{prefix}': {users:,} users, {boards:,} boards, {total_posts:,} posts, {sessions:,} sessions")
+
+    try:
+        if reset:
+            Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+
+        started = time.perf_counter()
+        hashed_password = get_password_hash(password)
+        rows = ((f"{prefix} user {i}", f"{prefix}-user{i}@seed.example.com", hashed_password) for i in range(users))
+        loaded = load_in_chunks(User.__table__, USER_COLUMNS, rows, chunk_size, "users")
+        report.add("users", loaded, time.perf_counter() - started)
+        with engine.connect() as conn:
+            user_ids = list(conn.execute(select(User.id).where(User.email.like(f"{prefix}-user%"))).scalars())
+        if not user_ids:
+            typer.echo("No users to own boards and posts", err=True)
+            raise typer.Exit(1)
+
+        # 게시판의 post_count는 실제로 넣을 게시글 수와 같게 (동기화 없이 바로 일관된 상태)
+        started = time.perf_counter()
+        counts = zipf_counts(total_posts, boards, skew, rng) if boards else []
+        rows = (
+            (f"{prefix}-board-{i}", rng.random() >= private_ratio, rng.choice(user_ids), counts[i], now - timedelta(days=days))
+            for i in range(boards)
+        )
+        loaded = load_in_chunks(Board.__table__, BOARD_COLUMNS, rows, chunk_size, "boards")
+        report.add("boards", loaded, time.perf_counter() - started)
+        with engine.connect() as conn:
+            board_counts = list(conn.execute(select(Board.id, Board.post_count).where(Board.name.like(f"{prefix}-board-%"))))
+
+        started = time.perf_counter()
+        pool = content_pool(rng)
+        window = days * 86400
+
+        def post_rows():
+            number = 0
+            for board_id, post_count in board_counts:
+                for _ in range(post_count):
+                    number += 1
+                    created_at = now - timedelta(seconds=rng.random() * window)
+                    yield f"{prefix} 게시글 {number}", rng.choice(pool), board_id, rng.choice(user_ids), created_at
+
+        loaded = load_in_chunks(Post.__table__, POST_COLUMNS, post_rows(), chunk_size, "posts")
+        report.add("posts", loaded, time.perf_counter() - started)
+
+        if sessions:
+            started = time.perf_counter()
+            rows = (
+                (
+                    uuid.uuid4(), rng.choice(user_ids), rng.choice(DEVICES), "127.0.0.1", "seed",
+                    hashlib.sha256(secrets.token_bytes(32)).hexdigest(), now + timedelta(days=30),
+                )
+                for _ in range(sessions)
+            )
+            loaded = load_in_chunks(SessionModel.__table__, SESSION_COLUMNS, rows, chunk_size, "sessions")
+            report.add("sessions", loaded, time.perf_counter() - started)
+        report.total()
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        typer.echo(f"Error during seed: {e}", err=True)
+        raise typer.Exit(1)
+
+    # 새 게시판이 순위 인덱스에 없으면 목록에서 빠지므로 다시 구성 (Redis가 없으면 건너뜀)
+    if ranking:
+        try:
+            count = asyncio.run(_rebuild_ranking())
+            typer.echo(f"Rebuilt board ranking index with {count:,} boards")
+        except Exception as e:
+            typer.echo(f"Skipped board ranking rebuild ({e}), run `manage.py board rebuildranking` later", err=True)
+    typer.echo(f"Users can log in as {prefix}-user<N>@seed.example.com / {password}")
@@ -1,34 +1,38 @@
+import asyncio
+import json
 import typer
-from datetime import datetime
 from infra.database import SessionLocal
-from sqlalchemy import and_, or_
-from entities.session import Session as SessionModel
+from repositories.session_repository import (
+    session_repository,
+    SESSION_CLEANUP_BATCH_SIZE,
+    SESSION_CLEANUP_PAUSE,
+    SESSION_CLEANUP_MAX_RUNTIME,
+    SESSION_REVOKED_RETENTION_DAYS,
+)
 
 app = typer.Typer()
 
 @app.command()
-def cleanup():
-    """만료된 세션들을 정리합니다 (expires_at 기준)"""
+def cleanup(
+    batch_size: int = typer.Option(SESSION_CLEANUP_BATCH_SIZE, help="한 트랜잭션에서 삭제할 세션 수"),
+    pause: float = typer.Option(SESSION_CLEANUP_PAUSE, help="배치 사이 대기 시간(초)"),
+    max_runtime: float = typer.Option(SESSION_CLEANUP_MAX_RUNTIME, help="최대 실행 시간(초), 남은 세션은 다음 실행에서 정리"),
+    revoked_retention_days: int = typer.Option(SESSION_REVOKED_RETENTION_DAYS, help="무효화된 세션 보관 기간(일)"),
+):
+    """만료된 세션과 보관 기간이 지난 무효화 세션, 오래된 RT 재사용 감지 기록을 배치 단위로 정리합니다"""
     db = SessionLocal()
     try:
-        current_time = datetime.now()
+        # expires_at / revoked_at 인덱스로 batch_size개씩 삭제 후 커밋
+        result = asyncio.run(session_repository.cleanup_sessions(db, batch_size, pause, max_runtime, revoked_retention_days))
+        deleted_count = result["expired"] + result["revoked"]
         
-        # 인덱스를 효율적으로 사용: expires_at만으로 필터링
-        query = db.query(SessionModel).filter(
-            SessionModel.expires_at < current_time
-        )
-        
-        count = query.count()
-        
-        if count == 0:
+        if deleted_count == 0 and result["rotated_tokens"] == 0:
             typer.echo("정리할 만료된 세션이 없습니다.")
             return
-            
-        # 실제 삭제 (인덱스를 활용한 효율적인 삭제)
-        deleted_count = query.delete(synchronize_session=False)
-        db.commit()
         
-        typer.echo(f"✅ {deleted_count}개 세션이 성공적으로 정리되었습니다.")
+        typer.echo(f"✅ {deleted_count}개 세션이 성공적으로 정리되었습니다. (만료 {result['expired']}개, 무효화 {result['revoked']}개, 교체된 RT 기록 {result['rotated_tokens']}개, {result['batches']}회, {result['seconds']}초)")
+        if not result["completed"]:
+            typer.echo(f"⏱️ 최대 실행 시간({max_runtime}초)에 도달해 중단했습니다. 남은 세션은 다음 실행에서 정리됩니다.")
         
     except Exception as e:
         typer.echo(f"❌ 세션 정리 중 오류 발생: {e}", err=True)
@@ -38,29 +42,22 @@ def cleanup():
         db.close()
 
 @app.command()
-def stats():
+def stats(as_json: bool = typer.Option(False, "--json", help="JSON으로 출력 (모니터링 수집용)")):
     """세션 통계 정보를 보여줍니다"""
     db = SessionLocal()
     try:
-        current_time = datetime.now()
-        
-        # 전체 세션 수
-        total_count = db.query(SessionModel).count()
-        
-        # 활성 세션 수 (만료되지 않은 세션)
-        active_count = db.query(SessionModel).filter(
-            SessionModel.expires_at > current_time
-        ).count()
+        counts = asyncio.run(session_repository.get_session_stats(db))
+        if as_json:
+            typer.echo(json.dumps(counts))
+            return
         
-        # 만료된 세션 수
-        expired_count = db.query(SessionModel).filter(
-            SessionModel.expires_at < current_time
-        ).count()
+        total_count, active_count, expired_count = counts["total"], counts["active"], counts["expired"]
         
         typer.echo("📊 세션 통계:")
         typer.echo(f"  전체 세션: {total_count}개")
         typer.echo(f"  활성 세션: {active_count}개")
         typer.echo(f"  만료된 세션: {expired_count}개")
+        typer.echo(f"  무효화된 세션: {counts['revoked']}개")
         
         if expired_count > 0:
             typer.echo(f"  💡 정리 가능: {expired_count}개 (cleanup 명령어 사용)")
@@ -2,5 +2,6 @@ from .base import Base
 from .user import User
 from .board import Board
 from .post import Post
+from .post_count_sync import PostCountSyncBatch
 
-__all__ = ["Base", "User", "Board", "Post"]
\ No newline at end of file
+__all__ = ["Base", "User", "Board", "Post", "PostCountSyncBatch"]
\ No newline at end of file
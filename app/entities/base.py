@@ -1,3 +1,18 @@
+from sqlalchemy import inspect
 from sqlalchemy.ext.declarative import declarative_base
 
-Base = declarative_base()
\ No newline at end of file
+Base = declarative_base()
+
+def missing_schema_ddl(connection, table: str, columns: dict, indexes: dict = None) -> list:
+    """기존 테이블에 아직 없는 컬럼/인덱스의 DDL 목록 (이름 → DDL, 테이블이 없으면 create_all이 만들므로 빈 목록)
+
+    create_all은 이미 있는 테이블에 컬럼/인덱스를 추가하지 않으므로 나중에 추가된 것은 이걸로 반영한다.
+    """
+    inspector = inspect(connection)
+    if not inspector.has_table(table):
+        return []
+    existing_columns = {column["name"] for column in inspector.get_columns(table)}
+    existing_indexes = {index["name"] for index in inspector.get_indexes(table)}
+    statements = [ddl for name, ddl in columns.items() if name not in existing_columns]
+    statements += [ddl for name, ddl in (indexes or {}).items() if name not in existing_indexes]
+    return statements
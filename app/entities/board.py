@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index, desc
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from .base import Base
@@ -18,9 +18,8 @@ class Board(Base):
     
     __table_args__ = (
         # 공개 게시판 정렬용 (public = true 필터링 후 정렬)
-        Index('idx_boards_public_rank', 'public', 'post_count', 'id', 
-              postgresql_ops={'post_count': 'DESC'}),
+        # (post_count DESC, id ASC) keyset 조회가 정렬 없이 인덱스 순서로 읽히도록 방향까지 지정
+        Index('idx_boards_public_rank', 'public', desc('post_count'), 'id'),
         # 내 게시판 정렬용 (owner_id 필터링 후 정렬)  
-        Index('idx_boards_owner_rank', 'owner_id', 'post_count', 'id',
-              postgresql_ops={'post_count': 'DESC'}),
+        Index('idx_boards_owner_rank', 'owner_id', desc('post_count'), 'id'),
     )
\ No newline at end of file
@@ -1,7 +1,11 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+import os
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, event, inspect
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from .base import Base
+from .base import Base, missing_schema_ddl
+
+# 전문 검색 텍스트 분석 설정 (PostgreSQL text search configuration, 한국어는 형태소 분석 없이 simple)
+POST_SEARCH_CONFIG = os.getenv("POST_SEARCH_CONFIG", "simple")
 
 class Post(Base):
     __tablename__ = "posts"
@@ -13,6 +17,8 @@ class Post(Base):
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # 수정할 때마다 1씩 증가 (ETag 검증자, updated_at은 SQLite에서 초 단위라 같은 초 안의 수정을 구분하지 못함)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
     
     board = relationship("Board", back_populates="posts")
     author = relationship("User", back_populates="posts")
@@ -20,4 +26,96 @@ class Post(Base):
     __table_args__ = (
         Index('idx_posts_board_created', 'board_id', 'created_at', 'id',
               postgresql_ops={'created_at': 'DESC', 'id': 'DESC'}),
-    )
\ No newline at end of file
+    )
+
+# version 컬럼 이전에 만든 posts 테이블 변경 (기존 게시글은 1부터 시작)
+POST_UPGRADE_COLUMNS = {
+    "version": "ALTER TABLE posts ADD COLUMN version INTEGER NOT NULL DEFAULT 1",
+}
+
+def upgrade_posts(connection) -> list:
+    """기존 posts 테이블에 없는 컬럼 추가, 실행한 DDL 목록 반환"""
+    statements = missing_schema_ddl(connection, "posts", POST_UPGRADE_COLUMNS)
+    for statement in statements:
+        connection.exec_driver_sql(statement)
+    return statements
+
+# 전문 검색 인덱스 (ORM에 매핑하지 않는 DB 전용 객체, posts 테이블을 만들 때 같이 생성)
+# - PostgreSQL: 제목(A) + 본문(B) 가중치 tsvector generated column + GIN 인덱스 (INSERT/UPDATE 시 DB가 갱신)
+# - SQLite: FTS5 external content 테이블 + 트리거로 posts와 동기화 (본문은 posts에만 저장)
+# 객체 이름별 DDL, 모두 IF NOT EXISTS라서 기존 DB에 다시 실행해도 됨 (API 시작 시 upgrade_post_search, manage.py db searchindex)
+POST_SEARCH_DDL = {
+    "postgresql": {
+        "search_vector":
+            "ALTER TABLE posts ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+            f"setweight(to_tsvector('{POST_SEARCH_CONFIG}', title), 'A') || "
+            f"setweight(to_tsvector('{POST_SEARCH_CONFIG}', content), 'B')) STORED",
+        "idx_posts_search": "CREATE INDEX IF NOT EXISTS idx_posts_search ON posts USING GIN (search_vector)",
+    },
+    "sqlite": {
+        "posts_fts":
+            "CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5("
+            "title, content, content='posts', content_rowid='id', tokenize='unicode61')",
+        "posts_fts_insert":
+            "CREATE TRIGGER IF NOT EXISTS posts_fts_insert AFTER INSERT ON posts BEGIN "
+            "INSERT INTO posts_fts(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+        "posts_fts_delete":
+            "CREATE TRIGGER IF NOT EXISTS posts_fts_delete AFTER DELETE ON posts BEGIN "
+            "INSERT INTO posts_fts(posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content); END",
+        "posts_fts_update":
+            "CREATE TRIGGER IF NOT EXISTS posts_fts_update AFTER UPDATE OF title, content ON posts BEGIN "
+            "INSERT INTO posts_fts(posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content); "
+            "INSERT INTO posts_fts(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+    },
+}
+# 기존 게시글로 검색 인덱스 다시 채우기 (PostgreSQL generated column은 컬럼 추가 시 자동으로 채워짐)
+POST_SEARCH_REBUILD = {
+    "sqlite": "INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')",
+}
+
+def create_post_search(connection):
+    """현재 DB 종류에 맞는 전문 검색 인덱스 생성 (없는 것만)"""
+    for statement in POST_SEARCH_DDL.get(connection.dialect.name, {}).values():
+        connection.exec_driver_sql(statement)
+
+def rebuild_post_search(connection):
+    """기존 게시글로 검색 인덱스 다시 채우기"""
+    statement = POST_SEARCH_REBUILD.get(connection.dialect.name)
+    if statement:
+        connection.exec_driver_sql(statement)
+
+def existing_post_search_objects(connection) -> set:
+    """이미 있는 전문 검색 객체 이름 (POST_SEARCH_DDL의 키)"""
+    if connection.dialect.name == "sqlite":
+        # FTS5 가상 테이블과 트리거는 inspector로 조회되지 않으므로 sqlite_master에서 확인
+        return set(connection.exec_driver_sql("SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')").scalars())
+    inspector = inspect(connection)
+    return {column["name"] for column in inspector.get_columns("posts")} | {index["name"] for index in inspector.get_indexes("posts")}
+
+def upgrade_post_search(connection) -> list:
+    """posts 테이블보다 나중에 추가된 전문 검색 객체 중 없는 것만 생성, 실행한 DDL 목록 반환
+
+    posts 테이블을 새로 만들 때는 after_create에서 이미 만들어지므로 기존 DB에서만 실행된다.
+    새로 만든 FTS5 테이블/트리거는 기존 게시글을 모르므로 다시 채운다.
+    """
+    if not inspect(connection).has_table("posts"):
+        return []
+    existing = existing_post_search_objects(connection)
+    statements = [ddl for name, ddl in POST_SEARCH_DDL.get(connection.dialect.name, {}).items() if name not in existing]
+    for statement in statements:
+        connection.exec_driver_sql(statement)
+    rebuild = POST_SEARCH_REBUILD.get(connection.dialect.name)
+    if statements and rebuild:
+        connection.exec_driver_sql(rebuild)
+        statements.append(rebuild)
+    return statements
+
+@event.listens_for(Post.__table__, "after_create")
+def _create_post_search(target, connection, **kw):
+    create_post_search(connection)
+
+@event.listens_for(Post.__table__, "before_drop")
+def _drop_post_search(target, connection, **kw):
+    # FTS5 테이블은 posts와 별개라서 남아 있으면 다시 만든 posts와 어긋남 (트리거는 posts와 함께 삭제됨)
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("DROP TABLE IF EXISTS posts_fts")
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String, Integer, DateTime
+from sqlalchemy.sql import func
+from .base import Base
+
+class PostCountSyncBatch(Base):
+    """post_count 동기화에서 DB에 반영된 chunk 기록 (중단 후 재실행 시 같은 chunk 중복 반영 방지)"""
+    __tablename__ = "post_count_sync_batches"
+    
+    sync_id = Column(String(32), primary_key=True)  # Redis 스냅샷 키의 식별자
+    chunk = Column(Integer, primary_key=True)
+    boards = Column(Integer, nullable=False)
+    applied_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
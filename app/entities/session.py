@@ -1,19 +1,18 @@
-from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey
+from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, Uuid, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from sqlalchemy.dialects.postgresql import UUID
 import uuid
-from .base import Base
+from .base import Base, missing_schema_ddl
 
 class Session(Base):
     __tablename__ = "sessions"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)  # PostgreSQL: UUID, SQLite: CHAR(32)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     device_name = Column(String(255))
     ip_address = Column(String(45))  # IPv6 지원
     user_agent = Column(Text)
-    refresh_token_hash = Column(String(255), unique=True)
+    refresh_token_hash = Column(String(255))
     
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     last_seen_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -21,4 +20,42 @@ class Session(Base):
     revoked_at = Column(DateTime(timezone=True), nullable=True, index=True)
     revocation_reason = Column(String(100))  # "user_logout", "admin_force", "security_breach" 등
     
-    user = relationship("User", back_populates="sessions")
\ No newline at end of file
+    user = relationship("User", back_populates="sessions")
+    
+    __table_args__ = (
+        # RT 갱신용: 활성 세션만 인덱싱 (무효화된 세션이 쌓여도 인덱스 크기 유지)
+        Index('idx_sessions_active_refresh', 'refresh_token_hash', unique=True,
+              postgresql_where=text('revoked_at IS NULL'), sqlite_where=text('revoked_at IS NULL')),
+    )
+
+class SessionRefreshToken(Base):
+    """세션에서 이미 교체된 RT 해시 (RT family), 이 중 하나가 다시 제시되면 재사용(탈취)으로 판단
+
+    교체된 지 RT 수명이 지난 해시는 교체되지 않았더라도 만료됐을 RT라서 세션 정리 때 삭제한다.
+    """
+    __tablename__ = "session_refresh_tokens"
+
+    token_hash = Column(String(255), primary_key=True)
+    session_id = Column(Uuid(as_uuid=True), ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False, index=True)
+    rotated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+
+# RT 회전 이전에 만든 sessions 테이블 변경 (create_all은 기존 테이블에 컬럼/인덱스를 추가하지 않음, session_refresh_tokens는 새 테이블이라 create_all이 만듦)
+# 컬럼/인덱스 이름별 DDL, 없는 것만 실행하므로 여러 번 실행해도 됨
+SESSION_UPGRADE_COLUMNS = {}
+SESSION_UPGRADE_INDEXES = {
+    "idx_sessions_active_refresh":
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_sessions_active_refresh ON sessions (refresh_token_hash) WHERE revoked_at IS NULL",
+}
+# 무효화된 세션까지 포함하는 기존 전역 UNIQUE 제약 (부분 인덱스로 대체, SQLite는 테이블을 다시 만들어야 해서 그대로 둠)
+SESSION_UPGRADE_DROP = {
+    "postgresql": ["ALTER TABLE sessions DROP CONSTRAINT IF EXISTS sessions_refresh_token_hash_key"],
+}
+
+def upgrade_sessions(connection) -> list:
+    """기존 sessions 테이블에 없는 컬럼/인덱스 추가, 실행한 DDL 목록 반환"""
+    statements = missing_schema_ddl(connection, "sessions", SESSION_UPGRADE_COLUMNS, SESSION_UPGRADE_INDEXES)
+    if statements:
+        statements += SESSION_UPGRADE_DROP.get(connection.dialect.name, [])
+    for statement in statements:
+        connection.exec_driver_sql(statement)
+    return statements
\ No newline at end of file
@@ -0,0 +1,119 @@
+import os
+import threading
+import time
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+from lib.metrics import LatencyStats
+
+class PoolMetrics:
+    """커넥션 풀 이벤트 집계 (워커 프로세스 단위)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkout_wait = LatencyStats()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.checkins = 0
+            self.connects = 0
+            self.invalidations = 0
+            self.timeouts = 0
+            self.max_in_use = 0
+            self.connection_age_max = 0.0
+        self.checkout_wait.reset()
+
+    def record_wait(self, seconds: float, timed_out: bool = False):
+        self.checkout_wait.record(seconds)
+        if timed_out:
+            with self._lock:
+                self.timeouts += 1
+
+    def record_checkout(self, in_use: int, connection_age: float):
+        with self._lock:
+            self.checkouts += 1
+            self.max_in_use = max(self.max_in_use, in_use)
+            self.connection_age_max = max(self.connection_age_max, connection_age)
+
+    def record_checkin(self):
+        with self._lock:
+            self.checkins += 1
+
+    def record_connect(self):
+        with self._lock:
+            self.connects += 1
+
+    def record_invalidate(self):
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self, pool) -> dict:
+        with self._lock:
+            stats = {
+                "pid": os.getpid(),
+                "pool_class": type(pool).__name__,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "max_in_use": self.max_in_use,
+                "connection_age_max_seconds": round(self.connection_age_max, 1),
+            }
+        stats["checkout_wait"] = self.checkout_wait.snapshot()
+
+        # QueuePool 계열만 크기/overflow 정보를 제공
+        if isinstance(pool, QueuePool):
+            stats.update({
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "timeout": pool.timeout(),
+            })
+        return stats
+
+def instrumented_pool_class(base, metrics: PoolMetrics):
+    """체크아웃 대기 시간과 타임아웃을 기록하는 풀 클래스 생성
+
+    SQLAlchemy에는 '체크아웃 대기 시작' 이벤트가 없으므로 _do_get을 감싸서 측정한다.
+    metrics는 클래스에 묶여 있으므로 engine.dispose()로 풀이 재생성되어도 유지된다.
+    """
+    class InstrumentedPool(base):
+        def _do_get(self):
+            started = time.perf_counter()
+            try:
+                connection = super()._do_get()
+            except PoolTimeoutError:
+                metrics.record_wait(time.perf_counter() - started, timed_out=True)
+                raise
+            metrics.record_wait(time.perf_counter() - started)
+            return connection
+
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    return InstrumentedPool
+
+def attach_pool_listeners(sync_engine, metrics: PoolMetrics):
+    """연결 생성/체크아웃/반납/무효화 이벤트를 metrics에 기록"""
+
+    @event.listens_for(sync_engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        connection_record.info["connected_at"] = time.monotonic()
+        metrics.record_connect()
+
+    @event.listens_for(sync_engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connected_at = connection_record.info.get("connected_at", time.monotonic())
+        pool = sync_engine.pool
+        in_use = pool.checkedout() if isinstance(pool, QueuePool) else 0
+        metrics.record_checkout(in_use, time.monotonic() - connected_at)
+
+    @event.listens_for(sync_engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        metrics.record_checkin()
+
+    @event.listens_for(sync_engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.record_invalidate()
@@ -1,6 +1,64 @@
 import os
+from contextlib import asynccontextmanager
 import redis
+import redis.asyncio as aioredis
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:25100/0")
 
-redis_client = redis.from_url(REDIS_URL, decode_responses=True)
\ No newline at end of file
+# 워커당 최대 연결 수 (초과 시 REDIS_POOL_TIMEOUT 동안 대기 후 에러)
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "2"))
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "2"))
+# 마지막 사용 후 이 시간(초)이 지난 연결은 사용 전에 PING으로 확인
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+
+def _create_fake_clients():
+    """REDIS_URL=fakeredis:// 일 때 로컬 테스트/벤치마크용 in-memory Redis (fakeredis 필요)"""
+    import fakeredis
+    import fakeredis.aioredis
+
+    server = fakeredis.FakeServer()
+    return (
+        fakeredis.FakeRedis(server=server, decode_responses=True),
+        fakeredis.aioredis.FakeRedis(server=server, decode_responses=True),
+    )
+
+if REDIS_URL.startswith("fakeredis://"):
+    redis_client, async_redis_client = _create_fake_clients()
+    async_redis_pool = async_redis_client.connection_pool
+else:
+    # 관리 명령어 등 동기 코드용
+    redis_client = redis.from_url(REDIS_URL, decode_responses=True)
+
+    # API 요청 경로용: 크기가 고정된 풀에서 연결을 빌려 씀
+    async_redis_pool = aioredis.BlockingConnectionPool.from_url(
+        REDIS_URL,
+        decode_responses=True,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        timeout=REDIS_POOL_TIMEOUT,
+        socket_timeout=REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+        health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+    )
+    async_redis_client = aioredis.Redis(connection_pool=async_redis_pool)
+
+@asynccontextmanager
+async def redis_pipeline(transaction: bool = False):
+    """블록 안에서 쌓은 명령을 한 번의 왕복으로 실행
+
+    결과가 필요하면 블록 안에서 직접 `await pipe.execute()`를 호출한다.
+    """
+    async with async_redis_client.pipeline(transaction=transaction) as pipe:
+        yield pipe
+        if len(pipe):
+            await pipe.execute()
+
+async def ping_redis() -> bool:
+    """Redis 연결 상태 확인 (헬스 체크용)"""
+    try:
+        return bool(await async_redis_client.ping())
+    except (redis.RedisError, OSError):
+        return False
+
+async def close_redis():
+    await async_redis_pool.disconnect()
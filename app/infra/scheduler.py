@@ -0,0 +1,220 @@
+import os
+import json
+import time
+import uuid
+import random
+import asyncio
+import logging
+import socket
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Optional
+from redis.exceptions import RedisError
+from infra.redis_client import async_redis_client
+
+logger = logging.getLogger(__name__)
+
+SCHEDULER_ENABLED = os.getenv("SCHEDULER_ENABLED", "true").lower() == "true"
+# 시작 후 첫 실행까지 최대 대기 시간(초), 워커마다 0 ~ 이 값 사이에서 무작위로 정해서 시도 시점을 분산
+SCHEDULER_STARTUP_DELAY = float(os.getenv("SCHEDULER_STARTUP_DELAY", "10"))
+
+# 락 소유자가 자신일 때만 삭제
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# 락 소유자가 자신일 때만 만료 시간 연장
+RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+@dataclass
+class Job:
+    name: str
+    func: Callable[[], Awaitable[Optional[dict]]]
+    interval: float  # 초
+    timeout: float
+    jitter: float = 0.0  # 실행 간격에 더하는 ±무작위 시간, 여러 워커의 동시 시도 분산
+    # False면 제한 시간을 넘겨도 취소하지 않음 (스레드풀에서 실행되는 작업은 코루틴을 취소해도 스레드가 멈추지 않음)
+    cancellable: bool = True
+    runs: int = 0
+    skipped: int = 0  # 다른 워커가 이번 주기를 실행해서 건너뛴 횟수
+    failures: int = 0
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+    current: Optional[asyncio.Task] = field(default=None, repr=False)  # 실행 중인 작업
+
+class Scheduler:
+    """API 워커 안에서 주기 작업 실행
+
+    - 작업마다 Redis 락(SET NX PX)을 리더 임대로 사용: 획득한 워커만 이번 주기를 실행하고,
+      락은 실행 후에도 주기의 대부분 동안 유지되어 다른 워커/레플리카가 같은 주기에 다시 실행하지 않음
+    - 락 만료 시간은 timeout 이상이므로 시간 초과로 취소되기 전에 다른 워커가 겹쳐 실행할 수 없음
+    - 취소할 수 없는 작업(cancellable=False)의 timeout은 권고: 넘기면 timeout으로 기록하지만 끝날 때까지 기다리며 락을 연장
+    - 첫 실행은 시작 후 짧은 무작위 지연(SCHEDULER_STARTUP_DELAY 이내) 뒤, 그 다음부터는 interval ± jitter마다
+      (최근에 다른 워커/이전 프로세스가 실행했으면 락이 남아 있어서 건너뜀)
+    - 마지막 실행 결과는 Redis에 저장해서 어느 워커에서든 조회 가능
+    """
+    LOCK_PREFIX = "scheduler:lock:"
+    STATUS_PREFIX = "scheduler:status:"
+
+    def __init__(self):
+        self.jobs: Dict[str, Job] = {}
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._release = async_redis_client.register_script(RELEASE_SCRIPT)
+        self._renew = async_redis_client.register_script(RENEW_SCRIPT)
+
+    def add(self, name: str, func: Callable[[], Awaitable[Optional[dict]]], interval: float, timeout: float, jitter: float = 0.0, cancellable: bool = True):
+        if timeout >= interval:
+            raise ValueError(f"job {name}: timeout must be shorter than interval")
+        self.jobs[name] = Job(name=name, func=func, interval=interval, timeout=timeout, jitter=jitter, cancellable=cancellable)
+
+    def start(self):
+        for job in self.jobs.values():
+            if job.task is None:
+                job.task = asyncio.create_task(self._loop(job), name=f"scheduler:{job.name}")
+
+    async def stop(self):
+        tasks = [job.task for job in self.jobs.values() if job.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # 취소할 수 없는 작업은 스레드가 끝날 때까지 기다린 뒤 종료 (세션/엔진을 정리하기 전에)
+        running = [job.current for job in self.jobs.values() if job.current is not None]
+        await asyncio.gather(*running, return_exceptions=True)
+        for job in self.jobs.values():
+            job.task = None
+            job.current = None
+
+    async def _loop(self, job: Job):
+        # 첫 실행은 짧은 무작위 지연 뒤 (배포 시 모든 워커가 동시에 시도하지 않도록)
+        delay = random.uniform(0.0, min(SCHEDULER_STARTUP_DELAY, job.interval))
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                await self.run_once(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("scheduler: job %s loop error", job.name)
+            delay = max(0.0, job.interval + random.uniform(-job.jitter, job.jitter))
+
+    async def run_once(self, job: Job) -> bool:
+        """리더 임대를 얻으면 작업 실행, 다른 워커가 이번 주기를 가져갔으면 False"""
+        token = uuid.uuid4().hex
+        lease_ms = int(max(job.timeout, job.interval - job.jitter) * 1000)
+        try:
+            acquired = await async_redis_client.set(f"{self.LOCK_PREFIX}{job.name}", token, nx=True, px=lease_ms)
+        except RedisError:
+            logger.warning("scheduler: lock for %s unavailable, skipping", job.name, exc_info=True)
+            acquired = False
+        if not acquired:
+            job.skipped += 1
+            return False
+
+        started_at = datetime.now(timezone.utc)
+        started = time.perf_counter()
+        result, error = None, None
+        try:
+            result = await self._run(job, token, lease_ms)
+            status = "ok"
+        except asyncio.TimeoutError:
+            status, error = "timeout", f"exceeded {job.timeout}s"
+            if not job.cancellable:
+                error += f", not cancellable: finished after {time.perf_counter() - started:.1f}s"
+        except Exception as e:
+            logger.exception("scheduler: job %s failed", job.name)
+            status, error = "error", repr(e)
+            # 실패하면 다음 주기를 기다리지 않고 다른 워커가 재시도할 수 있도록 락 해제
+            await self._release_lock(job, token)
+
+        job.runs += 1
+        if status != "ok":
+            job.failures += 1
+        await self._save_status(job, {
+            "status": status,
+            "started_at": started_at.isoformat(),
+            "duration_seconds": round(time.perf_counter() - started, 3),
+            "worker": self.worker_id,
+            "error": error or "",
+            "result": json.dumps(result, default=str) if result is not None else "",
+        })
+        return True
+
+    async def _run(self, job: Job, token: str, lease_ms: int):
+        """작업 실행, 제한 시간을 넘기면 asyncio.TimeoutError
+
+        취소할 수 없는 작업은 제한 시간을 넘겨도 끝날 때까지 기다리고, 그동안 락을 연장해서 다른 워커가 겹쳐 실행하지 않게 한다.
+        """
+        job.current = asyncio.ensure_future(job.func())
+        try:
+            done, _ = await asyncio.wait({job.current}, timeout=job.timeout)
+            if done:
+                return job.current.result()
+            if job.cancellable:
+                job.current.cancel()
+                await asyncio.gather(job.current, return_exceptions=True)
+                raise asyncio.TimeoutError
+            logger.warning("scheduler: job %s exceeded %ss, not cancellable, waiting for it to finish", job.name, job.timeout)
+            while not done:
+                await self._renew_lock(job, token, lease_ms)
+                done, _ = await asyncio.wait({job.current}, timeout=lease_ms / 3000)
+            if job.current.exception() is not None:
+                logger.error("scheduler: job %s failed after timeout", job.name, exc_info=job.current.exception())
+            raise asyncio.TimeoutError
+        except asyncio.CancelledError:
+            # 스케줄러 종료: 취소할 수 없는 작업은 그대로 두고 stop()이 끝날 때까지 기다림
+            if job.cancellable:
+                job.current.cancel()
+            raise
+        finally:
+            if job.current.done():
+                job.current = None
+
+    async def _renew_lock(self, job: Job, token: str, lease_ms: int):
+        try:
+            await self._renew(keys=[f"{self.LOCK_PREFIX}{job.name}"], args=[token, lease_ms])
+        except RedisError:
+            logger.warning("scheduler: lock renewal for %s failed", job.name, exc_info=True)
+
+    async def _release_lock(self, job: Job, token: str):
+        try:
+            await self._release(keys=[f"{self.LOCK_PREFIX}{job.name}"], args=[token])
+        except RedisError:
+            logger.warning("scheduler: lock release for %s failed", job.name, exc_info=True)
+
+    async def _save_status(self, job: Job, status: dict):
+        try:
+            await async_redis_client.hset(f"{self.STATUS_PREFIX}{job.name}", mapping=status)
+        except RedisError:
+            logger.warning("scheduler: status write for %s failed", job.name, exc_info=True)
+
+    async def stats(self) -> dict:
+        """작업별 설정, 이 워커의 집계, 클러스터 전체의 마지막 실행 결과"""
+        jobs = {}
+        for job in self.jobs.values():
+            try:
+                last_run = await async_redis_client.hgetall(f"{self.STATUS_PREFIX}{job.name}")
+            except RedisError:
+                last_run = None
+            if last_run:
+                last_run["duration_seconds"] = float(last_run["duration_seconds"])
+                last_run["result"] = json.loads(last_run["result"]) if last_run["result"] else None
+                last_run["error"] = last_run["error"] or None
+            jobs[job.name] = {
+                "interval": job.interval,
+                "timeout": job.timeout,
+                "jitter": round(job.jitter, 3),
+                "cancellable": job.cancellable,
+                "running": job.task is not None,
+                "worker": {"runs": job.runs, "skipped": job.skipped, "failures": job.failures},
+                "last_run": last_run or None,
+            }
+        return {"enabled": SCHEDULER_ENABLED, "worker_id": self.worker_id, "jobs": jobs}
+
+scheduler = Scheduler()
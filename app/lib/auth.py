@@ -49,7 +49,8 @@ def verify_access_token(token: str) -> dict:
         session_id = payload.get("sid")  # session_id 추출
         return {
             "user_id": int(user_id),
-            "session_id": session_id
+            "session_id": session_id,
+            "expires_at": payload.get("exp")
         }
     except JWTError:
         raise HTTPException(
@@ -0,0 +1,40 @@
+import math
+
+class BloomFilter:
+    """고정 크기 Bloom filter (거짓 양성만 있고 거짓 음성은 없음)
+
+    capacity개를 넣었을 때 거짓 양성 비율이 false_positive_rate가 되도록 비트 수와 해시 수를 정한다.
+    위치는 내장 hash() 한 번의 상위/하위 32비트로 double hashing해서 만든다.
+    hash()는 프로세스마다 seed가 다르므로 워커 메모리 안에서만 사용하고 직렬화하지 않는다.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01):
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def add(self, item: str):
+        h = hash(item)
+        position, step = (h & 0xFFFFFFFF) % self.size, (h >> 32 & 0xFFFFFFFF) | 1
+        for _ in range(self.hash_count):
+            self._bits[position >> 3] |= 1 << (position & 7)
+            position = (position + step) % self.size
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        if not self.count:
+            return False
+        h = hash(item)
+        bits, size = self._bits, self.size
+        # 없는 항목은 대부분 첫 위치에서 끝나므로 반복문 전에 먼저 확인
+        position = (h & 0xFFFFFFFF) % size
+        if not bits[position >> 3] >> (position & 7) & 1:
+            return False
+        step = (h >> 32 & 0xFFFFFFFF) | 1
+        for _ in range(self.hash_count - 1):
+            position = (position + step) % size
+            if not bits[position >> 3] >> (position & 7) & 1:
+                return False
+        return True
@@ -1,18 +1,82 @@
-from fastapi import Depends, HTTPException, status
+import os
+import secrets
+from typing import List, Optional
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from types import SimpleNamespace
 from lib.auth import verify_access_token
+from lib.token_cache import access_token_cache
+from repositories.session_activity import session_activity, SESSION_ACTIVITY_TRACKING
+from repositories.session_denylist import session_denylist
 
 security = HTTPBearer()
 
-def get_current_user(
+# /internal 엔드포인트는 X-Internal-Token 헤더가 이 값과 일치해야 접근 가능
+INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN", "")
+# 토큰 없이 /internal 엔드포인트를 열어둘지 (로컬 개발용, 기본은 토큰이 없으면 404)
+INTERNAL_API_OPEN = os.getenv("INTERNAL_API_OPEN", "false").lower() == "true"
+# 일괄 조회(?ids=) 한 번에 요청할 수 있는 최대 ID 수
+BATCH_READ_MAX_IDS = int(os.getenv("BATCH_READ_MAX_IDS", "100"))
+
+def verify_internal_token(x_internal_token: Optional[str] = Header(None)):
+    """내부 모니터링 엔드포인트 접근 검증 (토큰이 설정되지 않았으면 INTERNAL_API_OPEN일 때만 허용)"""
+    if not INTERNAL_API_TOKEN:
+        if INTERNAL_API_OPEN:
+            return
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Not Found"
+        )
+    if not secrets.compare_digest(x_internal_token or "", INTERNAL_API_TOKEN):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+
+def parse_batch_ids(ids: str) -> List[int]:
+    """쉼표로 구분한 ID 목록 파싱 (중복 제거, 요청 순서 유지)"""
+    try:
+        parsed = list(dict.fromkeys(int(value) for value in ids.split(",") if value.strip()))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must be comma-separated integers"
+        )
+    if not parsed:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must not be empty"
+        )
+    if len(parsed) > BATCH_READ_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many ids (max {BATCH_READ_MAX_IDS})"
+        )
+    return parsed
+
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
-    """하이브리드 패턴: AT는 완전 stateless"""
+    """하이브리드 패턴: AT는 stateless (검증 결과는 만료 시각까지 캐시)
+    
+    로그아웃된 세션의 AT는 denylist로 차단: 보통은 메모리 Bloom filter 확인만, 양성일 때만 Redis 조회
+    """
     token = credentials.credentials
-    payload = verify_access_token(token)
+    payload = access_token_cache.get(token)
+    if payload is None:
+        payload = verify_access_token(token)
+        if payload.get("expires_at"):
+            access_token_cache.put(token, payload, payload["expires_at"])
     user_id = payload["user_id"]
     session_id = payload.get("session_id")
+    if session_id and session_denylist.might_be_revoked(session_id) and await session_denylist.is_revoked(session_id):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Session revoked"
+        )
+    if session_id and SESSION_ACTIVITY_TRACKING:
+        # 메모리 버퍼에만 기록, DB 반영은 write-behind (repositories/session_activity.py)
+        session_activity.touch(session_id)
     
     return SimpleNamespace(
         id=user_id,
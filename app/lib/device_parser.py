@@ -1,4 +1,20 @@
-from user_agents import parse
+import os
+from functools import lru_cache
+
+# 실제 트래픽의 UA 종류는 수백 개 수준이므로 결과를 캐시
+USER_AGENT_CACHE_SIZE = int(os.getenv("USER_AGENT_CACHE_SIZE", "1024"))
+# 이보다 긴 UA는 잘라서 파싱 (비정상적으로 긴 헤더로 정규식 CPU를 소모하지 않도록)
+USER_AGENT_MAX_LENGTH = int(os.getenv("USER_AGENT_MAX_LENGTH", "512"))
+
+_parse = None
+
+def _get_parser():
+    """user_agents는 import 시 정규식 테이블을 로드하므로 첫 사용 시점에 import"""
+    global _parse
+    if _parse is None:
+        from user_agents import parse
+        _parse = parse
+    return _parse
 
 def parse_device_name(user_agent_string: str) -> str:
     """User-Agent를 파싱해서 기기 이름 생성"""
@@ -6,8 +22,23 @@ def parse_device_name(user_agent_string: str) -> str:
     if not user_agent_string:
         return "Unknown Device"
     
+    return _parse_device_name(user_agent_string[:USER_AGENT_MAX_LENGTH])
+
+def device_parser_stats() -> dict:
+    info = _parse_device_name.cache_info()
+    requests = info.hits + info.misses
+    return {
+        "size": info.currsize,
+        "max_size": info.maxsize,
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": round(info.hits / requests, 4) if requests else 0.0,
+    }
+
+@lru_cache(maxsize=USER_AGENT_CACHE_SIZE)
+def _parse_device_name(user_agent_string: str) -> str:
     try:
-        user_agent = parse(user_agent_string)
+        user_agent = _get_parser()(user_agent_string)
         
         # 모바일 기기
         if user_agent.is_mobile:
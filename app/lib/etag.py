@@ -0,0 +1,25 @@
+import hashlib
+from typing import Optional
+from fastapi import Response, status
+
+# 인증된 사용자별 응답이므로 공유 캐시에는 저장하지 않고, 브라우저는 매번 ETag로 재검증
+CACHE_CONTROL = "private, no-cache"
+
+def make_etag(*parts) -> str:
+    """응답 내용을 결정하는 값들로 만든 strong ETag (따옴표 포함)"""
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 비교 (RFC 9110: weak 비교, `*` 또는 쉼표로 구분한 목록)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+def etag_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag))
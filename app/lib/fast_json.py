@@ -0,0 +1,128 @@
+import inspect
+import os
+from functools import wraps
+from typing import Any, Callable, Optional, Union, get_args, get_origin
+from fastapi import APIRouter, Response
+from fastapi.datastructures import Default, DefaultPlaceholder
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, TypeAdapter
+from starlette.concurrency import run_in_threadpool
+
+# false면 fast_json()이 라우터를 그대로 반환 (기본 FastAPI 직렬화 경로로 되돌리기용)
+FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "true").lower() == "true"
+
+# 엔드포인트에 Response 파라미터가 없을 때 추가로 주입받는 이름 (설정한 헤더/상태 코드를 옮기기 위해)
+RESPONSE_PARAMETER = "fast_json_response"
+
+class FastJSONResponse(Response):
+    """이미 JSON bytes로 직렬화한 본문을 그대로 보내는 응답"""
+    media_type = "application/json"
+
+def contains_float(annotation: Any, seen: Optional[set] = None) -> bool:
+    """응답 타입 어딘가에 float가 있는지
+
+    pydantic-core는 float를 json.dumps와 다르게 쓰므로(json.dumps의 1e-05, 1e+16을 0.00001, 1e16으로 씀)
+    float가 있는 응답은 기본 경로로 두어야 출력이 같다.
+    """
+    if annotation is float:
+        return True
+    seen = set() if seen is None else seen
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if annotation in seen:
+            return False
+        seen.add(annotation)
+        return any(contains_float(field.annotation, seen) for field in annotation.model_fields.values())
+    return any(contains_float(arg, seen) for arg in get_args(annotation))
+
+def response_model_instance_check(response_model: Any) -> Callable[[Any], bool]:
+    """반환값이 이미 응답 모델 인스턴스(목록이면 모든 항목)인지 확인하는 함수
+
+    repository/service가 model_construct로 만든 응답은 컬럼 타입 그대로라서 다시 검증하지 않고 바로 직렬화한다.
+    하위 클래스는 직렬화 필드가 다를 수 있으므로 정확히 같은 타입만 인정한다.
+    """
+    origin = get_origin(response_model)
+    if origin is list:
+        item_check = response_model_instance_check(get_args(response_model)[0])
+        return lambda content: type(content) is list and all(item_check(item) for item in content)
+    if origin is Union:
+        models = tuple(arg for arg in get_args(response_model) if isinstance(arg, type) and issubclass(arg, BaseModel))
+    elif isinstance(response_model, type) and issubclass(response_model, BaseModel):
+        models = (response_model,)
+    else:
+        models = ()
+    return lambda content: type(content) in models
+
+def fast_json_endpoint(endpoint: Callable, response_model: Any, status_code: Optional[int]) -> Callable:
+    """반환값을 pydantic-core로 바로 JSON bytes로 직렬화하는 endpoint
+
+    기본 경로는 검증 후 dump_python(mode="json")으로 dict/list를 만든 뒤 json.dumps로 다시 순회한다.
+    TypeAdapter.dump_json은 같은 직렬화 규칙(datetime 형식, 압축 구분자, 비ASCII 그대로)으로 한 번에 bytes를 만든다.
+    반환값이 이미 응답 모델 인스턴스면 검증을 건너뛰고, ORM 객체/dict 등은 response_model로 검증한 뒤 직렬화한다.
+    Response를 반환하면 FastAPI는 직렬화를 건너뛰므로 엔드포인트가 Response 파라미터에 설정한 헤더/상태 코드는 여기서 옮긴다.
+    """
+    adapter = TypeAdapter(response_model)
+    is_response_model_instance = response_model_instance_check(response_model)
+    signature = inspect.signature(endpoint)
+    # FastAPI는 Response 파라미터를 하나만 주입하므로 엔드포인트에 이미 있으면 그걸 같이 읽음
+    response_name = next(
+        (name for name, parameter in signature.parameters.items()
+         if isinstance(parameter.annotation, type) and issubclass(parameter.annotation, Response)),
+        None,
+    )
+    if response_name is None:
+        response_parameter = inspect.Parameter(RESPONSE_PARAMETER, inspect.Parameter.KEYWORD_ONLY, annotation=Response)
+        signature = signature.replace(parameters=[*signature.parameters.values(), response_parameter])
+
+    @wraps(endpoint)
+    async def wrapper(**kwargs):
+        if response_name is None:
+            sub_response = kwargs.pop(RESPONSE_PARAMETER)
+        else:
+            sub_response = kwargs[response_name]
+        if inspect.iscoroutinefunction(endpoint):
+            content = await endpoint(**kwargs)
+        else:
+            content = await run_in_threadpool(endpoint, **kwargs)
+        if isinstance(content, Response):
+            return content
+
+        if not is_response_model_instance(content):
+            content = adapter.validate_python(content, from_attributes=True)
+        body = adapter.dump_json(content, by_alias=True)
+        response = FastJSONResponse(body, status_code=sub_response.status_code or status_code or 200)
+        response.headers.raw.extend(sub_response.headers.raw)
+        return response
+
+    wrapper.__signature__ = signature
+    return wrapper
+
+class FastJSONRoute(APIRoute):
+    """response_model이 있는 route의 endpoint를 fast_json_endpoint로 감싼 route (OpenAPI 스키마는 그대로)
+
+    float가 있는 응답 모델은 출력이 달라지므로 감싸지 않고 기본 경로로 둔다.
+    """
+
+    def __init__(self, path: str, endpoint: Callable, *, response_model: Any = Default(None), status_code: Optional[int] = None, **kwargs):
+        # 이 route가 fast_json 경로로 직렬화하는지 (테스트/모니터링용)
+        self.fast_json = is_fast_json_model(response_model)
+        if self.fast_json:
+            endpoint = fast_json_endpoint(endpoint, response_model, status_code)
+        super().__init__(path, endpoint, response_model=response_model, status_code=status_code, **kwargs)
+
+def is_fast_json_model(response_model: Any) -> bool:
+    """fast_json 경로로 직렬화하는 응답 모델인지 (없거나 float가 있으면 기본 경로)"""
+    if response_model is None or isinstance(response_model, DefaultPlaceholder):
+        return False
+    return not contains_float(response_model)
+
+class _FastJSONRouter(APIRouter):
+    def add_api_route(self, path: str, endpoint, *, route_class_override=None, **kwargs):
+        super().add_api_route(path, endpoint, route_class_override=FastJSONRoute, **kwargs)
+
+def fast_json(router: APIRouter) -> APIRouter:
+    """라우터의 모든 route를 FastJSONRoute로 옮긴 라우터 (main.py에서 include_router에 넘김)"""
+    if not FAST_JSON_RESPONSES:
+        return router
+    fast = _FastJSONRouter()
+    fast.include_router(router)
+    return fast
@@ -0,0 +1,46 @@
+import threading
+from collections import deque
+
+class LatencyStats:
+    """최근 샘플 기반 지연 시간 통계 (스레드 안전)"""
+
+    def __init__(self, sample_size: int = 1000):
+        self._lock = threading.Lock()
+        self._samples = deque(maxlen=sample_size)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self.count = 0
+            self.total = 0.0
+            self.max = 0.0
+
+    def snapshot(self) -> dict:
+        """밀리초 단위 요약 (백분위는 최근 샘플 기준)"""
+        with self._lock:
+            samples = sorted(self._samples)
+            count, total, maximum = self.count, self.total, self.max
+        return {
+            "count": count,
+            "avg_ms": round(total / count * 1000, 3) if count else 0.0,
+            "p50_ms": round(percentile(samples, 0.50) * 1000, 3),
+            "p95_ms": round(percentile(samples, 0.95) * 1000, 3),
+            "p99_ms": round(percentile(samples, 0.99) * 1000, 3),
+            "max_ms": round(maximum * 1000, 3),
+        }
+
+def percentile(sorted_values: list, ratio: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * ratio))
+    return sorted_values[index]
\ No newline at end of file
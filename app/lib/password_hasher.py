@@ -0,0 +1,74 @@
+import os
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import HTTPException, status
+from lib.auth import verify_password, get_password_hash
+from lib.metrics import LatencyStats
+
+# bcrypt는 해싱 중 GIL을 놓으므로 스레드 풀로도 CPU 코어를 나눠 쓸 수 있음
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+# 실행 중 + 대기 중인 작업 상한 (초과 시 즉시 503)
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32"))
+PASSWORD_HASH_RETRY_AFTER = 1
+
+class PasswordHasher:
+    """bcrypt 해시/검증을 전용 스레드 풀에서 실행
+
+    로그인 폭주 시 이벤트 루프가 bcrypt 연산에 묶여 다른 API까지 멈추는 것을 막고,
+    대기열이 가득 차면 요청을 쌓아두지 않고 503으로 빠르게 거절한다.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hasher")
+        self._pending = 0  # 이벤트 루프 스레드에서만 변경
+        self.rejected = 0
+        self.queue_wait = LatencyStats()
+        self.hash_time = LatencyStats()
+        self.verify_time = LatencyStats()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, self.hash_time, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, self.verify_time, plain_password, hashed_password)
+
+    async def _run(self, func, stats: LatencyStats, *args):
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many authentication requests, try again later",
+                headers={"Retry-After": str(PASSWORD_HASH_RETRY_AFTER)}
+            )
+
+        submitted = time.perf_counter()
+
+        def timed():
+            started = time.perf_counter()
+            self.queue_wait.record(started - submitted)
+            try:
+                return func(*args)
+            finally:
+                stats.record(time.perf_counter() - started)
+
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, timed)
+        finally:
+            self._pending -= 1
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            "rejected": self.rejected,
+            "queue_wait": self.queue_wait.snapshot(),
+            "hash": self.hash_time.snapshot(),
+            "verify": self.verify_time.snapshot(),
+        }
+
+password_hasher = PasswordHasher(PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_PENDING)
@@ -0,0 +1,25 @@
+import os
+import hashlib
+from typing import Optional
+from lib.ttl_cache import TTLCache
+
+ACCESS_TOKEN_CACHE_SIZE = int(os.getenv("ACCESS_TOKEN_CACHE_SIZE", "10000"))  # 0이면 비활성화
+
+class AccessTokenCache(TTLCache):
+    """검증이 끝난 Access Token의 클레임을 만료 시각까지 보관하는 LRU 캐시
+
+    같은 AT로 들어오는 반복 요청에서 jwt.decode(base64, JSON 파싱, HMAC)를 생략한다.
+    키는 토큰 원문 대신 다이제스트를 사용한다.
+    """
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        return super().get(self._key(token))
+
+    def put(self, token: str, claims: dict, expires_at: float):
+        super().put(self._key(token), claims, expires_at)
+
+access_token_cache = AccessTokenCache(ACCESS_TOKEN_CACHE_SIZE)
\ No newline at end of file
@@ -1,6 +1,14 @@
+import asyncio
 from fastapi import FastAPI
-from infra.database import create_tables
-from routers import auth_router, board_router, post_router
+from infra.database import create_tables_async, dispose_engines
+from infra.redis_client import ping_redis, close_redis
+from infra.scheduler import scheduler, SCHEDULER_ENABLED
+from lib.fast_json import fast_json
+from repositories.board_cache import board_cache
+from repositories.session_activity import session_activity
+from repositories.session_denylist import session_denylist
+from services.job_service import job_service
+from routers import auth_router, board_router, post_router, internal_router
 
 app = FastAPI(
     title="커뮤니티 API",
@@ -8,12 +16,31 @@ app = FastAPI(
 )
 
 app.include_router(auth_router.router)
-app.include_router(board_router.router)
-app.include_router(post_router.router)
+# 목록 응답이 큰 라우터는 검증 후 pydantic-core로 바로 JSON bytes를 만드는 경로 사용 (출력 동일)
+app.include_router(fast_json(board_router.router))
+app.include_router(fast_json(post_router.router))
+app.include_router(internal_router.router)
 
 @app.on_event("startup")
 async def startup_event():
-    create_tables()
+    await create_tables_async()
+    app.state.board_cache_listener = asyncio.create_task(board_cache.listen_for_invalidations())
+    app.state.session_activity_pusher = asyncio.create_task(session_activity.run_pusher())
+    app.state.session_denylist_listener = asyncio.create_task(session_denylist.listen())
+    if SCHEDULER_ENABLED:
+        job_service.register()
+        scheduler.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    app.state.board_cache_listener.cancel()
+    app.state.session_activity_pusher.cancel()
+    app.state.session_denylist_listener.cancel()
+    # 버퍼에 남은 활동 시각은 종료 전에 Redis로 전송
+    await session_activity.push()
+    await scheduler.stop()
+    await close_redis()
+    await dispose_engines()
 
 @app.get("/")
 async def root():
@@ -21,4 +48,8 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    redis_ok = await ping_redis()
+    return {
+        "status": "healthy" if redis_ok else "degraded",
+        "redis": "ok" if redis_ok else "unavailable"
+    }
\ No newline at end of file
@@ -1,9 +1,11 @@
 import typer
-from commands import board_command, session_command
+from commands import board_command, session_command, db_command, seed_command
 
 app = typer.Typer()
 app.add_typer(board_command.app, name="board")
 app.add_typer(session_command.app, name="session")
+app.add_typer(db_command.app, name="db")
+app.command(name="seed")(seed_command.seed)
 
 if __name__ == "__main__":
     app()
\ No newline at end of file
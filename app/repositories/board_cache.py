@@ -0,0 +1,283 @@
+import os
+import json
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+from redis.exceptions import RedisError
+from entities.board import Board
+from infra.redis_client import async_redis_client, redis_pipeline
+from lib.ttl_cache import TTLCache
+from schemas.board import BoardResponse
+
+logger = logging.getLogger(__name__)
+
+BOARD_CACHE_TTL = int(os.getenv("BOARD_CACHE_TTL", "300"))  # Redis 계층 (초)
+BOARD_LOCAL_CACHE_TTL = int(os.getenv("BOARD_LOCAL_CACHE_TTL", "30"))  # 워커 메모리 계층 (초), pub/sub 유실 대비
+BOARD_LOCAL_CACHE_SIZE = int(os.getenv("BOARD_LOCAL_CACHE_SIZE", "10000"))
+
+@dataclass(frozen=True, slots=True)
+class BoardMeta:
+    """캐시에 저장하고 목록 조회에도 쓰는 게시판 메타데이터 (BoardResponse와 같은 필드)"""
+    id: int
+    name: str
+    public: bool
+    owner_id: int
+    post_count: int
+    created_at: Optional[datetime]
+
+    @classmethod
+    def from_entity(cls, board: Board) -> "BoardMeta":
+        return cls(
+            id=board.id,
+            name=board.name,
+            public=board.public,
+            owner_id=board.owner_id,
+            post_count=board.post_count,
+            created_at=board.created_at,
+        )
+
+    def to_response(self) -> BoardResponse:
+        """필드 타입이 같으므로 검증 없이 응답 모델로"""
+        return BoardResponse.model_construct(
+            id=self.id,
+            name=self.name,
+            public=self.public,
+            owner_id=self.owner_id,
+            post_count=self.post_count,
+            created_at=self.created_at,
+        )
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data["created_at"] = self.created_at.isoformat() if self.created_at else None
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "BoardMeta":
+        data = json.loads(raw)
+        if data["created_at"]:
+            data["created_at"] = datetime.fromisoformat(data["created_at"])
+        return cls(**data)
+
+class BoardCache:
+    """게시판 메타데이터 2단계 read-through 캐시 (워커 메모리 LRU → Redis → DB)
+
+    - 같은 게시판에 대한 동시 miss는 하나의 DB 조회를 공유 (single-flight)
+    - 수정/삭제 시 Redis 키를 지우고 pub/sub으로 모든 워커의 메모리 계층을 무효화
+    """
+    KEY_PREFIX = "board:meta:"
+    INVALIDATION_CHANNEL = "board:meta:invalidate"
+
+    def __init__(self):
+        self.local = TTLCache(BOARD_LOCAL_CACHE_SIZE)
+        self._inflight: Dict[int, asyncio.Future] = {}
+        # 로드 중에 무효화된 게시판은 로드 결과를 캐시에 쓰지 않도록 세대 번호로 구분
+        # (로드 중인 게시판만 기록하고 마지막 로드가 끝나면 지움)
+        self._loading: Dict[int, int] = {}
+        self._generations: Dict[int, int] = {}
+        self.redis_hits = 0
+        self.redis_misses = 0
+        self.db_loads = 0
+        self.singleflight_joins = 0
+        self.invalidations_received = 0
+
+    async def get_or_load(self, board_id: int, loader: Callable[[], Awaitable[Optional[Board]]]) -> Optional[BoardMeta]:
+        meta = self.local.get(board_id)
+        if meta is not None:
+            return meta
+
+        inflight = self._inflight.get(board_id)
+        if inflight is not None:
+            self.singleflight_joins += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[board_id] = future
+        try:
+            meta = await self._load(board_id, loader)
+            future.set_result(meta)
+            return meta
+        except BaseException as e:
+            future.set_exception(e)
+            # 대기자가 없으면 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        finally:
+            del self._inflight[board_id]
+
+    async def get_many_or_load(self, board_ids: Iterable[int], loader: Callable[[List[int]], Awaitable[Iterable[BoardMeta]]]) -> Dict[int, BoardMeta]:
+        """여러 게시판을 한 번에 조회 (메모리 → Redis MGET → loader로 나머지를 한 번에 DB 조회)
+        
+        없는 게시판은 결과에서 빠진다.
+        """
+        found: Dict[int, BoardMeta] = {}
+        missing = []
+        for board_id in dict.fromkeys(board_ids):
+            meta = self.local.get(board_id)
+            if meta is not None:
+                found[board_id] = meta
+            else:
+                missing.append(board_id)
+        if not missing:
+            return found
+
+        generations = self._begin_load(missing)
+        try:
+            found.update(await self._load_many(missing, generations, loader))
+        finally:
+            self._end_load(missing)
+        return found
+
+    async def _load_many(self, missing: List[int], generations: Dict[int, int], loader) -> Dict[int, BoardMeta]:
+        try:
+            raws = await async_redis_client.mget([f"{self.KEY_PREFIX}{board_id}" for board_id in missing])
+        except RedisError:
+            logger.warning("board cache: redis read failed", exc_info=True)
+            raws = [None] * len(missing)
+        
+        loaded = {}
+        for board_id, raw in zip(missing, raws):
+            if raw:
+                self.redis_hits += 1
+                loaded[board_id] = BoardMeta.from_json(raw)
+            else:
+                self.redis_misses += 1
+        
+        not_cached = [board_id for board_id in missing if board_id not in loaded]
+        if not_cached:
+            self.db_loads += 1
+            from_db = {meta.id: meta for meta in await loader(not_cached)}
+            fresh = [meta for board_id, meta in from_db.items() if self._is_fresh(board_id, generations[board_id])]
+            if fresh:
+                try:
+                    async with redis_pipeline() as pipe:
+                        for meta in fresh:
+                            pipe.set(f"{self.KEY_PREFIX}{meta.id}", meta.to_json(), ex=BOARD_CACHE_TTL)
+                except RedisError:
+                    logger.warning("board cache: redis write failed", exc_info=True)
+            loaded.update(from_db)
+        
+        expires_at = time.time() + BOARD_LOCAL_CACHE_TTL
+        for board_id, meta in loaded.items():
+            if self._is_fresh(board_id, generations[board_id]):
+                self.local.put(board_id, meta, expires_at)
+        return loaded
+
+    async def _load(self, board_id: int, loader) -> Optional[BoardMeta]:
+        generation = self._begin_load([board_id])[board_id]
+        try:
+            return await self._load_one(board_id, generation, loader)
+        finally:
+            self._end_load([board_id])
+
+    async def _load_one(self, board_id: int, generation: int, loader) -> Optional[BoardMeta]:
+        meta = await self._get_from_redis(board_id)
+        if meta is not None:
+            self.redis_hits += 1
+        else:
+            self.redis_misses += 1
+            board = await loader()
+            self.db_loads += 1
+            if board is None:
+                return None
+            meta = BoardMeta.from_entity(board)
+            if self._is_fresh(board_id, generation):
+                await self._set_in_redis(meta)
+
+        if self._is_fresh(board_id, generation):
+            self.local.put(board_id, meta, time.time() + BOARD_LOCAL_CACHE_TTL)
+        return meta
+
+    async def _get_from_redis(self, board_id: int) -> Optional[BoardMeta]:
+        try:
+            raw = await async_redis_client.get(f"{self.KEY_PREFIX}{board_id}")
+        except RedisError:
+            logger.warning("board cache: redis read failed", exc_info=True)
+            return None
+        return BoardMeta.from_json(raw) if raw else None
+
+    def _begin_load(self, board_ids: Iterable[int]) -> Dict[int, int]:
+        """로드 시작 표시, 게시판별 현재 세대 번호 반환"""
+        generations = {}
+        for board_id in board_ids:
+            self._loading[board_id] = self._loading.get(board_id, 0) + 1
+            generations[board_id] = self._generations.get(board_id, 0)
+        return generations
+
+    def _end_load(self, board_ids: Iterable[int]):
+        for board_id in board_ids:
+            remaining = self._loading[board_id] - 1
+            if remaining:
+                self._loading[board_id] = remaining
+            else:
+                del self._loading[board_id]
+                self._generations.pop(board_id, None)
+
+    def _is_fresh(self, board_id: int, generation: int) -> bool:
+        """로드를 시작한 뒤 무효화되지 않았는지"""
+        return self._generations.get(board_id, 0) == generation
+
+    async def _set_in_redis(self, meta: BoardMeta):
+        try:
+            await async_redis_client.set(f"{self.KEY_PREFIX}{meta.id}", meta.to_json(), ex=BOARD_CACHE_TTL)
+        except RedisError:
+            logger.warning("board cache: redis write failed", exc_info=True)
+
+    def evict_local(self, board_ids: Iterable[int]):
+        for board_id in board_ids:
+            if board_id in self._loading:
+                self._generations[board_id] = self._generations.get(board_id, 0) + 1
+            self.local.pop(board_id)
+
+    async def invalidate(self, *board_ids: int):
+        """Redis 계층 삭제 후 모든 워커(자기 자신 포함)에 무효화 전파"""
+        if not board_ids:
+            return
+        self.evict_local(board_ids)
+        try:
+            async with async_redis_client.pipeline(transaction=False) as pipe:
+                pipe.delete(*[f"{self.KEY_PREFIX}{board_id}" for board_id in board_ids])
+                pipe.publish(self.INVALIDATION_CHANNEL, ",".join(str(board_id) for board_id in board_ids))
+                await pipe.execute()
+        except RedisError:
+            logger.warning("board cache: invalidation publish failed", exc_info=True)
+
+    async def listen_for_invalidations(self):
+        """다른 워커의 수정/삭제 알림을 받아 메모리 계층 무효화 (startup에서 백그라운드 태스크로 실행)"""
+        while True:
+            pubsub = async_redis_client.pubsub()
+            try:
+                await pubsub.subscribe(self.INVALIDATION_CHANNEL)
+                # 구독이 끊긴 동안 놓친 알림이 있을 수 있으므로 새로 구독하면 메모리 계층을 비움
+                self.local.clear()
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    self.invalidations_received += 1
+                    self.evict_local(int(board_id) for board_id in message["data"].split(",") if board_id)
+            except asyncio.CancelledError:
+                raise
+            except (RedisError, OSError):
+                logger.warning("board cache: invalidation listener disconnected, retrying", exc_info=True)
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    def stats(self) -> dict:
+        redis_requests = self.redis_hits + self.redis_misses
+        return {
+            "local": self.local.stats(),
+            "redis": {
+                "hits": self.redis_hits,
+                "misses": self.redis_misses,
+                "hit_rate": round(self.redis_hits / redis_requests, 4) if redis_requests else 0.0,
+            },
+            "db_loads": self.db_loads,
+            "singleflight_joins": self.singleflight_joins,
+            "invalidations_received": self.invalidations_received,
+        }
+
+board_cache = BoardCache()
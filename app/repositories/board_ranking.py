@@ -0,0 +1,136 @@
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+from redis.exceptions import RedisError
+from infra.redis_client import async_redis_client, redis_pipeline
+
+logger = logging.getLogger(__name__)
+
+# score = post_count * ID_SPACE + (ID_SPACE - 1 - id)
+# 한 번의 ZREVRANGEBYSCORE로 (post_count DESC, id ASC) 순서가 되도록 id를 하위 비트에 넣음
+# (boards.id는 INTEGER이므로 2^31 미만, double 정밀도 안에서 post_count 약 400만까지 정확)
+ID_SPACE = 2 ** 31
+
+# 기존 멤버의 score를 유지한 채 다른 키로 옮김 (없으면 DB 값 기준 score로 추가)
+# KEYS: from, to / ARGV: member, fallback_score
+MOVE_SCRIPT = """
+local score = redis.call('ZSCORE', KEYS[1], ARGV[1]) or ARGV[2]
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('ZADD', KEYS[2], score, ARGV[1])
+return 1
+"""
+
+class BoardRanking:
+    """게시판 목록 정렬용 Redis sorted set 인덱스
+
+    - board:rank:public: 모든 공개 게시판
+    - board:rank:owner:{owner_id}: 해당 사용자의 비공개 게시판
+    접근 가능한 게시판 = 공개 게시판 ∪ 내 비공개 게시판이므로 두 키만 읽어서 합치면 된다.
+    게시글 생성/삭제 시 score를 바로 증감하므로 post_count 동기화를 기다리지 않고 순위가 반영된다.
+    """
+    PUBLIC_KEY = "board:rank:public"
+    OWNER_KEY_PREFIX = "board:rank:owner:"
+    # 재구성이 끝난 뒤에만 설정, 없으면 목록 조회는 SQL 경로 사용
+    READY_KEY = "board:rank:ready"
+
+    def __init__(self):
+        self._move = async_redis_client.register_script(MOVE_SCRIPT)
+        self.served = 0
+        self.fallbacks = 0
+
+    def key(self, public: bool, owner_id: int) -> str:
+        return self.PUBLIC_KEY if public else f"{self.OWNER_KEY_PREFIX}{owner_id}"
+
+    @staticmethod
+    def score(post_count: int, board_id: int) -> int:
+        return post_count * ID_SPACE + (ID_SPACE - 1 - board_id)
+
+    @staticmethod
+    def post_count_from_score(score: float) -> int:
+        return int(score) // ID_SPACE
+
+    async def page(self, user_id: int, limit: int, cursor_post_count: Optional[int] = None, cursor_id: Optional[int] = None) -> Optional[List[Tuple[int, int]]]:
+        """cursor 이후 (board_id, post_count) 목록, 인덱스가 준비되지 않았거나 Redis 오류면 None"""
+        upper = "+inf"
+        if cursor_post_count is not None and cursor_id is not None:
+            upper = f"({self.score(cursor_post_count, cursor_id)}"
+
+        try:
+            async with async_redis_client.pipeline(transaction=False) as pipe:
+                pipe.exists(self.READY_KEY)
+                for key in (self.PUBLIC_KEY, self.key(False, user_id)):
+                    pipe.zrevrangebyscore(key, upper, "-inf", start=0, num=limit, withscores=True)
+                ready, public, private = await pipe.execute()
+        except RedisError:
+            logger.warning("board ranking: read failed", exc_info=True)
+            ready = False
+
+        if not ready:
+            self.fallbacks += 1
+            return None
+
+        self.served += 1
+        merged = sorted(public + private, key=lambda item: item[1], reverse=True)[:limit]
+        return [(int(member), self.post_count_from_score(score)) for member, score in merged]
+
+    async def add(self, board_id: int, public: bool, owner_id: int, post_count: int = 0):
+        try:
+            await async_redis_client.zadd(self.key(public, owner_id), {str(board_id): self.score(post_count, board_id)})
+        except RedisError:
+            logger.warning("board ranking: add failed", exc_info=True)
+
+    async def move(self, board_id: int, owner_id: int, was_public: bool, public: bool, post_count: int):
+        """공개 여부 변경 시 다른 키로 이동 (실시간 score 유지)"""
+        if was_public == public:
+            return
+        try:
+            await self._move(
+                keys=[self.key(was_public, owner_id), self.key(public, owner_id)],
+                args=[str(board_id), self.score(post_count, board_id)]
+            )
+        except RedisError:
+            logger.warning("board ranking: move failed", exc_info=True)
+
+    async def remove(self, board_id: int, public: bool, owner_id: int):
+        try:
+            await async_redis_client.zrem(self.key(public, owner_id), str(board_id))
+        except RedisError:
+            logger.warning("board ranking: remove failed", exc_info=True)
+
+    def increment(self, pipe, board_id: int, public: bool, owner_id: int, amount: int):
+        """게시글 수 증감을 score에 반영 (pipe에 적재, 인덱스에 없는 게시판은 무시)"""
+        pipe.zadd(self.key(public, owner_id), {str(board_id): amount * ID_SPACE}, xx=True, incr=True)
+
+    async def rebuild(self, boards: Iterable[Tuple[int, bool, int, int]], pending_deltas: Dict[int, int], chunk_size: int = 5000) -> int:
+        """(id, public, owner_id, post_count) 목록과 아직 DB에 반영되지 않은 증감량으로 인덱스 재구성
+
+        재구성 중에는 READY_KEY를 지워서 목록 조회가 SQL 경로를 사용하도록 한다.
+        """
+        await async_redis_client.delete(self.READY_KEY)
+        stale = [key async for key in async_redis_client.scan_iter(match=f"{self.OWNER_KEY_PREFIX}*", count=1000)]
+        await async_redis_client.delete(self.PUBLIC_KEY, *stale)
+
+        count = 0
+        pending: Dict[str, Dict[str, int]] = {}
+        for board_id, public, owner_id, post_count in boards:
+            post_count = max(0, post_count + pending_deltas.get(board_id, 0))
+            pending.setdefault(self.key(public, owner_id), {})[str(board_id)] = self.score(post_count, board_id)
+            count += 1
+            if count % chunk_size == 0:
+                await self._flush(pending)
+                pending = {}
+        await self._flush(pending)
+
+        await async_redis_client.set(self.READY_KEY, "1")
+        return count
+
+    async def _flush(self, pending: Dict[str, Dict[str, int]]):
+        if not pending:
+            return
+        async with redis_pipeline() as pipe:
+            for key, members in pending.items():
+                pipe.zadd(key, members)
+
+    def stats(self) -> dict:
+        return {"served": self.served, "fallbacks": self.fallbacks}
+
+board_ranking = BoardRanking()
@@ -1,71 +1,176 @@
+from dataclasses import replace
 from typing import List, Optional, Dict
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_
+from sqlalchemy import select, update, case, desc, and_, union_all
 from entities.board import Board
 from entities.post import Post
-from infra.redis_client import redis_client
+from infra.database import DBSession, db_execute, db_scalar, db_commit, db_refresh, db_delete
+from infra.redis_client import redis_pipeline
+from repositories.board_cache import board_cache, BoardMeta
+from repositories.board_ranking import board_ranking
+from repositories.post_count_sync import post_count_sync, PostCountSyncResult
+from repositories.post_page_cache import post_page_cache
+from schemas.board import BoardResponse
+
+boards_table = Board.__table__
+# 목록 응답(BoardResponse)에 필요한 컬럼만 조회 (BoardMeta와 같은 순서)
+BOARD_LIST_COLUMNS = (
+    boards_table.c.id, boards_table.c.name, boards_table.c.public,
+    boards_table.c.owner_id, boards_table.c.post_count, boards_table.c.created_at,
+)
 
 class BoardRepository:
     POST_COUNT_PREFIX = "board:post_count:"
     
-    def create_board(self, db: Session, name: str, public: bool, owner_id: int) -> Board:
+    async def create_board(self, db: DBSession, name: str, public: bool, owner_id: int) -> Board:
         board = Board(name=name, public=public, owner_id=owner_id)
         db.add(board)
-        db.commit()
-        db.refresh(board)
+        await db_commit(db)
+        await db_refresh(db, board)
+        await board_ranking.add(board.id, board.public, board.owner_id, board.post_count)
         return board
     
-    def get_board_by_id(self, db: Session, board_id: int) -> Optional[Board]:
-        return db.query(Board).filter(Board.id == board_id).first()
+    async def get_board_by_id(self, db: DBSession, board_id: int) -> Optional[Board]:
+        return await db_scalar(db, select(Board).where(Board.id == board_id))
+    
+    async def get_board_meta(self, db: DBSession, board_id: int) -> Optional[BoardMeta]:
+        """권한 확인/조회용 게시판 메타데이터 (메모리 → Redis → DB 순으로 조회)"""
+        return await board_cache.get_or_load(board_id, lambda: self.get_board_by_id(db, board_id))
+    
+    async def get_board_metas(self, db: DBSession, board_ids: List[int]) -> Dict[int, BoardMeta]:
+        """여러 게시판 메타데이터를 한 번에 조회 (캐시에 없는 게시판만 IN 쿼리 한 번), 없는 게시판은 제외"""
+        return await board_cache.get_many_or_load(board_ids, lambda missing: self.get_boards_by_ids(db, missing))
+    
+    async def get_board_by_name(self, db: DBSession, name: str) -> Optional[Board]:
+        return await db_scalar(db, select(Board).where(Board.name == name))
+    
+    async def get_boards_by_ids(self, db: DBSession, board_ids: List[int]) -> List[BoardMeta]:
+        """ID 목록으로 한 번에 조회 (순서 보장 안 함)"""
+        if not board_ids:
+            return []
+        result = await db_execute(db, select(*BOARD_LIST_COLUMNS).where(boards_table.c.id.in_(board_ids)))
+        return [BoardMeta(*row) for row in result]
+    
+    async def get_ranked_boards(self, db: DBSession, user_id: int, limit: int = 20, cursor_post_count: Optional[int] = None, cursor_id: Optional[int] = None) -> Optional[List[BoardResponse]]:
+        """Redis 순위 인덱스로 페이지를 구한 뒤 한 번의 쿼리로 채움 (인덱스를 쓸 수 없으면 None)
+        
+        post_count는 아직 동기화되지 않은 증감량까지 반영된 순위 인덱스 값으로 응답한다.
+        """
+        ranked = await board_ranking.page(user_id, limit, cursor_post_count, cursor_id)
+        if ranked is None:
+            return None
+        
+        boards = {board.id: board for board in await self.get_boards_by_ids(db, [board_id for board_id, _ in ranked])}
+        return [
+            replace(boards[board_id], post_count=post_count).to_response()
+            for board_id, post_count in ranked
+            if board_id in boards
+        ]
+    
+    async def get_accessible_boards(self, db: DBSession, user_id: int, limit: int = 20, cursor_post_count: Optional[int] = None, cursor_id: Optional[int] = None) -> List[BoardResponse]:
+        """(post_count DESC, id) keyset 페이지네이션
+        
+        공개 게시판과 내 게시판을 각각 인덱스 순서로 limit개씩만 읽은 뒤 합쳐서 정렬하므로
+        페이지 깊이와 무관하게 최대 4 * limit 행만 읽는다.
+        읽기 전용 목록이므로 ORM 인스턴스 대신 응답 컬럼만 조회해서 검증 없이 응답 모델로 반환한다.
+        """
+        public_q, mine_q = self._accessible_queries(user_id)
+        streams = [
+            select(ranked.subquery())
+            for q in (public_q, mine_q)
+            for ranked in self._ranked_after_cursor(q, limit, cursor_post_count, cursor_id)
+        ]
+        accessible = union_all(*streams).subquery()
+        result = await db_execute(db, select(accessible)\
+            .order_by(desc(accessible.c.post_count), accessible.c.id)\
+            .limit(limit))
+        return [BoardResponse.model_construct(**row._mapping) for row in result]
     
-    def get_board_by_name(self, db: Session, name: str) -> Optional[Board]:
-        return db.query(Board).filter(Board.name == name).first()
+    @staticmethod
+    def _accessible_queries(user_id: int) -> tuple:
+        """남의 공개 게시판, 내 게시판 (겹치지 않으므로 UNION ALL로 합침)"""
+        return (
+            select(*BOARD_LIST_COLUMNS).where(and_(boards_table.c.public.is_(True), boards_table.c.owner_id != user_id)),
+            select(*BOARD_LIST_COLUMNS).where(boards_table.c.owner_id == user_id),
+        )
     
-    def get_accessible_boards(self, db: Session, user_id: int, limit: int = 20, offset: int = 0) -> List[Board]:
-        public_q = db.query(Board).filter(and_(Board.public.is_(True), Board.owner_id != user_id))
-        mine_q = db.query(Board).filter(Board.owner_id == user_id)
+    @staticmethod
+    def _ranked_after_cursor(query, limit: int, cursor_post_count: Optional[int], cursor_id: Optional[int]) -> list:
+        """cursor 이후 limit개를 인덱스 순서로 읽는 쿼리 목록
         
-        return public_q.union_all(mine_q)\
-            .order_by(desc(Board.post_count), Board.id)\
-            .limit(limit).offset(offset).all()
+        정렬 방향이 섞인 (post_count DESC, id ASC)는 하나의 범위 조건으로 표현할 수 없어서
+        같은 post_count의 나머지(id > cursor_id)와 더 작은 post_count를 각각 범위 스캔으로 읽는다.
+        """
+        order = (desc(boards_table.c.post_count), boards_table.c.id)
+        if cursor_post_count is None or cursor_id is None:
+            return [query.order_by(*order).limit(limit)]
+        return [
+            query.where(boards_table.c.post_count == cursor_post_count, boards_table.c.id > cursor_id).order_by(*order).limit(limit),
+            query.where(boards_table.c.post_count < cursor_post_count).order_by(*order).limit(limit),
+        ]
     
-    def update_board(self, db: Session, board: Board, name: str = None, public: bool = None) -> Board:
+    async def get_accessible_boards_by_offset(self, db: DBSession, user_id: int, limit: int = 20, offset: int = 0) -> List[BoardResponse]:
+        """OFFSET 페이지네이션 (deprecated, 깊은 페이지일수록 느려짐)"""
+        accessible = union_all(*self._accessible_queries(user_id)).subquery()
+        result = await db_execute(db, select(accessible)\
+            .order_by(desc(accessible.c.post_count), accessible.c.id)\
+            .limit(limit).offset(offset))
+        return [BoardResponse.model_construct(**row._mapping) for row in result]
+    
+    async def update_board(self, db: DBSession, board: Board, name: str = None, public: bool = None) -> Board:
+        was_public = board.public
         if name is not None:
             board.name = name
         if public is not None:
             board.public = public
-        db.commit()
-        db.refresh(board)
+        await db_commit(db)
+        await db_refresh(db, board)
+        await board_cache.invalidate(board.id)
+        await board_ranking.move(board.id, board.owner_id, was_public, board.public, board.post_count)
         return board
     
-    def delete_board(self, db: Session, board: Board):
-        db.delete(board)
-        db.commit()
+    async def delete_board(self, db: DBSession, board: Board):
+        board_id, public, owner_id = board.id, board.public, board.owner_id
+        await db_delete(db, board)
+        await db_commit(db)
+        await board_cache.invalidate(board_id)
+        await board_ranking.remove(board_id, public, owner_id)
+        await post_page_cache.drop(board_id)
     
-    def increment_post_count_delta(self, board_id: int) -> None:
-        """Redis에 게시글 수 증가 기록"""
-        redis_client.hincrby("board:post_count", str(board_id), 1)
+    async def increment_post_count_delta(self, board: BoardMeta, pipe=None) -> None:
+        """Redis에 게시글 수 증가 기록 (pipe가 주어지면 파이프라인에 적재만 함)"""
+        await self._apply_post_count_delta(board, 1, pipe)
     
-    def decrement_post_count_delta(self, board_id: int) -> None:
-        """Redis에 게시글 수 감소 기록"""
-        redis_client.hincrby("board:post_count", str(board_id), -1)
+    async def decrement_post_count_delta(self, board: BoardMeta, pipe=None) -> None:
+        """Redis에 게시글 수 감소 기록 (pipe가 주어지면 파이프라인에 적재만 함)"""
+        await self._apply_post_count_delta(board, -1, pipe)
     
-    def get_all_post_count_deltas(self) -> Dict[int, int]:
-        """모든 게시판의 증감량 조회"""
-        deltas_str = redis_client.hgetall("board:post_count")
-        return {int(board_id): int(delta) for board_id, delta in deltas_str.items() if int(delta) != 0}
+    async def _apply_post_count_delta(self, board: BoardMeta, amount: int, pipe=None) -> None:
+        # DB 동기화용 증감량과 순위 인덱스 score를 같은 왕복으로 갱신
+        if pipe is None:
+            async with redis_pipeline() as pipe:
+                await self._apply_post_count_delta(board, amount, pipe)
+            return
+        pipe.hincrby("board:post_count", str(board.id), amount)
+        board_ranking.increment(pipe, board.id, board.public, board.owner_id, amount)
     
-    def update_board_post_counts(self, db: Session) -> None:
-        """Redis 증감량을 읽어서 DB의 post_count 업데이트"""
-        deltas = self.get_all_post_count_deltas()
-        
-        for board_id, delta in deltas.items():
-            board = self.get_board_by_id(db, board_id)
-            if board:
-                board.post_count = max(0, board.post_count + delta)
-        
-        if deltas:
-            redis_client.delete("board:post_count")
-            db.commit()
+    async def apply_post_count_delta_to_db(self, db: DBSession, board_id: int, amount: int) -> None:
+        """Redis에 기록하지 못한 게시글 수 증감을 DB post_count에 바로 반영 (Redis 장애 시 대체 경로)"""
+        new_count = Board.post_count + amount
+        await db_execute(db, update(Board).where(Board.id == board_id).values(post_count=case((new_count < 0, 0), else_=new_count)))
+        await db_commit(db)
+    
+    async def get_all_post_count_deltas(self) -> Dict[int, int]:
+        """모든 게시판의 DB 미반영 증감량 조회"""
+        return await post_count_sync.pending_deltas()
+    
+    async def update_board_post_counts(self, db: DBSession) -> PostCountSyncResult:
+        """Redis 증감량을 스냅샷으로 떼어내 chunk 단위 set 기반 UPDATE로 DB의 post_count에 반영"""
+        return await post_count_sync.run(db)
+    
+    async def rebuild_ranking(self, db: DBSession) -> int:
+        """DB의 post_count와 아직 동기화되지 않은 증감량으로 Redis 순위 인덱스 재구성"""
+        result = await db_execute(db, select(Board.id, Board.public, Board.owner_id, Board.post_count))
+        deltas = await self.get_all_post_count_deltas()
+        return await board_ranking.rebuild(result.all(), deltas)
 
 board_repository = BoardRepository()
\ No newline at end of file
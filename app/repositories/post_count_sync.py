@@ -0,0 +1,117 @@
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from sqlalchemy import Integer, bindparam, case, column, delete, select, update, values
+from entities.board import Board
+from entities.post_count_sync import PostCountSyncBatch
+from infra.database import DBSession, db_execute, db_scalars, db_commit, db_rollback
+from infra.redis_client import async_redis_client, redis_pipeline
+from repositories.board_cache import board_cache
+
+POST_COUNT_SYNC_CHUNK_SIZE = int(os.getenv("POST_COUNT_SYNC_CHUNK_SIZE", "5000"))
+
+# 진행 중인 스냅샷이 있으면 그대로 반환 (이전 실행이 중단된 경우),
+# 없으면 증감량 해시를 새 스냅샷 키로 RENAME. 이후 HINCRBY는 새 해시에 쌓이므로 유실되지 않음
+# KEYS: live, pointer / ARGV: new_snapshot_key
+SNAPSHOT_SCRIPT = """
+local current = redis.call('GET', KEYS[2])
+if current then return current end
+if redis.call('EXISTS', KEYS[1]) == 0 then return false end
+redis.call('RENAME', KEYS[1], ARGV[1])
+redis.call('SET', KEYS[2], ARGV[1])
+return ARGV[1]
+"""
+
+@dataclass
+class PostCountSyncResult:
+    sync_id: Optional[str]
+    boards: int  # 증감량이 반영된 게시판 수 (이전 실행에서 반영된 chunk 제외)
+    chunks: int
+    skipped_chunks: int  # 중단된 이전 실행에서 이미 반영된 chunk
+    seconds: float
+
+class PostCountSync:
+    """Redis 게시글 수 증감량을 DB post_count에 반영
+
+    1. 증감량 해시를 스냅샷 키로 원자적으로 RENAME (동기화 중 들어오는 증감량은 새 해시로)
+    2. 게시판 ID 순으로 chunk를 나눠 chunk마다 set 기반 UPDATE 한 번 + 반영 기록을 같은 트랜잭션으로 커밋
+    3. 모두 반영되면 스냅샷 키 삭제
+    중간에 중단되면 다음 실행이 같은 스냅샷을 이어서 처리하고, 기록된 chunk는 건너뛴다.
+    """
+    LIVE_KEY = "board:post_count"
+    POINTER_KEY = "board:post_count:sync"
+    SNAPSHOT_PREFIX = "board:post_count:sync:"
+
+    def __init__(self, chunk_size: int = POST_COUNT_SYNC_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self._snapshot = async_redis_client.register_script(SNAPSHOT_SCRIPT)
+
+    async def run(self, db: DBSession) -> PostCountSyncResult:
+        started = time.perf_counter()
+        snapshot_key = await self._snapshot(
+            keys=[self.LIVE_KEY, self.POINTER_KEY],
+            args=[f"{self.SNAPSHOT_PREFIX}{uuid.uuid4().hex}"]
+        )
+        if not snapshot_key:
+            return PostCountSyncResult(None, 0, 0, 0, time.perf_counter() - started)
+
+        sync_id = snapshot_key[len(self.SNAPSHOT_PREFIX):]
+        raw = await async_redis_client.hgetall(snapshot_key)
+        deltas = sorted((int(board_id), int(delta)) for board_id, delta in raw.items() if int(delta) != 0)
+        chunks = [deltas[i:i + self.chunk_size] for i in range(0, len(deltas), self.chunk_size)]
+
+        applied = set(await db_scalars(db, select(PostCountSyncBatch.chunk).where(PostCountSyncBatch.sync_id == sync_id)))
+        boards = 0
+        for index, chunk in enumerate(chunks):
+            if index in applied:
+                continue
+            try:
+                await self._apply_chunk(db, chunk)
+                db.add(PostCountSyncBatch(sync_id=sync_id, chunk=index, boards=len(chunk)))
+                await db_commit(db)
+            except BaseException:
+                await db_rollback(db)
+                raise
+            boards += len(chunk)
+            await board_cache.invalidate(*[board_id for board_id, _ in chunk])
+
+        # 스냅샷을 먼저 지워야 재실행 시 다시 반영되지 않음 (반영 기록은 그 다음에 정리)
+        async with redis_pipeline(transaction=True) as pipe:
+            pipe.delete(snapshot_key, self.POINTER_KEY)
+        await db_execute(db, delete(PostCountSyncBatch).where(PostCountSyncBatch.sync_id == sync_id))
+        await db_commit(db)
+
+        return PostCountSyncResult(sync_id, boards, len(chunks), len(applied), time.perf_counter() - started)
+
+    async def _apply_chunk(self, db: DBSession, chunk: List[Tuple[int, int]]):
+        if db.get_bind().dialect.name == "postgresql":
+            # UPDATE boards ... FROM (VALUES (id, delta), ...) 한 문장
+            deltas = values(column("id", Integer), column("delta", Integer), name="deltas").data(chunk)
+            new_count = Board.post_count + deltas.c.delta
+            await db_execute(db, update(Board)
+                .where(Board.id == deltas.c.id)
+                .values(post_count=case((new_count < 0, 0), else_=new_count))
+                .execution_options(synchronize_session=False))
+            return
+
+        # SQLite는 VALUES 별칭에 컬럼 목록을 쓸 수 없으므로 executemany (프로세스 내 호출이라 왕복 비용 없음)
+        boards = Board.__table__
+        new_count = boards.c.post_count + bindparam("delta", type_=Integer)
+        await db_execute(
+            db,
+            update(boards).where(boards.c.id == bindparam("board_id")).values(post_count=case((new_count < 0, 0), else_=new_count)),
+            [{"board_id": board_id, "delta": delta} for board_id, delta in chunk]
+        )
+
+    async def pending_deltas(self) -> dict:
+        """아직 DB에 반영되지 않은 증감량 (진행 중인 스냅샷 포함)"""
+        snapshot_key = await async_redis_client.get(self.POINTER_KEY)
+        totals = {}
+        for key in filter(None, (self.LIVE_KEY, snapshot_key)):
+            for board_id, delta in (await async_redis_client.hgetall(key)).items():
+                totals[int(board_id)] = totals.get(int(board_id), 0) + int(delta)
+        return {board_id: delta for board_id, delta in totals.items() if delta != 0}
+
+post_count_sync = PostCountSync()
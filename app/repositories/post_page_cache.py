@@ -0,0 +1,234 @@
+import os
+import time
+import logging
+from datetime import datetime, timezone, timedelta
+from typing import List, Optional
+from redis.exceptions import RedisError
+from entities.post import Post
+from infra.redis_client import async_redis_client
+from schemas.post import PostResponse
+
+logger = logging.getLogger(__name__)
+
+# 게시판별로 캐시하는 최신 게시글 수 (목록 API의 최대 limit 이상)
+POST_PAGE_CACHE_SIZE = int(os.getenv("POST_PAGE_CACHE_SIZE", "100"))
+POST_PAGE_CACHE_TTL = int(os.getenv("POST_PAGE_CACHE_TTL", "3600"))
+
+EPOCH = datetime(1970, 1, 1)
+
+# KEYS: window, data, state, version / ARGV: 상한 정렬 키(ZREVRANGEBYLEX max), limit
+# 반환: {"miss"} 또는 {"hit", payload...}
+READ_SCRIPT = """
+local has_more = redis.call('HGET', KEYS[3], 'has_more')
+if not has_more then return {'miss'} end
+local limit = tonumber(ARGV[2])
+local members = redis.call('ZREVRANGEBYLEX', KEYS[1], ARGV[1], '-', 'LIMIT', 0, limit)
+if #members < limit and has_more == '1' then return {'miss'} end
+if #members == 0 then return {'hit'} end
+local payloads = redis.call('HMGET', KEYS[2], unpack(members))
+local result = {'hit'}
+for i, payload in ipairs(payloads) do
+    if not payload then return {'miss'} end
+    result[i + 1] = payload
+end
+return result
+"""
+
+# 쓰기 버전 키가 없으면 현재 시각(마이크로초)에서 시작해서 키가 만료된 뒤 다시 만들어져도 이전 값과 겹치지 않게 함
+# (ETag 검증자로 쓰므로 0부터 다시 세면 만료 전 버전과 같은 값이 나올 수 있음)
+
+# ARGV: expected_version, has_more, ttl, version_base, member1, payload1, ...
+WARM_SCRIPT = """
+local version = redis.call('GET', KEYS[4]) or '0'
+if version ~= ARGV[1] then return 0 end
+if version == '0' then redis.call('SET', KEYS[4], ARGV[4], 'EX', ARGV[3]) end
+redis.call('DEL', KEYS[1], KEYS[2], KEYS[3])
+for i = 5, #ARGV, 2 do
+    redis.call('ZADD', KEYS[1], 0, ARGV[i])
+    redis.call('HSET', KEYS[2], ARGV[i], ARGV[i + 1])
+end
+redis.call('HSET', KEYS[3], 'has_more', ARGV[2])
+for i = 1, 3 do redis.call('EXPIRE', KEYS[i], ARGV[3]) end
+return 1
+"""
+
+# ARGV: member, payload, max_size, ttl, version_base
+ADD_SCRIPT = """
+if redis.call('EXISTS', KEYS[4]) == 0 then redis.call('SET', KEYS[4], ARGV[5]) end
+redis.call('INCR', KEYS[4])
+redis.call('EXPIRE', KEYS[4], ARGV[4])
+if redis.call('EXISTS', KEYS[3]) == 0 then return 0 end
+redis.call('ZADD', KEYS[1], 0, ARGV[1])
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[2])
+local overflow = redis.call('ZCARD', KEYS[1]) - tonumber(ARGV[3])
+if overflow > 0 then
+    local trimmed = redis.call('ZRANGE', KEYS[1], 0, overflow - 1)
+    redis.call('ZREMRANGEBYRANK', KEYS[1], 0, overflow - 1)
+    redis.call('HDEL', KEYS[2], unpack(trimmed))
+    redis.call('HSET', KEYS[3], 'has_more', '1')
+end
+return 1
+"""
+
+# ARGV: member, payload (빈 문자열이면 삭제), ttl, version_base
+REPLACE_SCRIPT = """
+if redis.call('EXISTS', KEYS[4]) == 0 then redis.call('SET', KEYS[4], ARGV[4]) end
+redis.call('INCR', KEYS[4])
+redis.call('EXPIRE', KEYS[4], ARGV[3])
+if ARGV[2] == '' then
+    redis.call('ZREM', KEYS[1], ARGV[1])
+    redis.call('HDEL', KEYS[2], ARGV[1])
+elseif redis.call('HEXISTS', KEYS[2], ARGV[1]) == 1 then
+    redis.call('HSET', KEYS[2], ARGV[1], ARGV[2])
+end
+return 1
+"""
+
+def ordering_member(created_at: datetime, post_id: int) -> str:
+    """(created_at, id) 순서를 그대로 따르는 사전순 정렬 키
+
+    모든 멤버를 score 0으로 넣고 ZREVRANGEBYLEX로 읽으므로 부동소수점 오차 없이
+    SQL의 ORDER BY created_at DESC, id DESC와 같은 순서가 된다.
+    """
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+    micros = (created_at - EPOCH) // timedelta(microseconds=1)
+    return f"{micros:020d}:{post_id:012d}"
+
+def version_base() -> int:
+    return time.time_ns() // 1000
+
+class PostPageCache:
+    """게시판별 최신 게시글 N개를 Redis에 유지하는 write-through 캐시
+
+    - window (ZSET): 정렬 키 목록, data (HASH): 정렬 키 → 직렬화된 PostResponse
+    - state (HASH): 캐시가 채워져 있는지와 window 밖에 더 오래된 글이 있는지(has_more)
+    - version: 쓰기마다 증가, 채우기 도중 쓰기가 끼어들면 채우기를 버림 (목록 ETag 검증자로도 사용)
+    - 커밋 후 캐시 갱신과 drop이 모두 실패한 게시판은 이 워커에서 dirty로 표시: 키가 지워졌음을 확인할 때까지
+      (다음 접근마다 다시 지워봄) 캐시 읽기/채우기와 쓰기 버전을 쓰지 않음 → 이전 버전 키로 304가 나가지 않고 SQL 기준 ETag 사용
+    """
+
+    def __init__(self):
+        self._read = async_redis_client.register_script(READ_SCRIPT)
+        self._warm = async_redis_client.register_script(WARM_SCRIPT)
+        self._add = async_redis_client.register_script(ADD_SCRIPT)
+        self._replace = async_redis_client.register_script(REPLACE_SCRIPT)
+        self.hits = 0
+        self.misses = 0
+        self._dirty = set()  # drop에 실패해서 이전 캐시 키가 남아 있을 수 있는 게시판
+
+    @staticmethod
+    def _keys(board_id: int) -> List[str]:
+        # 해시 태그로 같은 게시판의 키를 같은 슬롯에 배치 (Redis Cluster 대비)
+        prefix = f"board:posts:{{{board_id}}}"
+        return [f"{prefix}:window", f"{prefix}:data", f"{prefix}:state", f"{prefix}:version"]
+
+    @staticmethod
+    def serialize(post: Post) -> str:
+        return PostResponse.model_validate(post).model_dump_json()
+
+    async def get_page(self, board_id: int, limit: int, cursor_time: Optional[datetime] = None, cursor_id: Optional[int] = None) -> Optional[List[PostResponse]]:
+        """캐시로 응답 가능하면 게시글 목록, window를 벗어나거나 비어 있으면 None"""
+        if not await self._ensure_clean(board_id):
+            self.misses += 1
+            return None
+        upper = f"({ordering_member(cursor_time, cursor_id)}" if cursor_time and cursor_id else "+"
+        try:
+            result = await self._read(keys=self._keys(board_id), args=[upper, limit])
+        except RedisError:
+            logger.warning("post page cache: read failed", exc_info=True)
+            return None
+
+        if result[0] != "hit":
+            self.misses += 1
+            return None
+        self.hits += 1
+        return [PostResponse.model_validate_json(payload) for payload in result[1:]]
+
+    async def get_version(self, board_id: int) -> Optional[str]:
+        """채우기 전에 읽어두는 쓰기 버전 (Redis 오류 또는 이전 키가 남아 있을 수 있으면 None → 채우기 생략)"""
+        if not await self._ensure_clean(board_id):
+            return None
+        try:
+            return await async_redis_client.get(self._keys(board_id)[3]) or "0"
+        except RedisError:
+            logger.warning("post page cache: version read failed", exc_info=True)
+            return None
+
+    async def get_write_version(self, board_id: int) -> Optional[str]:
+        """게시판의 게시글 쓰기 버전, 키가 없거나(만료) Redis 오류거나 이전 키가 남아 있을 수 있으면 None
+
+        키가 있는 동안은 게시판의 모든 게시글 생성/수정/삭제마다 값이 바뀌므로 목록 ETag 검증자로 쓸 수 있다.
+        """
+        if not await self._ensure_clean(board_id):
+            return None
+        try:
+            return await async_redis_client.get(self._keys(board_id)[3])
+        except RedisError:
+            logger.warning("post page cache: version read failed", exc_info=True)
+            return None
+
+    async def warm(self, board_id: int, version: str, posts: list, has_more: bool):
+        """SQL로 읽은 최신 게시글(PostResponse)로 window 채우기 (읽는 동안 쓰기가 있었으면 무시됨)"""
+        args = [version, "1" if has_more else "0", POST_PAGE_CACHE_TTL, version_base()]
+        for post in posts:
+            args += [ordering_member(post.created_at, post.id), self.serialize(post)]
+        try:
+            await self._warm(keys=self._keys(board_id), args=args)
+        except RedisError:
+            logger.warning("post page cache: warm failed", exc_info=True)
+
+    async def add(self, post: Post, pipe=None):
+        """새 게시글을 window 앞에 추가 (pipe가 주어지면 파이프라인에 적재)"""
+        await self._add(
+            keys=self._keys(post.board_id),
+            args=[ordering_member(post.created_at, post.id), self.serialize(post), POST_PAGE_CACHE_SIZE, POST_PAGE_CACHE_TTL, version_base()],
+            client=pipe
+        )
+
+    async def replace(self, post: Post, pipe=None):
+        """window 안의 게시글 내용을 갱신 (pipe가 주어지면 파이프라인에 적재)"""
+        await self._replace(
+            keys=self._keys(post.board_id),
+            args=[ordering_member(post.created_at, post.id), self.serialize(post), POST_PAGE_CACHE_TTL, version_base()],
+            client=pipe
+        )
+
+    async def remove(self, board_id: int, created_at: datetime, post_id: int, pipe=None):
+        """window에서 게시글 제거 (pipe가 주어지면 파이프라인에 적재)"""
+        await self._replace(
+            keys=self._keys(board_id),
+            args=[ordering_member(created_at, post_id), "", POST_PAGE_CACHE_TTL, version_base()],
+            client=pipe
+        )
+
+    async def drop(self, board_id: int):
+        """게시판 삭제 또는 커밋 후 캐시 갱신 실패 시 캐시 키 제거 (쓰기 버전 키도 지워서 ETag는 SQL 기준으로)
+
+        실패하면 dirty로 표시하고, 지워졌음을 확인할 때까지 이 게시판의 캐시와 쓰기 버전을 쓰지 않는다.
+        """
+        try:
+            await async_redis_client.delete(*self._keys(board_id))
+        except RedisError:
+            logger.warning("post page cache: drop failed for board %s, bypassing cache until dropped", board_id, exc_info=True)
+            self._dirty.add(board_id)
+            return False
+        self._dirty.discard(board_id)
+        return True
+
+    async def _ensure_clean(self, board_id: int) -> bool:
+        """이전 drop이 실패한 게시판이면 다시 지워보고, 키가 지워졌음을 확인했으면 True"""
+        if board_id not in self._dirty:
+            return True
+        return await self.drop(board_id)
+
+    def stats(self) -> dict:
+        requests = self.hits + self.misses
+        return {
+            "window_size": POST_PAGE_CACHE_SIZE,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / requests, 4) if requests else 0.0,
+        }
+
+post_page_cache = PostPageCache()
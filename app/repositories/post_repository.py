@@ -1,11 +1,48 @@
-from typing import List, Optional
+import os
+import logging
+from typing import AsyncIterator, List, Optional
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from sqlalchemy.engine import Row
+from redis.exceptions import RedisError
 from entities.post import Post
+from infra.database import DBSession, db_execute, db_scalar, db_stream, db_commit, db_refresh, db_delete
+from infra.redis_client import redis_pipeline
 from repositories.board_repository import board_repository
+from repositories.post_page_cache import post_page_cache, POST_PAGE_CACHE_SIZE
+from schemas.post import PostResponse, PostSummaryResponse
+
+logger = logging.getLogger(__name__)
+
+# view=summary 목록의 본문 앞부분 길이 (문자 수)
+POST_EXCERPT_LENGTH = int(os.getenv("POST_EXCERPT_LENGTH", "200"))
+# 게시판 내보내기에서 한 번에 fetch하는 행 수 (스트리밍 중 메모리 사용량 상한)
+POST_EXPORT_BATCH_SIZE = int(os.getenv("POST_EXPORT_BATCH_SIZE", "500"))
+
+posts_table = Post.__table__
+# 목록 응답(PostResponse)에 필요한 컬럼만 조회
+POST_LIST_COLUMNS = (
+    posts_table.c.id, posts_table.c.title, posts_table.c.content, posts_table.c.board_id,
+    posts_table.c.author_id, posts_table.c.created_at, posts_table.c.updated_at,
+)
+
+# 요약 목록(PostSummaryResponse)은 본문을 읽지 않고 SQL에서 앞부분만 잘라서 조회
+POST_SUMMARY_COLUMNS = (
+    posts_table.c.id, posts_table.c.title,
+    func.substr(posts_table.c.content, 1, POST_EXCERPT_LENGTH).label("excerpt"),
+    func.length(posts_table.c.content).label("content_length"),
+    posts_table.c.board_id, posts_table.c.author_id, posts_table.c.created_at, posts_table.c.updated_at,
+)
+
+# ETag 검증용 (본문 없이 내용이 바뀌었는지만 판단)
+POST_VERSION_COLUMNS = (posts_table.c.id, posts_table.c.board_id, posts_table.c.created_at, posts_table.c.updated_at, posts_table.c.version)
+
+def to_responses(model, rows) -> list:
+    """응답 필드와 같은 이름/타입의 컬럼만 읽은 행을 검증 없이 응답 모델로 (fast_json이 다시 검증하지 않고 바로 직렬화)"""
+    return [model.model_construct(**row._mapping) for row in rows]
 
 class PostRepository:
-    def create_post(self, db: Session, title: str, content: str, board_id: int, author_id: int) -> Post:
+    async def create_post(self, db: DBSession, title: str, content: str, board_id: int, author_id: int) -> Post:
         post = Post(
             title=title,
             content=content,
@@ -13,40 +50,144 @@ class PostRepository:
             author_id=author_id
         )
         db.add(post)
-        db.commit()
-        db.refresh(post)
+        await db_commit(db)
+        await db_refresh(db, post)
         
-        board_repository.increment_post_count_delta(board_id)
+        # 게시글 수 증감과 첫 페이지 캐시 갱신을 한 번의 왕복으로
+        board = await board_repository.get_board_meta(db, board_id)
+        results = None
+        try:
+            async with redis_pipeline() as pipe:
+                await board_repository.increment_post_count_delta(board, pipe=pipe)
+                await post_page_cache.add(post, pipe=pipe)
+                results = await pipe.execute(raise_on_error=False)
+        except RedisError:
+            pass
+        await self._check_redis_write(db, board_id, results, 1)
         return post
     
-    def get_post_by_id(self, db: Session, post_id: int) -> Optional[Post]:
-        return db.query(Post).filter(Post.id == post_id).first()
+    async def get_post_by_id(self, db: DBSession, post_id: int) -> Optional[Post]:
+        return await db_scalar(db, select(Post).where(Post.id == post_id))
+    
+    async def get_post_version(self, db: DBSession, post_id: int) -> Optional[Row]:
+        """ETag 확인용 (id, board_id, created_at, updated_at, version)만 조회"""
+        result = await db_execute(db, select(*POST_VERSION_COLUMNS).where(posts_table.c.id == post_id))
+        return result.first()
+    
+    async def get_posts_by_ids(self, db: DBSession, post_ids: List[int]) -> List[PostResponse]:
+        """ID 목록으로 한 번에 조회 (순서 보장 안 함)"""
+        if not post_ids:
+            return []
+        result = await db_execute(db, select(*POST_LIST_COLUMNS).where(posts_table.c.id.in_(post_ids)))
+        return to_responses(PostResponse, result)
+    
+    async def get_posts_by_board(self, db: DBSession, board_id: int, cursor_time: Optional[datetime] = None, cursor_id: Optional[int] = None, limit: int = 20) -> List[PostResponse]:
+        """최신 게시글 window 안의 요청은 Redis에서, 벗어나면 SQL로 조회"""
+        cached = await post_page_cache.get_page(board_id, limit, cursor_time, cursor_id)
+        if cached is not None:
+            return cached
+        
+        if (cursor_time and cursor_id) or limit > POST_PAGE_CACHE_SIZE:
+            return await self._select_posts_by_board(db, board_id, cursor_time, cursor_id, limit)
+        
+        # 첫 페이지 miss: window 크기만큼 읽어서 캐시를 채움 (+1개로 더 오래된 글 존재 여부 확인)
+        version = await post_page_cache.get_version(board_id)
+        posts = await self._select_posts_by_board(db, board_id, None, None, POST_PAGE_CACHE_SIZE + 1)
+        if version is not None:
+            await post_page_cache.warm(board_id, version, posts[:POST_PAGE_CACHE_SIZE], has_more=len(posts) > POST_PAGE_CACHE_SIZE)
+        return posts[:limit]
+    
+    async def _select_posts_by_board(self, db: DBSession, board_id: int, cursor_time: Optional[datetime], cursor_id: Optional[int], limit: int) -> List[PostResponse]:
+        """읽기 전용 목록이므로 ORM 인스턴스 대신 응답 컬럼만 조회해서 응답 모델로 반환
+        
+        identity map 등록, 변경 추적 상태, relationship 속성 생성을 건너뛰고,
+        컬럼 타입이 응답 필드와 같으므로 pydantic 검증도 건너뛴다.
+        """
+        result = await db_execute(db, self._board_page_query(POST_LIST_COLUMNS, board_id, cursor_time, cursor_id, limit))
+        return to_responses(PostResponse, result)
+    
+    async def get_post_summaries_by_board(self, db: DBSession, board_id: int, cursor_time: Optional[datetime] = None, cursor_id: Optional[int] = None, limit: int = 20) -> List[PostSummaryResponse]:
+        """본문 대신 앞부분(POST_EXCERPT_LENGTH자)과 전체 길이만 조회 (페이지 캐시는 전체 본문만 담으므로 항상 SQL)"""
+        result = await db_execute(db, self._board_page_query(POST_SUMMARY_COLUMNS, board_id, cursor_time, cursor_id, limit))
+        return to_responses(PostSummaryResponse, result)
+    
+    async def stream_posts_by_board(self, db: DBSession, board_id: int, cursor_time: Optional[datetime] = None, cursor_id: Optional[int] = None, batch_size: int = POST_EXPORT_BATCH_SIZE) -> AsyncIterator[List[PostResponse]]:
+        """게시판 전체 게시글을 목록과 같은 순서(created_at DESC, id DESC)로 batch_size개씩 반환
+        
+        limit 없는 keyset 쿼리 하나를 커서로 끝까지 읽는다. (cursor_time, cursor_id)는 목록 cursor와 같은 의미라서
+        끊긴 내보내기는 마지막으로 받은 게시글의 (created_at, id)로 이어받을 수 있다.
+        """
+        query = self._board_page_query(POST_LIST_COLUMNS, board_id, cursor_time, cursor_id, None)
+        async for partition in db_stream(db, query, batch_size):
+            yield to_responses(PostResponse, partition)
+    
+    async def get_board_page_version(self, db: DBSession, board_id: int, cursor_time: Optional[datetime], cursor_id: Optional[int], limit: int) -> str:
+        """목록 ETag 검증자: Redis의 게시판 쓰기 버전, 키가 없으면 페이지 행의 (id, version)"""
+        version = await post_page_cache.get_write_version(board_id)
+        if version is not None:
+            return f"v{version}"
+        result = await db_execute(db, self._board_page_query(POST_VERSION_COLUMNS, board_id, cursor_time, cursor_id, limit))
+        return "r" + ",".join(f"{row.id}:{row.version}" for row in result)
     
-    def get_posts_by_board(self, db: Session, board_id: int, cursor_time: Optional[datetime] = None, cursor_id: Optional[int] = None, limit: int = 20) -> List[Post]:
-        query = db.query(Post).filter(Post.board_id == board_id)
+    @staticmethod
+    def _board_page_query(columns: tuple, board_id: int, cursor_time: Optional[datetime], cursor_id: Optional[int], limit: Optional[int]):
+        """(created_at DESC, id DESC) keyset 페이지 (idx_posts_board_created 순서로 읽음, limit이 None이면 끝까지)"""
+        query = select(*columns).where(posts_table.c.board_id == board_id)
         
         if cursor_time and cursor_id:
-            query = query.filter(
-                (Post.created_at < cursor_time) | 
-                ((Post.created_at == cursor_time) & (Post.id < cursor_id))
+            query = query.where(
+                (posts_table.c.created_at < cursor_time) | 
+                ((posts_table.c.created_at == cursor_time) & (posts_table.c.id < cursor_id))
             )
         
-        return query.order_by(Post.created_at.desc(), Post.id.desc()).limit(limit).all()
+        query = query.order_by(posts_table.c.created_at.desc(), posts_table.c.id.desc())
+        return query.limit(limit) if limit is not None else query
     
-    def update_post(self, db: Session, post: Post, title: str = None, content: str = None) -> Post:
+    async def update_post(self, db: DBSession, post: Post, title: str = None, content: str = None) -> Post:
         if title is not None:
             post.title = title
         if content is not None:
             post.content = content
-        db.commit()
-        db.refresh(post)
+        # 같은 게시글 동시 수정도 빠짐없이 세도록 SQL에서 증가
+        post.version = Post.version + 1
+        await db_commit(db)
+        await db_refresh(db, post)
+        
+        try:
+            await post_page_cache.replace(post)
+        except RedisError:
+            # 버전이 그대로면 이전 ETag로 304가 나가므로 캐시와 버전 키를 지움
+            await self._check_redis_write(db, post.board_id, None, 0)
         return post
     
-    def delete_post(self, db: Session, post: Post):
-        board_id = post.board_id
-        db.delete(post)
-        db.commit()
+    async def delete_post(self, db: DBSession, post: Post):
+        board_id, created_at, post_id = post.board_id, post.created_at, post.id
+        await db_delete(db, post)
+        await db_commit(db)
+        
+        board = await board_repository.get_board_meta(db, board_id)
+        results = None
+        try:
+            async with redis_pipeline() as pipe:
+                await board_repository.decrement_post_count_delta(board, pipe=pipe)
+                await post_page_cache.remove(board_id, created_at, post_id, pipe=pipe)
+                results = await pipe.execute(raise_on_error=False)
+        except RedisError:
+            pass
+        await self._check_redis_write(db, board_id, results, -1)
+    
+    async def _check_redis_write(self, db: DBSession, board_id: int, results: Optional[list], post_count_delta: int):
+        """커밋 후 Redis 갱신 결과 확인 (results가 None이면 파이프라인 전체 실패)
         
-        board_repository.decrement_post_count_delta(board_id)
+        DB에는 이미 반영됐으므로 요청은 실패시키지 않는다. 페이지 캐시와 쓰기 버전 키를 지워서
+        목록/ETag가 SQL 기준으로 다시 만들어지게 하고, 기록하지 못한 게시글 수 증감은 DB에 바로 반영한다.
+        """
+        if results is not None and not any(isinstance(result, Exception) for result in results):
+            return
+        logger.warning("post write: redis update failed for board %s, dropping page cache", board_id)
+        await post_page_cache.drop(board_id)
+        # 첫 명령이 증감량 HINCRBY (_apply_post_count_delta), 성공했으면 동기화 작업이 반영하므로 중복 반영하지 않음
+        if post_count_delta and (results is None or isinstance(results[0], Exception)):
+            await board_repository.apply_post_count_delta_to_db(db, board_id, post_count_delta)
 
 post_repository = PostRepository()
\ No newline at end of file
@@ -0,0 +1,99 @@
+import os
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+from datetime import datetime
+from sqlalchemy import select, func, literal_column, or_, true, table, column
+from entities.board import Board
+from entities.post import POST_SEARCH_CONFIG
+from infra.database import DBSession, db_execute
+from repositories.post_repository import posts_table, POST_SUMMARY_COLUMNS
+
+# 검색어에서 사용하는 최대 단어 수 (나머지는 무시)
+POST_SEARCH_MAX_TERMS = int(os.getenv("POST_SEARCH_MAX_TERMS", "8"))
+# SQLite bm25 컬럼 가중치 (title, content), PostgreSQL 기본 가중치 A=1.0 / B=0.4와 같은 비율
+SQLITE_BM25_WEIGHTS = (2.5, 1.0)
+
+boards_table = Board.__table__
+# FTS5 가상 테이블 (MATCH와 bm25()는 테이블 이름을 인자로 받음)
+fts_table = table("posts_fts", column("rowid"))
+fts_name = literal_column("posts_fts")
+
+@dataclass(slots=True)
+class PostSearchRecord:
+    """검색 결과 (PostSummaryResponse 필드 + 관련도 점수, PostSearchHit와 같은 필드)"""
+    id: int
+    title: str
+    excerpt: str
+    content_length: int
+    board_id: int
+    author_id: int
+    created_at: datetime
+    updated_at: Optional[datetime]
+    rank: float
+
+class PostSearch:
+    """게시글 제목/본문 전문 검색 (인덱스는 entities/post.py의 POST_SEARCH_DDL)
+
+    검색어는 단어 단위로 나눠서 모든 단어를 접두어로 포함하는 게시글을 찾는다 (`게시판` → `게시판에서`도 일치).
+    결과는 관련도(rank, 클수록 관련 높음) 내림차순 + id 내림차순이고 (rank, id) keyset으로 다음 페이지를 읽는다.
+    - PostgreSQL: search_vector @@ to_tsquery (GIN 인덱스), ts_rank_cd
+    - SQLite: posts_fts MATCH (FTS5 인덱스), -bm25
+    """
+
+    @staticmethod
+    def terms(query: str) -> List[str]:
+        """검색어에서 단어만 추출 (연산자/따옴표 등 검색 문법 문자는 버려서 그대로 SQL 파라미터로 넘겨도 안전)"""
+        return re.findall(r"\w+", query.lower())[:POST_SEARCH_MAX_TERMS]
+
+    async def search(self, db: DBSession, query: str, user_id: int, board_id: Optional[int] = None, cursor_rank: Optional[float] = None, cursor_id: Optional[int] = None, limit: int = 20) -> List[PostSearchRecord]:
+        """board_id가 없으면 접근 가능한 모든 게시판(공개 + 내 비공개)에서 검색"""
+        terms = self.terms(query)
+        if not terms:
+            return []
+
+        if db.get_bind().dialect.name == "postgresql":
+            matches = self._postgresql_matches(terms)
+        else:
+            matches = self._sqlite_matches(terms)
+
+        if board_id is not None:
+            matches = matches.where(posts_table.c.board_id == board_id)
+        else:
+            # BoardService.get_board와 같은 규칙: 공개 게시판이거나 내가 소유한 게시판
+            matches = matches.join(boards_table, boards_table.c.id == posts_table.c.board_id).where(
+                or_(boards_table.c.public == true(), boards_table.c.owner_id == user_id)
+            )
+
+        hits = matches.subquery("hits")
+        page = select(hits)
+        if cursor_rank is not None and cursor_id is not None:
+            page = page.where(
+                (hits.c.rank < cursor_rank) |
+                ((hits.c.rank == cursor_rank) & (hits.c.id < cursor_id))
+            )
+        page = page.order_by(hits.c.rank.desc(), hits.c.id.desc()).limit(limit)
+
+        result = await db_execute(db, page)
+        return [PostSearchRecord(*row) for row in result]
+
+    @staticmethod
+    def _postgresql_matches(terms: List[str]):
+        tsquery = func.to_tsquery(POST_SEARCH_CONFIG, " & ".join(f"{term}:*" for term in terms))
+        search_vector = literal_column("posts.search_vector")
+        return (
+            select(*POST_SUMMARY_COLUMNS, func.ts_rank_cd(search_vector, tsquery).label("rank"))
+            .where(search_vector.op("@@")(tsquery))
+        )
+
+    @staticmethod
+    def _sqlite_matches(terms: List[str]):
+        # 각 단어를 따옴표로 감싼 접두어 검색, 공백으로 이으면 AND (bm25는 작을수록 관련 높음)
+        match = " ".join(f'"{term}"*' for term in terms)
+        return (
+            select(*POST_SUMMARY_COLUMNS, (-func.bm25(fts_name, *SQLITE_BM25_WEIGHTS)).label("rank"))
+            .select_from(posts_table.join(fts_table, fts_table.c.rowid == posts_table.c.id))
+            .where(fts_name.op("MATCH")(match))
+        )
+
+post_search = PostSearch()
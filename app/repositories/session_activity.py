@@ -0,0 +1,188 @@
+import os
+import time
+import uuid
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+from redis.exceptions import RedisError
+from sqlalchemy import DateTime, Uuid, and_, bindparam, column, update, values
+from entities.session import Session as SessionModel
+from infra.database import DBSession, db_execute, db_commit, db_rollback
+from infra.redis_client import async_redis_client, redis_pipeline
+from lib.ttl_cache import TTLCache
+from repositories.post_count_sync import SNAPSHOT_SCRIPT
+
+logger = logging.getLogger(__name__)
+
+SESSION_ACTIVITY_TRACKING = os.getenv("SESSION_ACTIVITY_TRACKING", "true").lower() == "true"
+# 같은 세션의 활동은 이 간격(초) 안에서 한 번만 기록 (last_seen_at 정밀도)
+SESSION_ACTIVITY_RESOLUTION = float(os.getenv("SESSION_ACTIVITY_RESOLUTION", "60"))
+# 워커 메모리 버퍼를 Redis로 보내는 간격(초)
+SESSION_ACTIVITY_PUSH_INTERVAL = float(os.getenv("SESSION_ACTIVITY_PUSH_INTERVAL", "1"))
+SESSION_ACTIVITY_TRACKED_SIZE = int(os.getenv("SESSION_ACTIVITY_TRACKED_SIZE", "100000"))
+SESSION_ACTIVITY_FLUSH_CHUNK_SIZE = int(os.getenv("SESSION_ACTIVITY_FLUSH_CHUNK_SIZE", "5000"))
+
+# 해시에 더 최근 시각이 있으면 유지 (여러 워커가 같은 세션을 기록하는 경우)
+# KEYS: hash / ARGV: session_id, epoch, session_id, epoch, ...
+MAX_SCRIPT = """
+for i = 1, #ARGV, 2 do
+    local current = tonumber(redis.call('HGET', KEYS[1], ARGV[i]))
+    if not current or current < tonumber(ARGV[i + 1]) then
+        redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+    end
+end
+return 1
+"""
+
+class SessionActivity:
+    """세션 last_seen_at write-behind
+
+    1. 요청마다 워커 메모리 버퍼에 기록 (세션당 RESOLUTION 간격으로 한 번만)
+    2. 워커가 PUSH_INTERVAL마다 버퍼를 Redis 해시(session:last_seen)로 한 번에 전송
+    3. 스케줄러 작업이 해시를 스냅샷으로 RENAME한 뒤 chunk 단위 bulk UPDATE로 DB에 반영
+    요청마다 UPDATE + COMMIT하는 대신 세션 테이블 쓰기는 flush 주기당 chunk 수만큼만 발생한다.
+    반영은 더 최근 시각일 때만 덮어쓰므로 중단 후 같은 스냅샷을 다시 반영해도 안전하다.
+    """
+    LIVE_KEY = "session:last_seen"
+    POINTER_KEY = "session:last_seen:flush"
+    SNAPSHOT_PREFIX = "session:last_seen:flush:"
+    PUSH_BATCH_SIZE = 1000
+
+    def __init__(self):
+        self._buffer: Dict[str, int] = {}
+        # 최근에 기록한 세션 (RESOLUTION 동안 다시 기록하지 않음)
+        self._tracked = TTLCache(SESSION_ACTIVITY_TRACKED_SIZE)
+        self._max = async_redis_client.register_script(MAX_SCRIPT)
+        self._snapshot = async_redis_client.register_script(SNAPSHOT_SCRIPT)
+        self.touches = 0
+        self.recorded = 0
+        self.pushed = 0
+        self.push_failures = 0
+        self.flushed = 0
+
+    def touch(self, session_id: str):
+        """요청 처리 중 호출, 메모리만 사용"""
+        self.touches += 1
+        if self._tracked.get(session_id) is not None:
+            return
+        now = time.time()
+        self._tracked.put(session_id, True, now + SESSION_ACTIVITY_RESOLUTION)
+        self._buffer[session_id] = int(now)
+        self.recorded += 1
+
+    async def push(self):
+        """워커 버퍼를 Redis 해시로 전송, 실패하면 다음 전송에 다시 포함"""
+        if not self._buffer:
+            return
+        buffer, self._buffer = self._buffer, {}
+        items = list(buffer.items())
+        try:
+            async with redis_pipeline() as pipe:
+                for i in range(0, len(items), self.PUSH_BATCH_SIZE):
+                    args = [value for item in items[i:i + self.PUSH_BATCH_SIZE] for value in item]
+                    await self._max(keys=[self.LIVE_KEY], args=args, client=pipe)
+            self.pushed += len(items)
+        except RedisError:
+            self.push_failures += 1
+            logger.warning("session activity: push failed", exc_info=True)
+            for session_id, seen in buffer.items():
+                self._buffer[session_id] = max(seen, self._buffer.get(session_id, 0))
+
+    async def run_pusher(self):
+        """startup에서 백그라운드 태스크로 실행"""
+        while True:
+            await asyncio.sleep(SESSION_ACTIVITY_PUSH_INTERVAL)
+            try:
+                await self.push()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("session activity: pusher error")
+
+    async def pending(self, session_ids: Iterable[str]) -> Dict[str, int]:
+        """아직 DB에 반영되지 않은 마지막 활동 시각 (epoch 초)"""
+        session_ids = list(session_ids)
+        if not session_ids:
+            return {}
+        found: Dict[str, int] = {}
+        try:
+            async with async_redis_client.pipeline(transaction=False) as pipe:
+                pipe.get(self.POINTER_KEY)
+                pipe.hmget(self.LIVE_KEY, session_ids)
+                snapshot_key, live = await pipe.execute()
+            rows = [live]
+            if snapshot_key:
+                rows.append(await async_redis_client.hmget(snapshot_key, session_ids))
+        except RedisError:
+            logger.warning("session activity: pending read failed", exc_info=True)
+            rows = []
+
+        for row in rows + [[self._buffer.get(session_id) for session_id in session_ids]]:
+            for session_id, seen in zip(session_ids, row):
+                if seen is not None:
+                    found[session_id] = max(int(seen), found.get(session_id, 0))
+        return found
+
+    async def flush(self, db: DBSession) -> int:
+        """Redis에 쌓인 활동 시각을 DB에 반영, 반영한 세션 수 반환"""
+        snapshot_key = await self._snapshot(
+            keys=[self.LIVE_KEY, self.POINTER_KEY],
+            args=[f"{self.SNAPSHOT_PREFIX}{uuid.uuid4().hex}"]
+        )
+        if not snapshot_key:
+            return 0
+
+        rows: List[Tuple[uuid.UUID, datetime]] = []
+        for session_id, seen in (await async_redis_client.hgetall(snapshot_key)).items():
+            try:
+                rows.append((uuid.UUID(session_id), datetime.fromtimestamp(int(seen))))
+            except ValueError:
+                continue
+
+        for i in range(0, len(rows), SESSION_ACTIVITY_FLUSH_CHUNK_SIZE):
+            try:
+                await self._apply_chunk(db, rows[i:i + SESSION_ACTIVITY_FLUSH_CHUNK_SIZE])
+                await db_commit(db)
+            except BaseException:
+                await db_rollback(db)
+                raise
+
+        async with redis_pipeline(transaction=True) as pipe:
+            pipe.delete(snapshot_key, self.POINTER_KEY)
+        self.flushed += len(rows)
+        return len(rows)
+
+    async def _apply_chunk(self, db: DBSession, chunk: List[Tuple[uuid.UUID, datetime]]):
+        if db.get_bind().dialect.name == "postgresql":
+            # UPDATE sessions ... FROM (VALUES (id, seen), ...) 한 문장
+            seen = values(column("id", Uuid), column("seen", DateTime(timezone=True)), name="seen").data(chunk)
+            await db_execute(db, update(SessionModel)
+                .where(and_(SessionModel.id == seen.c.id, SessionModel.last_seen_at < seen.c.seen))
+                .values(last_seen_at=seen.c.seen)
+                .execution_options(synchronize_session=False))
+            return
+
+        # SQLite는 VALUES 별칭에 컬럼 목록을 쓸 수 없으므로 executemany
+        sessions = SessionModel.__table__
+        await db_execute(
+            db,
+            update(sessions)
+                .where(and_(sessions.c.id == bindparam("session_id"), sessions.c.last_seen_at < bindparam("seen")))
+                .values(last_seen_at=bindparam("seen")),
+            [{"session_id": session_id, "seen": seen} for session_id, seen in chunk]
+        )
+
+    def stats(self) -> dict:
+        return {
+            "tracking": SESSION_ACTIVITY_TRACKING,
+            "resolution_seconds": SESSION_ACTIVITY_RESOLUTION,
+            "touches": self.touches,
+            "recorded": self.recorded,
+            "buffered": len(self._buffer),
+            "pushed": self.pushed,
+            "push_failures": self.push_failures,
+            "flushed": self.flushed,
+        }
+
+session_activity = SessionActivity()
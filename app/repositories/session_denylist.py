@@ -0,0 +1,139 @@
+import os
+import time
+import asyncio
+import logging
+from typing import Iterable
+from redis.exceptions import RedisError
+from infra.redis_client import async_redis_client
+from lib.auth import ACCESS_TOKEN_EXPIRE_SECONDS
+from lib.bloom_filter import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+# 한 AT 수명 동안 무효화될 것으로 예상하는 세션 수 (워커별 Bloom filter 크기)
+SESSION_DENYLIST_CAPACITY = int(os.getenv("SESSION_DENYLIST_CAPACITY", "100000"))
+SESSION_DENYLIST_FALSE_POSITIVE_RATE = float(os.getenv("SESSION_DENYLIST_FALSE_POSITIVE_RATE", "0.01"))
+
+class SessionDenylist:
+    """로그아웃/무효화된 세션의 AT를 만료 전에 차단
+
+    - Redis sorted set(session:revoked)에 session_id → 차단 만료 시각(무효화 + AT 수명)으로 기록
+    - pub/sub으로 모든 워커에 알리고, 워커는 메모리 Bloom filter에 추가
+    - 요청마다 Bloom filter만 확인하고, 양성일 때만 Redis로 확정 (거짓 양성 구분)
+    Bloom filter는 항목을 지울 수 없으므로 AT 수명마다 새 filter로 교체하고 직전 filter도 함께 확인한다.
+    """
+    KEY = "session:revoked"
+    CHANNEL = "session:revoked"
+
+    def __init__(self, ttl: int = ACCESS_TOKEN_EXPIRE_SECONDS):
+        self.ttl = ttl
+        self._current = self._new_filter()
+        self._previous = self._new_filter()
+        self._rotated_at = time.monotonic()
+        self.checks = 0
+        self.filter_positives = 0
+        self.redis_checks = 0
+        self.denied = 0
+        self.redis_failures = 0
+
+    @staticmethod
+    def _new_filter() -> BloomFilter:
+        return BloomFilter(SESSION_DENYLIST_CAPACITY, SESSION_DENYLIST_FALSE_POSITIVE_RATE)
+
+    def _add_local(self, session_ids: Iterable[str]):
+        self._rotate()
+        for session_id in session_ids:
+            self._current.add(session_id)
+
+    def _rotate(self):
+        # 직전 filter에 있던 항목은 추가된 지 최소 ttl이 지났으므로 버려도 됨
+        if time.monotonic() - self._rotated_at >= self.ttl:
+            self._previous, self._current = self._current, self._new_filter()
+            self._rotated_at = time.monotonic()
+
+    def might_be_revoked(self, session_id: str) -> bool:
+        """요청마다 호출, 메모리만 사용 (False면 확실히 무효화되지 않은 세션)"""
+        self.checks += 1
+        if session_id not in self._current and session_id not in self._previous:
+            return False
+        # 양성이면 오래된 filter를 정리한 뒤 다시 확인 (무효화가 한동안 없었던 경우)
+        self._rotate()
+        if session_id not in self._current and session_id not in self._previous:
+            return False
+        self.filter_positives += 1
+        return True
+
+    async def is_revoked(self, session_id: str) -> bool:
+        """Bloom filter 양성일 때 Redis로 확정, Redis 오류면 차단 쪽으로 판단"""
+        self.redis_checks += 1
+        try:
+            blocked_until = await async_redis_client.zscore(self.KEY, session_id)
+        except RedisError:
+            self.redis_failures += 1
+            logger.warning("session denylist: redis check failed, denying", exc_info=True)
+            blocked_until = float("inf")
+        revoked = blocked_until is not None and blocked_until > time.time()
+        if revoked:
+            self.denied += 1
+        return revoked
+
+    async def revoke(self, session_ids: Iterable[str]):
+        """세션의 기존 AT 차단 (DB에서 세션을 무효화한 뒤 호출)"""
+        session_ids = [str(session_id) for session_id in session_ids]
+        if not session_ids:
+            return
+        self._add_local(session_ids)
+        now = time.time()
+        try:
+            async with async_redis_client.pipeline(transaction=False) as pipe:
+                pipe.zadd(self.KEY, {session_id: now + self.ttl for session_id in session_ids})
+                pipe.zremrangebyscore(self.KEY, "-inf", now)
+                pipe.expire(self.KEY, self.ttl)
+                pipe.publish(self.CHANNEL, ",".join(session_ids))
+                await pipe.execute()
+        except RedisError:
+            logger.warning("session denylist: publish failed", exc_info=True)
+
+    async def _reload(self):
+        """Redis에 남아 있는(아직 AT가 유효할 수 있는) 세션으로 filter 재구성"""
+        session_ids = await async_redis_client.zrangebyscore(self.KEY, time.time(), "+inf")
+        self._current, self._previous = self._new_filter(), self._new_filter()
+        self._rotated_at = time.monotonic()
+        self._add_local(session_ids)
+
+    async def listen(self):
+        """다른 워커의 무효화 알림을 받아 filter에 추가 (startup에서 백그라운드 태스크로 실행)"""
+        while True:
+            pubsub = async_redis_client.pubsub()
+            try:
+                await pubsub.subscribe(self.CHANNEL)
+                # 구독이 끊긴 동안 놓친 알림이 있을 수 있으므로 구독 후 Redis 기준으로 다시 채움
+                await self._reload()
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    self._add_local(session_id for session_id in message["data"].split(",") if session_id)
+            except asyncio.CancelledError:
+                raise
+            except (RedisError, OSError):
+                logger.warning("session denylist: listener disconnected, retrying", exc_info=True)
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    def stats(self) -> dict:
+        return {
+            "filter": {
+                "size_bits": self._current.size,
+                "hash_count": self._current.hash_count,
+                "current": self._current.count,
+                "previous": self._previous.count,
+            },
+            "checks": self.checks,
+            "filter_positives": self.filter_positives,
+            "redis_checks": self.redis_checks,
+            "denied": self.denied,
+            "redis_failures": self.redis_failures,
+        }
+
+session_denylist = SessionDenylist()
@@ -1,14 +1,39 @@
+import os
+import time
+import asyncio
 import hashlib
+import logging
+import uuid
 from datetime import datetime, timedelta
-from typing import Optional, List
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from entities.session import Session as SessionModel
+from typing import Optional, List, Tuple, Union
+from sqlalchemy import and_, select, update, insert, delete, func
+from entities.session import Session as SessionModel, SessionRefreshToken
 from entities.user import User
+from infra.database import DBSession, db_execute, db_scalar, db_scalars, db_commit, db_refresh
 from lib.auth import REFRESH_TOKEN_EXPIRE_SECONDS
+from repositories.session_activity import session_activity
+from repositories.session_denylist import session_denylist
+
+logger = logging.getLogger(__name__)
+
+# 세션 정리: 한 트랜잭션에서 지우는 행 수, 배치 사이 대기(초), 최대 실행 시간(초)
+SESSION_CLEANUP_BATCH_SIZE = int(os.getenv("SESSION_CLEANUP_BATCH_SIZE", "1000"))
+SESSION_CLEANUP_PAUSE = float(os.getenv("SESSION_CLEANUP_PAUSE", "0.1"))
+SESSION_CLEANUP_MAX_RUNTIME = float(os.getenv("SESSION_CLEANUP_MAX_RUNTIME", "300"))
+# 무효화된 세션을 감사 목적으로 보관하는 기간
+SESSION_REVOKED_RETENTION_DAYS = int(os.getenv("SESSION_REVOKED_RETENTION_DAYS", "30"))
+
+def to_session_uuid(session_id: Union[str, uuid.UUID]) -> Optional[uuid.UUID]:
+    """문자열 session_id를 UUID로 변환 (형식이 잘못되면 None)"""
+    if isinstance(session_id, uuid.UUID):
+        return session_id
+    try:
+        return uuid.UUID(str(session_id))
+    except ValueError:
+        return None
 
 class SessionRepository:
-    def create_device_session(self, db: Session, user_id: int, refresh_token: str, device_name: str, ip_address: str, user_agent: str = "") -> str:
+    async def create_device_session(self, db: DBSession, user_id: int, refresh_token: str, device_name: str, ip_address: str, user_agent: str = "") -> str:
         """새 기기 세션 생성"""
         # refresh_token 해시화 (보안)
         token_hash = hashlib.sha256(refresh_token.encode()).hexdigest()
@@ -25,93 +50,190 @@ class SessionRepository:
         )
         
         db.add(session)
-        db.commit()
-        db.refresh(session)
+        await db_commit(db)
+        await db_refresh(db, session)
         
         return str(session.id)
     
-    def get_device_session(self, db: Session, refresh_token: str) -> Optional[SessionModel]:
-        """Refresh Token으로 세션 조회"""
+    async def rotate_refresh_token(self, db: DBSession, refresh_token: str, new_refresh_token: str) -> Optional[Tuple[str, int]]:
+        """RT 교체 (RT rotation), 유효한 RT면 (session_id, user_id) 반환
+        
+        조회 없이 조건부 UPDATE ... RETURNING 한 문장으로 검증과 교체를 함께 처리한다.
+        같은 RT로 동시에 갱신해도 행 잠금 후 조건을 다시 평가하므로 한 요청만 성공한다.
+        교체된 RT 해시는 같은 트랜잭션에서 세션의 RT family(session_refresh_tokens)에 기록한다.
+        """
         token_hash = hashlib.sha256(refresh_token.encode()).hexdigest()
-        return db.query(SessionModel).filter(
+        now = datetime.now()
+        result = await db_execute(db, update(SessionModel).where(
             and_(
                 SessionModel.refresh_token_hash == token_hash,
                 SessionModel.revoked_at.is_(None),
-                SessionModel.expires_at > datetime.now()
+                SessionModel.expires_at > now
+            )
+        ).values(
+            refresh_token_hash=hashlib.sha256(new_refresh_token.encode()).hexdigest(),
+            last_seen_at=now,
+            expires_at=now + timedelta(seconds=REFRESH_TOKEN_EXPIRE_SECONDS)
+        ).returning(SessionModel.id, SessionModel.user_id).execution_options(synchronize_session=False))
+        row = result.first()
+        if row is not None:
+            await db_execute(db, insert(SessionRefreshToken).values(session_id=row.id, token_hash=token_hash, rotated_at=now))
+        await db_commit(db)
+        return (str(row.id), row.user_id) if row else None
+    
+    async def revoke_reused_refresh_token(self, db: DBSession, refresh_token: str) -> Optional[str]:
+        """세션에서 이미 교체된 RT(직전 것뿐 아니라 RT family 전체)가 다시 제시되면 세션 전체를 무효화, 무효화한 session_id 반환
+        
+        탈취된 RT와 정상 RT 중 어느 쪽이 먼저 사용됐는지 알 수 없으므로 둘 다 더 이상 갱신할 수 없게 한다.
+        """
+        token_hash = hashlib.sha256(refresh_token.encode()).hexdigest()
+        family = select(SessionRefreshToken.session_id).where(SessionRefreshToken.token_hash == token_hash)
+        result = await db_execute(db, update(SessionModel).where(
+            and_(
+                SessionModel.id.in_(family),
+                SessionModel.revoked_at.is_(None)
             )
-        ).first()
+        ).values(
+            revoked_at=datetime.now(),
+            revocation_reason="refresh_token_reuse"
+        ).returning(SessionModel.id, SessionModel.user_id).execution_options(synchronize_session=False))
+        row = result.first()
+        await db_commit(db)
+        if row is None:
+            return None
+        logger.warning("refresh token reuse detected: session %s of user %s revoked", row.id, row.user_id)
+        # 탈취된 RT로 발급된 AT도 바로 차단
+        await session_denylist.revoke([row.id])
+        return str(row.id)
     
-    def get_session_by_id(self, db: Session, session_id: str) -> Optional[SessionModel]:
+    async def get_session_by_id(self, db: DBSession, session_id: str) -> Optional[SessionModel]:
         """Session ID로 세션 조회"""
-        return db.query(SessionModel).filter(
+        session_uuid = to_session_uuid(session_id)
+        if session_uuid is None:
+            return None
+        return await db_scalar(db, select(SessionModel).where(
             and_(
-                SessionModel.id == session_id,
+                SessionModel.id == session_uuid,
                 SessionModel.revoked_at.is_(None),
                 SessionModel.expires_at > datetime.now()
             )
-        ).first()
+        ))
     
     
-    def update_last_activity(self, db: Session, session_id: str):
-        """마지막 활동 시간 업데이트"""
-        db.query(SessionModel).filter(SessionModel.id == session_id).update({
-            "last_seen_at": datetime.now()
-        })
-        db.commit()
+    async def revoke_device_session(self, db: DBSession, user_id: int, session_id: str, reason: str = "user_logout"):
+        """특정 기기 세션 무효화 - RT 갱신 차단 + 이미 발급된 AT는 denylist로 차단"""
+        session_uuid = to_session_uuid(session_id)
+        if session_uuid is None:
+            return
+        await db_execute(db, update(SessionModel).where(SessionModel.id == session_uuid).values(
+            revoked_at=datetime.now(),
+            revocation_reason=reason
+        ))
+        await db_commit(db)
+        await session_denylist.revoke([session_uuid])
     
-    def update_refresh_token(self, db: Session, session_id: str, new_refresh_token: str):
-        """세션의 refresh token 업데이트 (RT rotation)"""
-        token_hash = hashlib.sha256(new_refresh_token.encode()).hexdigest()
-        db.query(SessionModel).filter(SessionModel.id == session_id).update({
-            "refresh_token_hash": token_hash,
-            "last_seen_at": datetime.now(),
-            "expires_at": datetime.now() + timedelta(seconds=REFRESH_TOKEN_EXPIRE_SECONDS)
-        })
-        db.commit()
-    
-    def revoke_device_session(self, db: Session, user_id: int, session_id: str, reason: str = "user_logout"):
-        """특정 기기 세션 무효화 - RT 단계에서만 처리"""
-        db.query(SessionModel).filter(SessionModel.id == session_id).update({
-            "revoked_at": datetime.now(),
-            "revocation_reason": reason
-        })
-        db.commit()
-    
-    def revoke_all_user_sessions(self, db: Session, user_id: int, reason: str = "logout_all"):
-        """사용자의 모든 세션 무효화 - RT 갱신 시에만 차단"""
-        active_sessions = db.query(SessionModel).filter(
+    async def revoke_all_user_sessions(self, db: DBSession, user_id: int, reason: str = "logout_all"):
+        """사용자의 모든 세션 무효화 - RT 갱신 차단 + 이미 발급된 AT는 denylist로 차단"""
+        result = await db_execute(db, update(SessionModel).where(
             and_(
                 SessionModel.user_id == user_id,
                 SessionModel.revoked_at.is_(None)
             )
-        ).all()
-        
-        for session in active_sessions:
-            session.revoked_at = datetime.now()
-            session.revocation_reason = reason
-        
-        db.commit()
+        ).values(
+            revoked_at=datetime.now(),
+            revocation_reason=reason
+        ).returning(SessionModel.id).execution_options(synchronize_session=False))
+        session_ids = result.scalars().all()
+        await db_commit(db)
+        await session_denylist.revoke(session_ids)
     
-    def get_user_devices(self, db: Session, user_id: int) -> List[dict]:
+    async def get_user_devices(self, db: DBSession, user_id: int) -> List[dict]:
         """사용자의 모든 활성 기기 조회 (기존 이름 유지)"""
-        sessions = db.query(SessionModel).filter(
+        sessions = await db_scalars(db, select(SessionModel).where(
             and_(
                 SessionModel.user_id == user_id,
                 SessionModel.revoked_at.is_(None),
                 SessionModel.expires_at > datetime.now()
             )
-        ).order_by(SessionModel.last_seen_at.desc()).all()
+        ))
         
+        # 아직 DB에 반영되지 않은 활동 시각이 더 최근이면 사용
+        pending = await session_activity.pending(str(session.id) for session in sessions)
         devices = []
         for session in sessions:
+            last_active = session.last_seen_at
+            seen = pending.get(str(session.id))
+            if seen is not None and seen > last_active.timestamp():
+                last_active = datetime.fromtimestamp(seen, tz=last_active.tzinfo)
             devices.append({
                 "session_id": str(session.id),
                 "device_name": session.device_name,
-                "last_active": session.last_seen_at,
+                "last_active": last_active,
                 "ip_address": session.ip_address
             })
         
+        devices.sort(key=lambda device: device["last_active"], reverse=True)
         return devices
     
+    async def cleanup_sessions(
+        self,
+        db: DBSession,
+        batch_size: int = SESSION_CLEANUP_BATCH_SIZE,
+        pause: float = SESSION_CLEANUP_PAUSE,
+        max_runtime: float = SESSION_CLEANUP_MAX_RUNTIME,
+        revoked_retention_days: int = SESSION_REVOKED_RETENTION_DAYS
+    ) -> dict:
+        """만료된 세션과 보관 기간이 지난 무효화 세션, 교체된 지 RT 수명이 지난 RT family 해시를 배치 단위로 삭제
+        
+        한 번에 batch_size개씩 지우고 커밋하므로 락과 WAL이 한 트랜잭션에 몰리지 않는다.
+        교체된 지 RT 수명이 지난 RT는 교체되지 않았어도 만료됐을 RT라서 재사용 감지에 필요 없다.
+        max_runtime을 넘기면 남은 행은 다음 실행으로 미룬다 (completed=False).
+        """
+        started = time.perf_counter()
+        now = datetime.now()
+        deadline = started + max_runtime
+        result = {"expired": 0, "revoked": 0, "rotated_tokens": 0, "batches": 0, "completed": True}
+        
+        targets = (
+            ("expired", SessionModel.id, SessionModel.expires_at < now),
+            ("revoked", SessionModel.id, SessionModel.revoked_at < now - timedelta(days=revoked_retention_days)),
+            ("rotated_tokens", SessionRefreshToken.token_hash, SessionRefreshToken.rotated_at < now - timedelta(seconds=REFRESH_TOKEN_EXPIRE_SECONDS)),
+        )
+        for name, key, condition in targets:
+            while True:
+                if time.perf_counter() >= deadline:
+                    result["completed"] = False
+                    break
+                deleted = await self._delete_batch(db, key, condition, batch_size)
+                result[name] += deleted
+                result["batches"] += 1
+                if deleted < batch_size:
+                    break
+                await asyncio.sleep(pause)
+        
+        result["seconds"] = round(time.perf_counter() - started, 3)
+        return result
+    
+    async def _delete_batch(self, db: DBSession, key, condition, batch_size: int) -> int:
+        # DELETE ... LIMIT은 PostgreSQL에 없으므로 PK를 먼저 조회해서 범위 제한 (조건 컬럼 인덱스 사용)
+        keys = await db_scalars(db, select(key).where(condition).limit(batch_size))
+        if key is SessionModel.id:
+            # SQLite는 외래 키 CASCADE를 적용하지 않으므로 세션의 RT family를 같은 트랜잭션에서 지움
+            await db_execute(db, delete(SessionRefreshToken).where(SessionRefreshToken.session_id.in_(keys)))
+        result = await db_execute(db, delete(key.class_).where(key.in_(keys)))
+        await db_commit(db)
+        return result.rowcount
+    
+    async def get_session_stats(self, db: DBSession) -> dict:
+        """전체/활성/만료/무효화 세션 수 (FILTER 집계로 한 번의 스캔)"""
+        now = datetime.now()
+        row = (await db_execute(db, select(
+            func.count(),
+            func.count().filter(SessionModel.expires_at > now),
+            func.count().filter(SessionModel.expires_at < now),
+            func.count().filter(SessionModel.revoked_at.is_not(None)),
+        ).select_from(SessionModel))).one()
+        return {"total": row[0], "active": row[1], "expired": row[2], "revoked": row[3]}
+    
 
 session_repository = SessionRepository()
\ No newline at end of file
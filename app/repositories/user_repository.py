@@ -1,25 +1,26 @@
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import select
 from entities.user import User
-from lib.auth import get_password_hash
+from infra.database import DBSession, db_scalar, db_commit, db_refresh
+from lib.password_hasher import password_hasher
 
 class UserRepository:
-    def create_user(self, db: Session, fullname: str, email: str, password: str) -> User:
-        hashed_password = get_password_hash(password)
+    async def create_user(self, db: DBSession, fullname: str, email: str, password: str) -> User:
+        hashed_password = await password_hasher.hash(password)
         user = User(
             fullname=fullname,
             email=email,
             hashed_password=hashed_password
         )
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        await db_commit(db)
+        await db_refresh(db, user)
         return user
     
-    def get_user_by_email(self, db: Session, email: str) -> Optional[User]:
-        return db.query(User).filter(User.email == email).first()
+    async def get_user_by_email(self, db: DBSession, email: str) -> Optional[User]:
+        return await db_scalar(db, select(User).where(User.email == email))
     
-    def get_user_by_id(self, db: Session, user_id: int) -> Optional[User]:
-        return db.query(User).filter(User.id == user_id).first()
+    async def get_user_by_id(self, db: DBSession, user_id: int) -> Optional[User]:
+        return await db_scalar(db, select(User).where(User.id == user_id))
 
 user_repository = UserRepository()
\ No newline at end of file
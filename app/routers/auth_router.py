@@ -1,6 +1,5 @@
 from fastapi import APIRouter, Depends, Request, Response, Cookie, HTTPException, status
-from sqlalchemy.orm import Session
-from infra.database import get_db
+from infra.database import DBSession, get_session
 from services.auth_service import auth_service
 from lib.dependencies import get_current_user
 from lib.device_parser import parse_device_name
@@ -15,21 +14,21 @@ from typing import Optional
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 @router.post("/signup", response_model=SignupResponse)
-async def signup(request: SignupRequest, db: Session = Depends(get_db)):
-    return auth_service.signup(db, request.fullname, request.email, request.password)
+async def signup(request: SignupRequest, db: DBSession = Depends(get_session)):
+    return await auth_service.signup(db, request.fullname, request.email, request.password)
 
 @router.post("/login", response_model=LoginResponse)
 async def login(
     request: LoginRequest, 
     response: Response,
     fastapi_request: Request, 
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ):
     ip_address = fastapi_request.client.host if fastapi_request.client else ""
     user_agent = fastapi_request.headers.get("user-agent", "")
     device_name = parse_device_name(user_agent)
     
-    result = auth_service.login(db, request.email, request.password, device_name, ip_address, user_agent)
+    result = await auth_service.login(db, request.email, request.password, device_name, ip_address, user_agent)
     
     response.set_cookie(
         key="refresh_token",
@@ -51,7 +50,7 @@ async def login(
 async def refresh_token(
     response: Response,
     refresh_token: Optional[str] = Cookie(None), 
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ):
     if not refresh_token:
         raise HTTPException(
@@ -59,7 +58,7 @@ async def refresh_token(
             detail="Refresh token not found"
         )
     
-    result = auth_service.refresh_access_token(db, refresh_token)
+    result = await auth_service.refresh_access_token(db, refresh_token)
     
     # 새 refresh_token을 쿠키에 설정 (RT rotation)
     response.set_cookie(
@@ -81,7 +80,7 @@ async def refresh_token(
 async def logout(
     response: Response,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ):
     """현재 세션 로그아웃"""
     session_id = getattr(current_user, 'current_session_id', None)
@@ -89,25 +88,25 @@ async def logout(
     response.delete_cookie(key="refresh_token", path="/")
     
     if session_id:
-        return auth_service.logout_session(db, current_user.id, session_id)
+        return await auth_service.logout_session(db, current_user.id, session_id)
 
 @router.get("/sessions", response_model=UserSessionsResponse)
-async def get_user_sessions(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def get_user_sessions(current_user: User = Depends(get_current_user), db: DBSession = Depends(get_session)):
     """사용자의 모든 활성 세션 조회"""
-    return auth_service.get_user_sessions(db, current_user.id)
+    return await auth_service.get_user_sessions(db, current_user.id)
 
 @router.delete("/sessions", status_code=204)
 async def delete_all_sessions(
     response: Response,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ):
     """모든 세션 삭제"""
     response.delete_cookie(key="refresh_token", path="/")
     
-    return auth_service.logout_all_sessions(db, current_user.id)
+    return await auth_service.logout_all_sessions(db, current_user.id)
 
 @router.delete("/sessions/{session_id}", status_code=204)
-async def delete_session(session_id: str, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def delete_session(session_id: str, current_user: User = Depends(get_current_user), db: DBSession = Depends(get_session)):
     """특정 세션 삭제"""
-    return auth_service.logout_session(db, current_user.id, session_id)
\ No newline at end of file
+    return await auth_service.logout_session(db, current_user.id, session_id)
\ No newline at end of file
@@ -1,52 +1,83 @@
-from typing import List
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
-from infra.database import get_db
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from infra.database import DBSession, get_session
 from services.board_service import board_service
-from lib.dependencies import get_current_user
+from lib.dependencies import get_current_user, parse_batch_ids
+from lib.etag import etag_matches, etag_headers, not_modified
 from entities.user import User
-from schemas.board import BoardCreateRequest, BoardUpdateRequest, BoardResponse
+from schemas.board import BoardCreateRequest, BoardUpdateRequest, BoardResponse, BoardBatchResponse
 
 router = APIRouter(prefix="/boards", tags=["boards"])
 
+# ids와 함께 쓸 수 없는 목록 조회 파라미터
+LIST_PARAMS = ("limit", "cursor_post_count", "cursor_id", "offset")
+
 @router.post("/", response_model=BoardResponse)
 async def create_board(
     request: BoardCreateRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
+):
+    return await board_service.create_board(db, request.name, request.public, current_user.id)
+
+# /{board_id}보다 먼저 등록해야 "batch"가 게시판 ID로 매칭되지 않음
+@router.get("/batch", response_model=BoardBatchResponse)
+async def get_boards_batch(
+    ids: str = Query(..., description="쉼표로 구분한 게시판 ID 목록 (최대 BATCH_READ_MAX_IDS개)"),
+    current_user: User = Depends(get_current_user),
+    db: DBSession = Depends(get_session)
 ):
-    return board_service.create_board(db, request.name, request.public, current_user.id)
+    return await board_service.get_boards_batch(db, parse_batch_ids(ids), current_user.id)
 
 @router.get("/{board_id}", response_model=BoardResponse)
 async def get_board(
     board_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ):
-    return board_service.get_board(db, board_id, current_user.id)
+    board = await board_service.get_board(db, board_id, current_user.id)
+    etag = board_service.board_etag(board)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers.update(etag_headers(etag))
+    return board
 
-@router.get("/", response_model=List[BoardResponse])
+@router.get("/", response_model=Union[List[BoardResponse], BoardBatchResponse])
 async def list_boards(
+    request: Request,
     limit: int = Query(20, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    cursor_post_count: Optional[int] = Query(None, description="이전 페이지 마지막 게시판의 post_count"),
+    cursor_id: Optional[int] = Query(None, description="이전 페이지 마지막 게시판의 id"),
+    offset: int = Query(0, ge=0, deprecated=True),
+    ids: Optional[str] = Query(None, deprecated=True, description="GET /boards/batch?ids= 사용. 지정하면 목록 대신 일괄 조회 결과, 목록 파라미터와 함께 쓰면 422"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ):
-    return board_service.list_boards(db, current_user.id, limit, offset)
+    if ids is not None:
+        combined = [name for name in LIST_PARAMS if name in request.query_params]
+        if combined:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"ids cannot be combined with {', '.join(combined)}"
+            )
+        return await board_service.get_boards_batch(db, parse_batch_ids(ids), current_user.id)
+    return await board_service.list_boards(db, current_user.id, limit, offset, cursor_post_count, cursor_id)
 
 @router.put("/{board_id}", response_model=BoardResponse)
 async def update_board(
     board_id: int,
     request: BoardUpdateRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ):
-    return board_service.update_board(db, board_id, current_user.id, request.name, request.public)
+    return await board_service.update_board(db, board_id, current_user.id, request.name, request.public)
 
 @router.delete("/{board_id}", status_code=204)
 async def delete_board(
     board_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ):
-    return board_service.delete_board(db, board_id, current_user.id)
\ No newline at end of file
+    return await board_service.delete_board(db, board_id, current_user.id)
\ No newline at end of file
@@ -0,0 +1,69 @@
+from fastapi import APIRouter, Depends
+from infra.database import get_pool_stats
+from infra.scheduler import scheduler
+from lib.dependencies import verify_internal_token
+from lib.password_hasher import password_hasher
+from lib.token_cache import access_token_cache
+from lib.device_parser import device_parser_stats
+from repositories.board_cache import board_cache
+from repositories.board_ranking import board_ranking
+from repositories.post_page_cache import post_page_cache
+from repositories.session_activity import session_activity
+from repositories.session_denylist import session_denylist
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["internal"],
+    include_in_schema=False,
+    dependencies=[Depends(verify_internal_token)]
+)
+
+@router.get("/db-pool")
+async def db_pool_stats():
+    """현재 워커의 DB 커넥션 풀 설정 및 통계"""
+    return get_pool_stats()
+
+@router.get("/password-hasher")
+async def password_hasher_stats():
+    """bcrypt 작업 풀 대기열 및 해시 비용 통계"""
+    return password_hasher.stats()
+
+@router.get("/token-cache")
+async def token_cache_stats():
+    """Access Token 검증 캐시 적중률"""
+    return access_token_cache.stats()
+
+@router.get("/user-agent-cache")
+async def user_agent_cache_stats():
+    """로그인 기기명 파싱 캐시 적중률"""
+    return device_parser_stats()
+
+@router.get("/board-cache")
+async def board_cache_stats():
+    """게시판 메타데이터 캐시 계층별 적중률"""
+    return board_cache.stats()
+
+@router.get("/scheduler")
+async def scheduler_stats():
+    """주기 작업별 마지막 실행 결과(상태, 소요 시간, 실행 워커)와 이 워커의 실행/건너뜀 횟수"""
+    return await scheduler.stats()
+
+@router.get("/board-ranking")
+async def board_ranking_stats():
+    """Redis 순위 인덱스로 응답한 목록 요청 수 / SQL로 대체한 요청 수"""
+    return board_ranking.stats()
+
+@router.get("/post-page-cache")
+async def post_page_cache_stats():
+    """게시판 첫 페이지 캐시 적중률"""
+    return post_page_cache.stats()
+
+@router.get("/session-activity")
+async def session_activity_stats():
+    """세션 활동 기록 수 / 병합 후 Redis로 보낸 수 / DB에 반영한 수"""
+    return session_activity.stats()
+
+@router.get("/session-denylist")
+async def session_denylist_stats():
+    """AT 무효화 확인 수 / Bloom filter 양성 수 / Redis 확인 수 / 차단 수"""
+    return session_denylist.stats()
@@ -1,12 +1,13 @@
-from typing import List, Optional
+from typing import List, Literal, Optional, Union
 from datetime import datetime
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
-from infra.database import get_db
+from fastapi import APIRouter, Depends, Header, Query, Response
+from fastapi.responses import StreamingResponse
+from infra.database import DBSession, get_session
 from services.post_service import post_service
-from lib.dependencies import get_current_user
+from lib.dependencies import get_current_user, parse_batch_ids
+from lib.etag import etag_matches, etag_headers, not_modified
 from entities.user import User
-from schemas.post import PostCreateRequest, PostUpdateRequest, PostResponse, PostListResponse
+from schemas.post import PostCreateRequest, PostUpdateRequest, PostResponse, PostListResponse, PostSummaryListResponse, PostBatchResponse, PostSearchResponse
 
 router = APIRouter(tags=["posts"])
 
@@ -15,42 +16,103 @@ async def create_post(
     board_id: int,
     request: PostCreateRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ):
-    return post_service.create_post(db, request.title, request.content, board_id, current_user.id)
+    return await post_service.create_post(db, request.title, request.content, board_id, current_user.id)
+
+@router.get("/posts", response_model=PostBatchResponse)
+async def get_posts_batch(
+    ids: str = Query(..., description="쉼표로 구분한 게시글 ID 목록 (최대 BATCH_READ_MAX_IDS개)"),
+    current_user: User = Depends(get_current_user),
+    db: DBSession = Depends(get_session)
+):
+    return await post_service.get_posts_batch(db, parse_batch_ids(ids), current_user.id)
+
+@router.get("/posts/search", response_model=PostSearchResponse)
+async def search_posts(
+    q: str = Query(..., min_length=1, max_length=200, description="검색어 (모든 단어를 접두어로 포함하는 게시글)"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor_rank: Optional[float] = Query(None),
+    cursor_id: Optional[int] = Query(None),
+    current_user: User = Depends(get_current_user),
+    db: DBSession = Depends(get_session)
+):
+    """접근 가능한 모든 게시판(공개 + 내 비공개)에서 관련도순 검색"""
+    return await post_service.search_posts(db, q, current_user.id, None, cursor_rank, cursor_id, limit)
 
 @router.get("/posts/{post_id}", response_model=PostResponse)
 async def get_post(
     post_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ):
-    return post_service.get_post(db, post_id, current_user.id)
+    # 조건부 요청이면 버전 컬럼만 먼저 확인해서 바뀌지 않았으면 본문 없이 304
+    if if_none_match:
+        etag = await post_service.get_post_etag(db, post_id, current_user.id)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+    post = await post_service.get_post(db, post_id, current_user.id)
+    response.headers.update(etag_headers(post_service.post_etag(post)))
+    return post
 
-@router.get("/boards/{board_id}/posts", response_model=PostListResponse)
+@router.get("/boards/{board_id}/posts", response_model=Union[PostListResponse, PostSummaryListResponse])
 async def list_posts(
     board_id: int,
+    response: Response,
     limit: int = Query(20, ge=1, le=100),
     cursor_time: Optional[datetime] = Query(None),
     cursor_id: Optional[int] = Query(None),
+    view: Literal["full", "summary"] = Query("full", description="summary면 content 대신 excerpt와 content_length"),
+    if_none_match: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_user),
+    db: DBSession = Depends(get_session)
+):
+    # ETag는 목록을 읽기 전에 계산 (읽는 도중 쓰기가 있으면 다음 요청에서 200으로 다시 받음)
+    etag = await post_service.get_posts_page_etag(db, board_id, current_user.id, cursor_time, cursor_id, limit, view)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers.update(etag_headers(etag))
+    return await post_service.list_posts(db, board_id, current_user.id, cursor_time, cursor_id, limit, view)
+
+@router.get("/boards/{board_id}/posts/search", response_model=PostSearchResponse)
+async def search_board_posts(
+    board_id: int,
+    q: str = Query(..., min_length=1, max_length=200, description="검색어 (모든 단어를 접두어로 포함하는 게시글)"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor_rank: Optional[float] = Query(None),
+    cursor_id: Optional[int] = Query(None),
+    current_user: User = Depends(get_current_user),
+    db: DBSession = Depends(get_session)
+):
+    return await post_service.search_posts(db, q, current_user.id, board_id, cursor_rank, cursor_id, limit)
+
+@router.get("/boards/{board_id}/posts/export", response_class=StreamingResponse)
+async def export_posts(
+    board_id: int,
+    cursor_time: Optional[datetime] = Query(None, description="이어받기: 마지막으로 받은 게시글의 created_at"),
+    cursor_id: Optional[int] = Query(None, description="이어받기: 마지막으로 받은 게시글의 id"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ):
-    return post_service.list_posts(db, board_id, current_user.id, cursor_time, cursor_id, limit)
+    """게시판의 모든 게시글을 목록과 같은 순서로 한 줄에 하나씩 (application/x-ndjson)"""
+    stream = await post_service.export_posts(db, board_id, current_user.id, cursor_time, cursor_id)
+    return StreamingResponse(stream, media_type="application/x-ndjson")
 
 @router.put("/posts/{post_id}", response_model=PostResponse)
 async def update_post(
     post_id: int,
     request: PostUpdateRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ):
-    return post_service.update_post(db, post_id, current_user.id, request.title, request.content)
+    return await post_service.update_post(db, post_id, current_user.id, request.title, request.content)
 
 @router.delete("/posts/{post_id}", status_code=204)
 async def delete_post(
     post_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ):
-    return post_service.delete_post(db, post_id, current_user.id)
\ No newline at end of file
+    return await post_service.delete_post(db, post_id, current_user.id)
\ No newline at end of file
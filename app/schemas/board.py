@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Literal
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -19,4 +19,12 @@ class BoardResponse(BaseModel):
     created_at: datetime
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class BoardBatchItem(BaseModel):
+    id: int
+    status: Literal["ok", "not_found", "forbidden"]
+    board: Optional[BoardResponse] = None
+
+class BoardBatchResponse(BaseModel):
+    results: List[BoardBatchItem]
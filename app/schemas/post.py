@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Literal
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -25,4 +25,40 @@ class PostResponse(BaseModel):
 class PostListResponse(BaseModel):
     posts: List[PostResponse]
     next_cursor_time: Optional[datetime] = None
-    next_cursor_id: Optional[int] = None
\ No newline at end of file
+    next_cursor_id: Optional[int] = None
+
+class PostSummaryResponse(BaseModel):
+    """목록 요약 보기 (본문 대신 앞부분 excerpt와 전체 길이)"""
+    id: int
+    title: str
+    excerpt: str
+    content_length: int
+    board_id: int
+    author_id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+class PostSummaryListResponse(BaseModel):
+    posts: List[PostSummaryResponse]
+    next_cursor_time: Optional[datetime] = None
+    next_cursor_id: Optional[int] = None
+
+class PostSearchHit(PostSummaryResponse):
+    """검색 결과 (요약 필드 + 관련도, 클수록 관련 높음)"""
+    rank: float
+
+class PostSearchResponse(BaseModel):
+    posts: List[PostSearchHit]
+    next_cursor_rank: Optional[float] = None
+    next_cursor_id: Optional[int] = None
+
+class PostBatchItem(BaseModel):
+    id: int
+    status: Literal["ok", "not_found", "forbidden"]
+    post: Optional[PostResponse] = None
+
+class PostBatchResponse(BaseModel):
+    results: List[PostBatchItem]
@@ -1,26 +1,27 @@
 from datetime import timedelta
 from typing import Optional
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
-from lib.auth import verify_password, create_access_token, create_refresh_token, ACCESS_TOKEN_EXPIRE_SECONDS
+from infra.database import DBSession
+from lib.auth import create_access_token, create_refresh_token, ACCESS_TOKEN_EXPIRE_SECONDS
+from lib.password_hasher import password_hasher
 from repositories.user_repository import user_repository
 from repositories.session_repository import session_repository
 
 class AuthService:
-    def signup(self, db: Session, fullname: str, email: str, password: str):
-        existing_user = user_repository.get_user_by_email(db, email)
+    async def signup(self, db: DBSession, fullname: str, email: str, password: str):
+        existing_user = await user_repository.get_user_by_email(db, email)
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
             )
         
-        user = user_repository.create_user(db, fullname, email, password)
+        user = await user_repository.create_user(db, fullname, email, password)
         return {"message": "User created successfully", "user_id": user.id}
     
-    def login(self, db: Session, email: str, password: str, device_name: str = None, ip_address: str = "", user_agent: str = ""):
-        user = user_repository.get_user_by_email(db, email)
-        if not user or not verify_password(password, user.hashed_password):
+    async def login(self, db: DBSession, email: str, password: str, device_name: str = None, ip_address: str = "", user_agent: str = ""):
+        user = await user_repository.get_user_by_email(db, email)
+        if not user or not await password_hasher.verify(password, user.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password"
@@ -28,7 +29,7 @@ class AuthService:
         
         # Refresh Token 생성 및 기기 세션 저장 (DB)
         refresh_token = create_refresh_token()
-        session_id = session_repository.create_device_session(
+        session_id = await session_repository.create_device_session(
             db, user.id, refresh_token, device_name, ip_address, user_agent
         )
         
@@ -46,33 +47,30 @@ class AuthService:
             "expires_in": ACCESS_TOKEN_EXPIRE_SECONDS
         }
     
-    def refresh_access_token(self, db: Session, refresh_token: str):
+    async def refresh_access_token(self, db: DBSession, refresh_token: str):
         """하이브리드 패턴: RT에서만 상태 검사"""
-        # 1. RT 검증 및 세션 조회 (DB)
-        session = session_repository.get_device_session(db, refresh_token)
-        if not session:
+        # 1. RT 검증 + 새 RT로 교체 (조건부 UPDATE 한 번, 활성/미만료 세션만)
+        new_refresh_token = create_refresh_token()
+        rotated = await session_repository.rotate_refresh_token(db, refresh_token, new_refresh_token)
+        if not rotated:
+            # 2. 이미 교체된 RT의 재사용이면 세션 전체 무효화
+            if await session_repository.revoke_reused_refresh_token(db, refresh_token):
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Refresh token reuse detected, session revoked"
+                )
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid or expired refresh token"
             )
         
-        # 2. 세션 상태 검증 (DB 기준)
-        if session.revoked_at:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Session revoked"
-            )
-        
         # 3. 사용자 존재는 세션이 있으면 보장됨 (FK 제약조건)
+        session_id, user_id = rotated
         
-        # 4. 새 RT 생성 및 기존 RT 무효화 (RT rotation)
-        new_refresh_token = create_refresh_token()
-        session_repository.update_refresh_token(db, str(session.id), new_refresh_token)
-        
-        # 5. 새 AT 발급 (stateless)
+        # 4. 새 AT 발급 (stateless)
         access_token = create_access_token({
-            "sub": str(session.user_id),
-            "sid": str(session.id)
+            "sub": str(user_id),
+            "sid": session_id
         })
         
         return {
@@ -82,19 +80,19 @@ class AuthService:
             "expires_in": ACCESS_TOKEN_EXPIRE_SECONDS
         }
     
-    def logout_session(self, db: Session, user_id: int, session_id: str):
+    async def logout_session(self, db: DBSession, user_id: int, session_id: str):
         """특정 세션 로그아웃"""
-        session_repository.revoke_device_session(db, user_id, session_id, "user_logout")
+        await session_repository.revoke_device_session(db, user_id, session_id, "user_logout")
         return True
     
-    def logout_all_sessions(self, db: Session, user_id: int):
+    async def logout_all_sessions(self, db: DBSession, user_id: int):
         """모든 세션 로그아웃 - RT 갱신 시 차단"""
-        session_repository.revoke_all_user_sessions(db, user_id, "logout_all")
+        await session_repository.revoke_all_user_sessions(db, user_id, "logout_all")
         return True
     
-    def get_user_sessions(self, db: Session, user_id: int):
+    async def get_user_sessions(self, db: DBSession, user_id: int):
         """사용자의 모든 활성 세션 조회"""
-        sessions = session_repository.get_user_devices(db, user_id)
+        sessions = await session_repository.get_user_devices(db, user_id)
         return {"sessions": sessions}
 
 auth_service = AuthService()
\ No newline at end of file
@@ -1,22 +1,25 @@
-from typing import List
+from typing import List, Optional, Union
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from infra.database import DBSession
+from lib.etag import make_etag
+from repositories.board_cache import BoardMeta
 from repositories.board_repository import board_repository
+from schemas.board import BoardResponse, BoardBatchItem, BoardBatchResponse
 
 class BoardService:
-    def create_board(self, db: Session, name: str, public: bool, user_id: int):
-        existing_board = board_repository.get_board_by_name(db, name)
+    async def create_board(self, db: DBSession, name: str, public: bool, user_id: int):
+        existing_board = await board_repository.get_board_by_name(db, name)
         if existing_board:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Board name already exists"
             )
         
-        board = board_repository.create_board(db, name, public, user_id)
+        board = await board_repository.create_board(db, name, public, user_id)
         return board
     
-    def get_board(self, db: Session, board_id: int, user_id: int):
-        board = board_repository.get_board_by_id(db, board_id)
+    async def get_board(self, db: DBSession, board_id: int, user_id: int) -> BoardResponse:
+        board = await board_repository.get_board_meta(db, board_id)
         if not board:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -29,14 +32,40 @@ class BoardService:
                 detail="Access denied"
             )
         
-        return board
+        return board.to_response()
+    
+    @staticmethod
+    def board_etag(board: Union[BoardMeta, BoardResponse]) -> str:
+        return make_etag("board", board.id, board.name, board.public, board.owner_id, board.post_count, board.created_at)
+    
+    async def get_boards_batch(self, db: DBSession, board_ids: List[int], user_id: int) -> BoardBatchResponse:
+        """여러 게시판을 한 번에 조회, ID별로 결과 표시 (없음/권한 없음은 에러 대신 상태로)"""
+        boards = await board_repository.get_board_metas(db, board_ids)
+        
+        results = []
+        for board_id in board_ids:
+            board = boards.get(board_id)
+            if not board:
+                results.append(BoardBatchItem.model_construct(id=board_id, status="not_found"))
+            elif not board.public and board.owner_id != user_id:
+                results.append(BoardBatchItem.model_construct(id=board_id, status="forbidden"))
+            else:
+                results.append(BoardBatchItem.model_construct(id=board_id, status="ok", board=board.to_response()))
+        return BoardBatchResponse.model_construct(results=results)
     
-    def list_boards(self, db: Session, user_id: int, limit: int = 20, offset: int = 0):
-        boards = board_repository.get_accessible_boards(db, user_id, limit, offset)
+    async def list_boards(self, db: DBSession, user_id: int, limit: int = 20, offset: int = 0, cursor_post_count: Optional[int] = None, cursor_id: Optional[int] = None):
+        # offset은 하위 호환용, cursor가 있거나 첫 페이지면 keyset으로 조회
+        if offset and cursor_id is None:
+            return await board_repository.get_accessible_boards_by_offset(db, user_id, limit, offset)
+        
+        # Redis 순위 인덱스가 준비되지 않았거나 장애면 SQL keyset으로
+        boards = await board_repository.get_ranked_boards(db, user_id, limit, cursor_post_count, cursor_id)
+        if boards is None:
+            boards = await board_repository.get_accessible_boards(db, user_id, limit, cursor_post_count, cursor_id)
         return boards
     
-    def update_board(self, db: Session, board_id: int, user_id: int, name: str = None, public: bool = None):
-        board = board_repository.get_board_by_id(db, board_id)
+    async def update_board(self, db: DBSession, board_id: int, user_id: int, name: str = None, public: bool = None):
+        board = await board_repository.get_board_meta(db, board_id)
         if not board:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -50,17 +79,19 @@ class BoardService:
             )
         
         if name and name != board.name:
-            existing_board = board_repository.get_board_by_name(db, name)
+            existing_board = await board_repository.get_board_by_name(db, name)
             if existing_board:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Board name already exists"
                 )
         
-        return board_repository.update_board(db, board, name, public)
+        # 권한 확인은 캐시로, 수정은 ORM 인스턴스로
+        board = await self._get_board_entity(db, board_id)
+        return await board_repository.update_board(db, board, name, public)
     
-    def delete_board(self, db: Session, board_id: int, user_id: int):
-        board = board_repository.get_board_by_id(db, board_id)
+    async def delete_board(self, db: DBSession, board_id: int, user_id: int):
+        board = await board_repository.get_board_meta(db, board_id)
         if not board:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -73,6 +104,16 @@ class BoardService:
                 detail="Only board owner can delete"
             )
         
-        board_repository.delete_board(db, board)
+        board = await self._get_board_entity(db, board_id)
+        await board_repository.delete_board(db, board)
+    
+    async def _get_board_entity(self, db: DBSession, board_id: int):
+        board = await board_repository.get_board_by_id(db, board_id)
+        if not board:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Board not found"
+            )
+        return board
 
 board_service = BoardService()
\ No newline at end of file
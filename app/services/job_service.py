@@ -0,0 +1,47 @@
+import os
+from infra.database import open_session, DB_ASYNC_MODE
+from infra.scheduler import scheduler
+from repositories.board_repository import board_repository
+from repositories.session_activity import session_activity
+from repositories.session_repository import session_repository
+
+# 작업별 실행 주기/제한 시간 (초)
+BOARD_SYNC_INTERVAL = float(os.getenv("BOARD_SYNC_INTERVAL", "60"))
+BOARD_SYNC_TIMEOUT = float(os.getenv("BOARD_SYNC_TIMEOUT", "50"))
+SESSION_CLEANUP_INTERVAL = float(os.getenv("SESSION_CLEANUP_INTERVAL", "3600"))
+SESSION_CLEANUP_TIMEOUT = float(os.getenv("SESSION_CLEANUP_TIMEOUT", "600"))
+SESSION_STATS_INTERVAL = float(os.getenv("SESSION_STATS_INTERVAL", "300"))
+SESSION_STATS_TIMEOUT = float(os.getenv("SESSION_STATS_TIMEOUT", "60"))
+SESSION_ACTIVITY_FLUSH_INTERVAL = float(os.getenv("SESSION_ACTIVITY_FLUSH_INTERVAL", "30"))
+SESSION_ACTIVITY_FLUSH_TIMEOUT = float(os.getenv("SESSION_ACTIVITY_FLUSH_TIMEOUT", "25"))
+
+class JobService:
+    """manage.py 관리 명령어와 같은 작업을 스케줄러에서 주기적으로 실행"""
+
+    async def sync_post_counts(self) -> dict:
+        async with open_session() as db:
+            result = await board_repository.update_board_post_counts(db)
+        return {"boards": result.boards, "chunks": result.chunks, "skipped_chunks": result.skipped_chunks}
+
+    async def cleanup_sessions(self) -> dict:
+        async with open_session() as db:
+            return await session_repository.cleanup_sessions(db)
+
+    async def flush_session_activity(self) -> dict:
+        async with open_session() as db:
+            return {"sessions": await session_activity.flush(db)}
+
+    async def session_stats(self) -> dict:
+        async with open_session() as db:
+            return await session_repository.get_session_stats(db)
+
+    def register(self):
+        # 주기의 10%를 jitter로 사용해 여러 워커의 시도 시점을 분산
+        # 동기 DB 모드는 문장을 스레드풀에서 실행하므로 취소해도 문장이 멈추지 않고 세션이 다른 스레드에서 닫힘: 제한 시간은 권고로만 사용
+        cancellable = DB_ASYNC_MODE
+        scheduler.add("board_sync", self.sync_post_counts, BOARD_SYNC_INTERVAL, BOARD_SYNC_TIMEOUT, jitter=BOARD_SYNC_INTERVAL * 0.1, cancellable=cancellable)
+        scheduler.add("session_cleanup", self.cleanup_sessions, SESSION_CLEANUP_INTERVAL, SESSION_CLEANUP_TIMEOUT, jitter=SESSION_CLEANUP_INTERVAL * 0.1, cancellable=cancellable)
+        scheduler.add("session_activity_flush", self.flush_session_activity, SESSION_ACTIVITY_FLUSH_INTERVAL, SESSION_ACTIVITY_FLUSH_TIMEOUT, jitter=SESSION_ACTIVITY_FLUSH_INTERVAL * 0.1, cancellable=cancellable)
+        scheduler.add("session_stats", self.session_stats, SESSION_STATS_INTERVAL, SESSION_STATS_TIMEOUT, jitter=SESSION_STATS_INTERVAL * 0.1, cancellable=cancellable)
+
+job_service = JobService()
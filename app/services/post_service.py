@@ -1,13 +1,16 @@
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Union
 from datetime import datetime
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from infra.database import DBSession, open_session
+from lib.etag import make_etag
 from repositories.post_repository import post_repository
 from repositories.board_repository import board_repository
+from repositories.post_search import post_search
+from schemas.post import PostResponse, PostListResponse, PostSummaryListResponse, PostBatchItem, PostBatchResponse
 
 class PostService:
-    def create_post(self, db: Session, title: str, content: str, board_id: int, user_id: int):
-        board = board_repository.get_board_by_id(db, board_id)
+    async def create_post(self, db: DBSession, title: str, content: str, board_id: int, user_id: int):
+        board = await board_repository.get_board_meta(db, board_id)
         if not board:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -20,18 +23,18 @@ class PostService:
                 detail="Cannot create post in this board"
             )
         
-        post = post_repository.create_post(db, title, content, board_id, user_id)
+        post = await post_repository.create_post(db, title, content, board_id, user_id)
         return post
     
-    def get_post(self, db: Session, post_id: int, user_id: int):
-        post = post_repository.get_post_by_id(db, post_id)
+    async def get_post(self, db: DBSession, post_id: int, user_id: int):
+        post = await post_repository.get_post_by_id(db, post_id)
         if not post:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Post not found"
             )
         
-        board = post.board
+        board = await board_repository.get_board_meta(db, post.board_id)
         if not board.public and board.owner_id != user_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -40,21 +43,54 @@ class PostService:
         
         return post
     
-    def list_posts(self, db: Session, board_id: int, user_id: int, cursor_time: Optional[datetime] = None, cursor_id: Optional[int] = None, limit: int = 20) -> Dict[str, Any]:
-        board = board_repository.get_board_by_id(db, board_id)
-        if not board:
+    async def get_post_etag(self, db: DBSession, post_id: int, user_id: int) -> str:
+        """게시글을 읽지 않고 버전 컬럼만으로 ETag 계산 (권한 확인은 get_post와 같음)"""
+        version = await post_repository.get_post_version(db, post_id)
+        if not version:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail="Board not found"
+                detail="Post not found"
             )
         
+        board = await board_repository.get_board_meta(db, version.board_id)
         if not board.public and board.owner_id != user_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Access denied"
             )
         
-        posts = post_repository.get_posts_by_board(db, board_id, cursor_time, cursor_id, limit)
+        return self.post_etag(version)
+    
+    @staticmethod
+    def post_etag(post) -> str:
+        # 제목/본문 수정마다 version이 올라가고 나머지 필드는 바뀌지 않음 (updated_at은 SQLite에서 초 단위라 쓰지 않음)
+        return make_etag("post", post.id, post.version)
+    
+    async def get_posts_batch(self, db: DBSession, post_ids: List[int], user_id: int) -> PostBatchResponse:
+        """여러 게시글을 한 번에 조회, ID별로 결과 표시 (없음/권한 없음은 에러 대신 상태로)"""
+        posts = {post.id: post for post in await post_repository.get_posts_by_ids(db, post_ids)}
+        boards = await board_repository.get_board_metas(db, list({post.board_id for post in posts.values()}))
+        
+        results = []
+        for post_id in post_ids:
+            post = posts.get(post_id)
+            board = boards.get(post.board_id) if post else None
+            if not post or not board:
+                results.append(PostBatchItem.model_construct(id=post_id, status="not_found"))
+            elif not board.public and board.owner_id != user_id:
+                results.append(PostBatchItem.model_construct(id=post_id, status="forbidden"))
+            else:
+                results.append(PostBatchItem.model_construct(id=post_id, status="ok", post=post))
+        return PostBatchResponse.model_construct(results=results)
+    
+    async def list_posts(self, db: DBSession, board_id: int, user_id: int, cursor_time: Optional[datetime] = None, cursor_id: Optional[int] = None, limit: int = 20, view: str = "full") -> Union[PostListResponse, PostSummaryListResponse]:
+        await self._check_board_readable(db, board_id, user_id)
+        
+        # summary는 본문 대신 excerpt와 content_length (전체 본문은 GET /posts/{post_id})
+        if view == "summary":
+            posts = await post_repository.get_post_summaries_by_board(db, board_id, cursor_time, cursor_id, limit)
+        else:
+            posts = await post_repository.get_posts_by_board(db, board_id, cursor_time, cursor_id, limit)
         
         next_cursor_time = None
         next_cursor_id = None
@@ -63,14 +99,68 @@ class PostService:
             next_cursor_time = last_post.created_at
             next_cursor_id = last_post.id
         
+        # 게시글은 repository가 만든 응답 모델이므로 검증 없이 감쌈
+        response_model = PostSummaryListResponse if view == "summary" else PostListResponse
+        return response_model.model_construct(posts=posts, next_cursor_time=next_cursor_time, next_cursor_id=next_cursor_id)
+    
+    async def search_posts(self, db: DBSession, query: str, user_id: int, board_id: Optional[int] = None, cursor_rank: Optional[float] = None, cursor_id: Optional[int] = None, limit: int = 20) -> Dict[str, Any]:
+        """board_id가 있으면 해당 게시판(권한 확인은 list_posts와 같음), 없으면 접근 가능한 모든 게시판에서 검색"""
+        if board_id is not None:
+            await self._check_board_readable(db, board_id, user_id)
+        
+        posts = await post_search.search(db, query, user_id, board_id, cursor_rank, cursor_id, limit)
+        
+        next_cursor_rank = None
+        next_cursor_id = None
+        if len(posts) == limit:
+            last_post = posts[-1]
+            next_cursor_rank = last_post.rank
+            next_cursor_id = last_post.id
+        
         return {
             "posts": posts,
-            "next_cursor_time": next_cursor_time,
+            "next_cursor_rank": next_cursor_rank,
             "next_cursor_id": next_cursor_id
         }
     
-    def update_post(self, db: Session, post_id: int, user_id: int, title: str, content: str):
-        post = post_repository.get_post_by_id(db, post_id)
+    async def get_posts_page_etag(self, db: DBSession, board_id: int, user_id: int, cursor_time: Optional[datetime] = None, cursor_id: Optional[int] = None, limit: int = 20, view: str = "full") -> str:
+        """목록을 읽지 않고 게시판 쓰기 버전(없으면 페이지 행의 버전 컬럼)으로 ETag 계산"""
+        await self._check_board_readable(db, board_id, user_id)
+        version = await post_repository.get_board_page_version(db, board_id, cursor_time, cursor_id, limit)
+        return make_etag("posts", board_id, view, limit, cursor_time, cursor_id, version)
+    
+    async def _check_board_readable(self, db: DBSession, board_id: int, user_id: int):
+        board = await board_repository.get_board_meta(db, board_id)
+        if not board:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Board not found"
+            )
+        
+        if not board.public and board.owner_id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access denied"
+            )
+    
+    async def export_posts(self, db: DBSession, board_id: int, user_id: int, cursor_time: Optional[datetime] = None, cursor_id: Optional[int] = None) -> AsyncIterator[bytes]:
+        """게시판 전체 게시글 NDJSON 스트림 (권한 확인은 list_posts와 같고, 응답을 시작하기 전에 404/403)"""
+        await self._check_board_readable(db, board_id, user_id)
+        return self._export_stream(board_id, cursor_time, cursor_id)
+    
+    async def _export_stream(self, board_id: int, cursor_time: Optional[datetime], cursor_id: Optional[int]) -> AsyncIterator[bytes]:
+        # 스트리밍은 엔드포인트가 반환된 뒤에 진행되므로 요청 세션 대신 전용 세션으로 커서를 끝까지 유지
+        async with open_session() as db:
+            async for posts in post_repository.stream_posts_by_board(db, board_id, cursor_time, cursor_id):
+                yield self.posts_to_ndjson(posts)
+    
+    @staticmethod
+    def posts_to_ndjson(posts: list) -> bytes:
+        """한 줄에 PostResponse JSON 하나 (fetch한 batch마다 chunk 하나, manage.py board export도 사용)"""
+        return "".join(PostResponse.model_validate(post).model_dump_json() + "\n" for post in posts).encode()
+    
+    async def update_post(self, db: DBSession, post_id: int, user_id: int, title: str, content: str):
+        post = await post_repository.get_post_by_id(db, post_id)
         if not post:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -83,10 +173,10 @@ class PostService:
                 detail="Only post author can update"
             )
         
-        return post_repository.update_post(db, post, title, content)
+        return await post_repository.update_post(db, post, title, content)
     
-    def delete_post(self, db: Session, post_id: int, user_id: int):
-        post = post_repository.get_post_by_id(db, post_id)
+    async def delete_post(self, db: DBSession, post_id: int, user_id: int):
+        post = await post_repository.get_post_by_id(db, post_id)
         if not post:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -99,6 +189,6 @@ class PostService:
                 detail="Only post author can delete"
             )
         
-        post_repository.delete_post(db, post)
+        await post_repository.delete_post(db, post)
 
 post_service = PostService()
\ No newline at end of file
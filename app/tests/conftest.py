@@ -0,0 +1,71 @@
+"""테스트 공통 준비 (SQLite 파일 + fakeredis, 테스트마다 DB/Redis/메모리 캐시 초기화)
+
+환경 변수 기본값을 정하므로 앱 모듈보다 먼저 로드되어야 한다 (pytest가 conftest를 먼저 import함).
+실행: cd app && python -m pytest (requirements-dev.txt 필요)
+"""
+import os
+import tempfile
+
+_TEST_DIR = tempfile.mkdtemp(prefix="community-tests-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_TEST_DIR}/test.db")
+os.environ.setdefault("REDIS_URL", "fakeredis://")
+os.environ.setdefault("SCHEDULER_ENABLED", "false")
+
+import asyncio
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from entities import Base, User, Board
+from infra.database import engine, async_engine, create_tables, dispose_engines
+from infra.redis_client import REDIS_URL, redis_client, close_redis
+from lib.auth import create_access_token
+from repositories.board_cache import board_cache
+from repositories.post_page_cache import post_page_cache
+
+if engine.dialect.name != "sqlite" or not REDIS_URL.startswith("fakeredis://"):
+    raise RuntimeError("tests drop all tables and flush Redis; run them against SQLite and fakeredis only")
+
+def run(coro):
+    """코루틴을 새 이벤트 루프에서 실행
+
+    Redis/async DB 연결은 만든 이벤트 루프에 묶이므로 끝나기 전에 풀을 비운다.
+    """
+    async def main():
+        try:
+            if async_engine is not None:
+                # 풀을 비운 뒤 첫 연결은 SQLAlchemy가 잠금을 잡고 초기화하므로 동시 요청 전에 먼저 연결
+                async with async_engine.connect():
+                    pass
+            return await coro
+        finally:
+            await close_redis()
+            await dispose_engines()
+    return asyncio.run(main())
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    Base.metadata.drop_all(engine)
+    create_tables()
+    redis_client.flushall()
+    board_cache.local.clear()
+    post_page_cache._dirty.clear()
+    yield
+    engine.dispose()
+
+@pytest.fixture
+def client():
+    from main import app
+    with TestClient(app) as client:
+        yield client
+
+def insert_user(email: str = "user@test.example.com") -> int:
+    with engine.begin() as conn:
+        return conn.execute(insert(User).values(fullname="user", email=email, hashed_password="x")).inserted_primary_key[0]
+
+def insert_board(owner_id: int, name: str = "board", public: bool = True, post_count: int = 0) -> int:
+    with engine.begin() as conn:
+        return conn.execute(insert(Board).values(name=name, public=public, owner_id=owner_id, post_count=post_count)).inserted_primary_key[0]
+
+def auth_headers(user_id: int) -> dict:
+    """세션 없이 발급한 AT (sid 없음), 요청마다 로그인(bcrypt)하지 않도록"""
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user_id)})}"}
@@ -0,0 +1,107 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from infra.redis_client import redis_client
+from repositories.board_cache import BoardCache, BoardMeta
+from tests.conftest import run
+
+def board_entity(board_id: int, name: str = "board") -> SimpleNamespace:
+    return SimpleNamespace(id=board_id, name=name, public=True, owner_id=1, post_count=0, created_at=datetime(2024, 1, 1))
+
+class GatedLoader:
+    """gate가 열릴 때까지 DB 조회가 끝나지 않는 loader (호출 횟수 기록)"""
+
+    def __init__(self):
+        self.gate = asyncio.Event()
+        self.calls = []
+
+    async def one(self, board_id: int, name: str = "board"):
+        self.calls.append([board_id])
+        await self.gate.wait()
+        return board_entity(board_id, name)
+
+    async def many(self, board_ids: list):
+        self.calls.append(list(board_ids))
+        await self.gate.wait()
+        return [BoardMeta.from_entity(board_entity(board_id)) for board_id in board_ids]
+
+def test_concurrent_misses_share_one_load():
+    cache = BoardCache()
+
+    async def scenario():
+        loader = GatedLoader()
+        tasks = [asyncio.create_task(cache.get_or_load(1, lambda: loader.one(1))) for _ in range(10)]
+        await asyncio.sleep(0)
+        loader.gate.set()
+        metas = await asyncio.gather(*tasks)
+        return loader, metas
+
+    loader, metas = run(scenario())
+    assert loader.calls == [[1]]
+    assert all(meta == metas[0] for meta in metas)
+    assert cache.singleflight_joins == 9
+    assert cache.db_loads == 1
+    # 두 계층 모두 채워짐
+    assert cache.local.get(1) == metas[0]
+    assert BoardMeta.from_json(redis_client.get(f"{BoardCache.KEY_PREFIX}1")) == metas[0]
+
+def test_failed_load_is_shared_and_not_cached():
+    cache = BoardCache()
+
+    async def failing():
+        await asyncio.sleep(0)
+        raise RuntimeError("db down")
+
+    async def scenario():
+        return await asyncio.gather(*[cache.get_or_load(1, failing) for _ in range(3)], return_exceptions=True)
+
+    results = run(scenario())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert cache.db_loads == 0
+    assert cache.local.get(1) is None
+    assert not cache._inflight and not cache._loading
+
+def test_invalidation_during_load_skips_caching():
+    cache = BoardCache()
+
+    async def scenario():
+        loader = GatedLoader()
+        single = asyncio.create_task(cache.get_or_load(1, lambda: loader.one(1, "old")))
+        many = asyncio.create_task(cache.get_many_or_load([1, 2], loader.many))
+        await asyncio.sleep(0)
+        await cache.invalidate(1)
+        loader.gate.set()
+        return await single, await many
+
+    meta, metas = run(scenario())
+    # 무효화 이전에 읽은 값은 응답에만 쓰고 캐시에는 남기지 않음
+    assert meta.name == "old" and set(metas) == {1, 2}
+    assert cache.local.get(1) is None
+    assert not redis_client.exists(f"{BoardCache.KEY_PREFIX}1")
+    assert cache.local.get(2) == metas[2]
+    # 세대 번호는 로드 중인 게시판만 기록하고 로드가 끝나면 지움
+    assert not cache._generations and not cache._loading
+
+def test_invalidations_without_loads_keep_no_state():
+    cache = BoardCache()
+    cache.evict_local(range(10000))
+    assert not cache._generations and not cache._loading
+
+def test_get_many_reads_each_tier_once():
+    cache = BoardCache()
+    loader = GatedLoader()
+    loader.gate.set()
+
+    run(cache.get_or_load(1, lambda: loader.one(1)))
+    cache.local.clear()
+    run(cache.get_or_load(2, lambda: loader.one(2)))
+    loader.calls.clear()
+
+    # 1: Redis, 2: 메모리, 3/4: DB 한 번 (없는 게시판 5는 결과에서 제외)
+    async def missing_aware(board_ids):
+        return [meta for meta in await loader.many(board_ids) if meta.id != 5]
+
+    found = run(cache.get_many_or_load([1, 2, 3, 4, 5, 2], missing_aware))
+    assert sorted(found) == [1, 2, 3, 4]
+    assert loader.calls == [[3, 4, 5]]
+    assert all(cache.local.get(board_id) is not None for board_id in (1, 2, 3, 4))
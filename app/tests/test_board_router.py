@@ -0,0 +1,37 @@
+import pytest
+from tests.conftest import insert_user, insert_board, auth_headers
+
+@pytest.fixture
+def boards():
+    owner_id = insert_user()
+    return owner_id, [insert_board(owner_id, f"board-{i}", post_count=i) for i in range(3)]
+
+def test_batch_operation(client, boards):
+    owner_id, board_ids = boards
+    response = client.get(f"/boards/batch?ids={board_ids[2]},{board_ids[0]},999", headers=auth_headers(owner_id))
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [(result["id"], result["status"]) for result in results] == [(board_ids[2], "ok"), (board_ids[0], "ok"), (999, "not_found")]
+
+    # 이전 형식도 같은 결과
+    legacy = client.get(f"/boards/?ids={board_ids[2]},{board_ids[0]},999", headers=auth_headers(owner_id))
+    assert legacy.json() == response.json()
+
+@pytest.mark.parametrize("param", ["limit=5", "cursor_post_count=1", "cursor_id=1", "offset=0"])
+def test_ids_with_list_params_is_rejected(client, boards, param):
+    owner_id, board_ids = boards
+    response = client.get(f"/boards/?ids={board_ids[0]}&{param}", headers=auth_headers(owner_id))
+    assert response.status_code == 422
+    assert param.split("=")[0] in response.json()["detail"]
+
+def test_list_without_ids(client, boards):
+    owner_id, board_ids = boards
+    response = client.get("/boards/?limit=2", headers=auth_headers(owner_id))
+    assert [board["id"] for board in response.json()] == [board_ids[2], board_ids[1]]
+
+def test_batch_is_a_separate_operation(client):
+    paths = client.get("/openapi.json").json()["paths"]
+    batch = paths["/boards/batch"]["get"]
+    assert batch["responses"]["200"]["content"]["application/json"]["schema"] == {"$ref": "#/components/schemas/BoardBatchResponse"}
+    ids = next(parameter for parameter in paths["/boards/"]["get"]["parameters"] if parameter["name"] == "ids")
+    assert ids["deprecated"] is True
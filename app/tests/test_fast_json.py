@@ -0,0 +1,162 @@
+import json
+from functools import wraps
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, TypeAdapter
+from lib.fast_json import FastJSONRoute, contains_float
+from routers import board_router, post_router
+from schemas.post import PostSearchResponse, PostListResponse
+from tests.conftest import insert_user, insert_board, auth_headers
+
+# 제어 문자, 따옴표/역슬래시, 비ASCII, 서로게이트 쌍, 줄 구분자 등 JSON escape 규칙이 갈릴 수 있는 문자열
+TRICKY_TEXT = 'a"b\\c/\x00\x01\x1f\x7f\t\n\r 한글 é 😀    <script>&amp;'
+
+def fast_json_routes():
+    return [
+        route for router in (board_router.router, post_router.router) for route in router.routes
+        if isinstance(route, APIRoute)
+    ]
+
+class ReplayApp:
+    """fast_json route의 endpoint 반환값을 기록하고, 같은 값을 기본 FastAPI 직렬화 route로 다시 응답하는 앱
+
+    쓰기 요청도 같은 반환값으로 두 경로의 출력을 비교할 수 있다.
+    """
+
+    def __init__(self):
+        self.app = FastAPI()
+        self.recorded = {}
+        self.replay_paths = {}
+        fast = APIRouter()
+        default = APIRouter()
+        for index, route in enumerate(fast_json_routes()):
+            key = (next(iter(route.methods)), route.path_format)
+            fast.add_api_route(
+                route.path_format, self._recording(route.endpoint, key), methods=list(route.methods),
+                response_model=route.response_model, status_code=route.status_code,
+                route_class_override=FastJSONRoute,
+            )
+            self.replay_paths[key] = f"/replay/{index}"
+            default.add_api_route(
+                self.replay_paths[key], self._replay(key), methods=["GET"],
+                response_model=route.response_model, status_code=route.status_code,
+            )
+        self.app.include_router(fast)
+        self.app.include_router(default)
+        self.fast_routes = {
+            (next(iter(route.methods)), route.path_format): route
+            for route in self.app.routes if isinstance(route, FastJSONRoute)
+        }
+
+    def _recording(self, endpoint, key):
+        @wraps(endpoint)
+        async def recording(*args, **kwargs):
+            content = await endpoint(*args, **kwargs)
+            self.recorded[key] = content
+            return content
+        return recording
+
+    def _replay(self, key):
+        async def replay():
+            return self.recorded[key]
+        return replay
+
+@pytest.fixture
+def replay():
+    replay = ReplayApp()
+    with TestClient(replay.app) as client:
+        replay.client = client
+        yield replay
+
+@pytest.fixture
+def data():
+    owner_id = insert_user("owner@test.example.com")
+    other_id = insert_user("other@test.example.com")
+    return {
+        "owner_id": owner_id,
+        "other_id": other_id,
+        "public_id": insert_board(owner_id, f"public {TRICKY_TEXT}", post_count=2**40),
+        "private_id": insert_board(owner_id, "private", public=False),
+    }
+
+def test_wrapped_routes_match_default_serialization(replay, data):
+    owner = auth_headers(data["owner_id"])
+    other = auth_headers(data["other_id"])
+    public_id, private_id = data["public_id"], data["private_id"]
+    compared = set()
+
+    def check(method: str, route_path: str, url: str, headers: dict, **kwargs):
+        key = (method, route_path)
+        replay.recorded.pop(key, None)
+        response = replay.client.request(method, url, headers=headers, **kwargs)
+        assert response.status_code < 300, (url, response.status_code, response.text)
+        expected = replay.client.get(replay.replay_paths[key])
+        assert response.status_code == expected.status_code
+        assert response.headers["content-type"] == expected.headers["content-type"]
+        assert response.content == expected.content, url
+        compared.add(key)
+        return response.json()
+
+    post_ids = [
+        check("POST", "/boards/{board_id}/posts", f"/boards/{public_id}/posts", owner,
+              json={"title": f"{TRICKY_TEXT} {i}", "content": TRICKY_TEXT * (i + 1)})["id"]
+        for i in range(5)
+    ]
+    check("POST", "/boards/{board_id}/posts", f"/boards/{private_id}/posts", owner, json={"title": "secret", "content": "secret"})
+    check("POST", "/boards/", "/boards/", other, json={"name": f"other {TRICKY_TEXT}", "public": True})
+
+    check("GET", "/boards/{board_id}", f"/boards/{public_id}", other)
+    check("GET", "/boards/", "/boards/?limit=2", owner)
+    check("GET", "/boards/", "/boards/?offset=1", owner)
+    check("GET", "/boards/batch", f"/boards/batch?ids={public_id},{private_id},999", other)
+    check("GET", "/boards/", f"/boards/?ids={public_id},{private_id},999", other)
+
+    check("GET", "/posts/{post_id}", f"/posts/{post_ids[0]}", other)
+    check("GET", "/posts", f"/posts?ids={post_ids[0]},{post_ids[1]},999,{post_ids[-1] + 1}", other)
+    # 첫 페이지(페이지 캐시 채우기/적중), cursor 페이지, 요약 보기
+    for url in (f"/boards/{public_id}/posts?limit=2", f"/boards/{public_id}/posts?limit=2", f"/boards/{public_id}/posts?view=summary"):
+        page = check("GET", "/boards/{board_id}/posts", url, other)
+    cursor = page["posts"][1]
+    check("GET", "/boards/{board_id}/posts", f"/boards/{public_id}/posts?limit=2&cursor_time={cursor['created_at']}&cursor_id={cursor['id']}", other)
+
+    check("PUT", "/posts/{post_id}", f"/posts/{post_ids[0]}", owner, json={"title": TRICKY_TEXT, "content": "수정"})
+    check("PUT", "/boards/{board_id}", f"/boards/{public_id}", owner, json={"name": f"renamed {TRICKY_TEXT}"})
+
+    # fast_json으로 감싼 route는 모두 비교함 (새 route를 추가하면 여기에도 요청을 추가해야 함)
+    wrapped = {key for key, route in replay.fast_routes.items() if route.fast_json}
+    assert compared == wrapped
+
+def test_float_models_use_default_serialization():
+    # pydantic-core와 json.dumps의 float 표기가 다름
+    assert TypeAdapter(float).dump_json(1e-05) != json.dumps(1e-05).encode()
+    assert TypeAdapter(float).dump_json(1e16) != json.dumps(1e16).encode()
+
+    assert contains_float(PostSearchResponse)
+    assert not contains_float(PostListResponse)
+    replay = ReplayApp()
+    assert not replay.fast_routes[("GET", "/posts/search")].fast_json
+    assert not replay.fast_routes[("GET", "/boards/{board_id}/posts/search")].fast_json
+
+def test_response_model_instances_are_not_revalidated():
+    class Item(BaseModel):
+        value: str
+
+    router = APIRouter(route_class=FastJSONRoute)
+
+    @router.get("/instance", response_model=Item)
+    async def instance():
+        # 응답 모델 인스턴스는 다시 검증하지 않고 그대로 직렬화 (검증했다면 int 값으로 500)
+        return Item.model_construct(value=1)
+
+    @router.get("/attributes", response_model=Item)
+    async def attributes():
+        return {"value": 1}
+
+    app = FastAPI()
+    app.include_router(router)
+    with TestClient(app, raise_server_exceptions=False) as client:
+        assert client.get("/instance").json() == {"value": 1}
+        # 응답 모델 인스턴스가 아니면 기본 경로처럼 검증 (int는 str로 변환되지 않음)
+        assert client.get("/attributes").status_code == 500
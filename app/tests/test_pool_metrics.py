@@ -0,0 +1,33 @@
+from sqlalchemy import text
+from infra.database import engine, open_session, db_execute, get_pool_stats, DB_ASYNC_MODE, DB_POOL_SIZE
+from tests.conftest import run
+
+def test_pool_stats_track_checkouts():
+    # open_session은 DB_ASYNC_MODE에 맞는 엔진의 풀을 사용
+    pool = "async" if DB_ASYNC_MODE else "sync"
+
+    async def queries(count: int) -> dict:
+        before = get_pool_stats()[pool]
+        for _ in range(count):
+            async with open_session() as db:
+                await db_execute(db, text("SELECT 1"))
+        return before
+
+    before = run(queries(5))
+    stats = get_pool_stats()
+    after = stats[pool]
+    assert stats["settings"]["pool_size"] == DB_POOL_SIZE
+    assert after["pool_class"].startswith("Instrumented")
+    assert after["checkouts"] - before["checkouts"] == 5
+    assert after["checkins"] - before["checkins"] == 5
+    assert after["checkout_wait"]["count"] - before["checkout_wait"]["count"] == 5
+    # 세션을 닫으면 연결이 모두 풀로 돌아옴
+    assert after["checked_out"] == 0
+
+def test_checked_out_counts_connections_in_use():
+    with engine.connect():
+        with engine.connect():
+            stats = get_pool_stats()["sync"]
+            assert stats["checked_out"] == 2
+            assert stats["max_in_use"] >= 2
+    assert get_pool_stats()["sync"]["checked_out"] == 0
@@ -0,0 +1,129 @@
+import asyncio
+import random
+from collections import Counter
+import pytest
+from sqlalchemy import select
+from entities import Board, PostCountSyncBatch
+from infra.database import SessionLocal, open_session
+from infra.redis_client import redis_client
+from repositories.board_cache import BoardMeta
+from repositories.board_repository import board_repository
+from repositories.post_count_sync import PostCountSync
+from tests.conftest import run, insert_user, insert_board
+
+class FailingPostCountSync(PostCountSync):
+    """fail_at번째 chunk를 반영한 뒤(커밋 전) 실패하는 동기화 (프로세스 중단 흉내)"""
+
+    def __init__(self, chunk_size: int, fail_at: int):
+        super().__init__(chunk_size)
+        self.fail_at = fail_at
+        self.applied = 0
+
+    async def _apply_chunk(self, db, chunk):
+        await super()._apply_chunk(db, chunk)
+        self.applied += 1
+        if self.applied == self.fail_at:
+            raise RuntimeError("injected failure")
+
+def create_boards(count: int) -> list:
+    owner_id = insert_user()
+    return [
+        BoardMeta(id=insert_board(owner_id, f"board-{i}"), name=f"board-{i}", public=True, owner_id=owner_id, post_count=0, created_at=None)
+        for i in range(count)
+    ]
+
+def post_counts() -> dict:
+    with SessionLocal() as db:
+        return dict(db.execute(select(Board.id, Board.post_count).order_by(Board.id)).all())
+
+async def sync_once(sync: PostCountSync):
+    async with open_session() as db:
+        return await sync.run(db)
+
+async def record(boards: list, amounts: list):
+    for board, amount in zip(boards, amounts):
+        for _ in range(abs(amount)):
+            if amount > 0:
+                await board_repository.increment_post_count_delta(board)
+            else:
+                await board_repository.decrement_post_count_delta(board)
+
+def test_sync_applies_deltas_once():
+    boards = create_boards(5)
+    run(record(boards, [3, 1, 0, 2, 4]))
+    run(record(boards[:1], [-1]))
+
+    result = run(sync_once(PostCountSync(chunk_size=2)))
+    assert (result.boards, result.chunks, result.skipped_chunks) == (4, 2, 0)
+    assert list(post_counts().values()) == [2, 1, 0, 2, 4]
+    assert not redis_client.exists(PostCountSync.LIVE_KEY, PostCountSync.POINTER_KEY)
+
+    # 반영할 증감량이 없으면 아무것도 바꾸지 않음
+    result = run(sync_once(PostCountSync(chunk_size=2)))
+    assert result.sync_id is None
+    assert list(post_counts().values()) == [2, 1, 0, 2, 4]
+
+def test_interrupted_sync_resumes_without_double_counting():
+    boards = create_boards(6)
+    run(record(boards, [1, 2, 3, 4, 5, 6]))
+
+    with pytest.raises(RuntimeError):
+        run(sync_once(FailingPostCountSync(chunk_size=2, fail_at=2)))
+    # 첫 chunk만 커밋되고 실패한 chunk는 롤백
+    assert list(post_counts().values()) == [1, 2, 0, 0, 0, 0]
+    snapshot_key = redis_client.get(PostCountSync.POINTER_KEY)
+    assert snapshot_key
+
+    # 중단된 동안 들어온 증감량은 새 해시에 쌓이고 다음 스냅샷으로 반영됨
+    run(record(boards[:2], [10, 10]))
+
+    result = run(sync_once(PostCountSync(chunk_size=2)))
+    assert result.sync_id == snapshot_key[len(PostCountSync.SNAPSHOT_PREFIX):]
+    assert (result.boards, result.chunks, result.skipped_chunks) == (4, 3, 1)
+    assert list(post_counts().values()) == [1, 2, 3, 4, 5, 6]
+    assert not redis_client.exists(snapshot_key, PostCountSync.POINTER_KEY)
+    with SessionLocal() as db:
+        assert db.scalars(select(PostCountSyncBatch)).all() == []
+
+    run(sync_once(PostCountSync(chunk_size=2)))
+    assert list(post_counts().values()) == [11, 12, 3, 4, 5, 6]
+
+def test_no_drift_under_concurrent_writes_and_failures():
+    boards = create_boards(50)
+    expected = Counter()
+    failures = Counter()
+
+    async def writer(rng: random.Random, operations: int):
+        for _ in range(operations):
+            board = rng.choice(boards)
+            if expected[board.id] > 0 and rng.random() < 0.3:
+                expected[board.id] -= 1
+                await board_repository.decrement_post_count_delta(board)
+            else:
+                expected[board.id] += 1
+                await board_repository.increment_post_count_delta(board)
+            await asyncio.sleep(0)
+
+    async def syncer(stop: asyncio.Event, rng: random.Random):
+        while not stop.is_set():
+            sync = FailingPostCountSync(chunk_size=7, fail_at=1 if rng.random() < 0.3 else 0)
+            try:
+                await sync_once(sync)
+            except RuntimeError:
+                failures["sync"] += 1
+            await asyncio.sleep(0)
+
+    async def scenario():
+        stop = asyncio.Event()
+        sync_task = asyncio.create_task(syncer(stop, random.Random(0)))
+        await asyncio.gather(*[writer(random.Random(seed), 300) for seed in range(1, 9)])
+        stop.set()
+        await sync_task
+        # 남은 증감량(실패로 남은 스냅샷 포함)을 모두 반영
+        while redis_client.exists(PostCountSync.LIVE_KEY, PostCountSync.POINTER_KEY):
+            await sync_once(PostCountSync(chunk_size=7))
+
+    run(scenario())
+    assert failures["sync"] > 0
+    assert not redis_client.exists(PostCountSync.LIVE_KEY, PostCountSync.POINTER_KEY)
+    assert post_counts() == {board.id: expected[board.id] for board in boards}
@@ -0,0 +1,45 @@
+import pytest
+from redis.exceptions import RedisError
+from infra.redis_client import async_redis_client, redis_client
+from repositories.post_page_cache import post_page_cache
+from tests.conftest import insert_user, insert_board, auth_headers
+
+@pytest.fixture
+def board(client):
+    owner_id = insert_user()
+    board_id = insert_board(owner_id)
+    headers = auth_headers(owner_id)
+    post_ids = [client.post(f"/boards/{board_id}/posts", json={"title": f"post {i}", "content": "c"}, headers=headers).json()["id"] for i in range(3)]
+    return board_id, headers, post_ids
+
+def failing(*args, **kwargs):
+    raise RedisError("redis down")
+
+def test_failed_drop_falls_back_to_row_validator(client, board, monkeypatch):
+    board_id, headers, post_ids = board
+    url = f"/boards/{board_id}/posts"
+    before = client.get(url, headers=headers)
+    assert before.json()["posts"][0]["title"] == "post 2"
+    etag = before.headers["etag"]
+    version_key = post_page_cache._keys(board_id)[3]
+    stale_version = redis_client.get(version_key)
+
+    # 커밋 후 캐시 갱신과 drop이 모두 실패 → 이전 버전 키와 window가 Redis에 남음
+    monkeypatch.setattr(post_page_cache, "_replace", failing)
+    monkeypatch.setattr(async_redis_client, "delete", failing)
+    assert client.put(f"/posts/{post_ids[2]}", json={"title": "edited", "content": "c"}, headers=headers).status_code == 200
+    assert redis_client.get(version_key) == stale_version
+
+    # 남은 버전 키로 304를 보내지 않고 SQL 기준으로 응답 (캐시된 이전 내용도 쓰지 않음)
+    after = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert after.status_code == 200
+    assert after.json()["posts"][0]["title"] == "edited"
+    assert redis_client.get(version_key) == stale_version
+
+    # Redis가 복구되면 다음 접근에서 이전 키를 지우고 다시 캐시 사용
+    monkeypatch.undo()
+    recovered = client.get(url, headers={**headers, "If-None-Match": after.headers["etag"]})
+    assert recovered.status_code == 304
+    assert redis_client.get(version_key) != stale_version
+    assert client.get(url, headers=headers).json()["posts"][0]["title"] == "edited"
+    assert post_page_cache.hits > 0
@@ -0,0 +1,131 @@
+import asyncio
+import hashlib
+import logging
+from datetime import datetime, timedelta
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select, update, func
+from entities.session import Session as SessionModel, SessionRefreshToken
+from infra.database import SessionLocal, open_session
+from lib.auth import create_refresh_token, REFRESH_TOKEN_EXPIRE_SECONDS
+from repositories.session_repository import session_repository
+from services.auth_service import auth_service
+from tests.conftest import run, insert_user
+
+@pytest.fixture(autouse=True)
+def quiet_reuse_warnings():
+    # 동시 요청 중 진 쪽은 재사용으로 감지되어 경고 로그가 나옴
+    logging.getLogger("repositories.session_repository").setLevel(logging.ERROR)
+    yield
+    logging.getLogger("repositories.session_repository").setLevel(logging.NOTSET)
+
+def create_session(user_id: int) -> str:
+    refresh_token = create_refresh_token()
+
+    async def create():
+        async with open_session() as db:
+            await session_repository.create_device_session(db, user_id, refresh_token, "test", "127.0.0.1")
+
+    run(create())
+    return refresh_token
+
+async def refresh(refresh_token: str):
+    """새 RT, 거절되면 HTTPException의 detail"""
+    async with open_session() as db:
+        try:
+            return (await auth_service.refresh_access_token(db, refresh_token))["refresh_token"]
+        except HTTPException as e:
+            return e
+
+def revocation_reasons() -> list:
+    with SessionLocal() as db:
+        return db.scalars(select(SessionModel.revocation_reason)).all()
+
+def test_concurrent_refresh_issues_one_token():
+    user_id = insert_user()
+    tokens = [create_session(user_id) for _ in range(5)]
+
+    async def scenario():
+        return [await asyncio.gather(*[refresh(token) for _ in range(8)]) for token in tokens]
+
+    for results in run(scenario()):
+        assert sum(isinstance(result, str) for result in results) == 1
+
+def test_rotated_token_reuse_revokes_session():
+    user_id = insert_user()
+    first = create_session(user_id)
+
+    second = run(refresh(first))
+    assert isinstance(second, str)
+
+    reused = run(refresh(first))
+    assert isinstance(reused, HTTPException) and reused.status_code == 401
+    assert "reuse" in reused.detail
+    assert revocation_reasons() == ["refresh_token_reuse"]
+
+    # 재사용 감지 후에는 최신 RT도 거절
+    rejected = run(refresh(second))
+    assert isinstance(rejected, HTTPException) and "reuse" not in rejected.detail
+
+def test_any_rotated_token_in_family_revokes_session():
+    user_id = insert_user()
+    tokens = [create_session(user_id)]
+    for _ in range(3):
+        tokens.append(run(refresh(tokens[-1])))
+    assert all(isinstance(token, str) for token in tokens)
+
+    # 직전 RT가 아닌 더 오래된 RT를 다시 써도 재사용으로 감지
+    reused = run(refresh(tokens[0]))
+    assert isinstance(reused, HTTPException) and "reuse" in reused.detail
+    assert revocation_reasons() == ["refresh_token_reuse"]
+
+def test_cleanup_removes_rotated_tokens():
+    user_id = insert_user()
+    first = create_session(user_id)
+    second = run(refresh(first))
+    expired = run(refresh(create_session(user_id)))
+
+    with SessionLocal() as db:
+        # 교체된 지 RT 수명이 지난 기록, 만료된 세션
+        db.execute(update(SessionRefreshToken).values(rotated_at=datetime.now() - timedelta(seconds=REFRESH_TOKEN_EXPIRE_SECONDS + 60)))
+        db.execute(update(SessionModel).where(SessionModel.refresh_token_hash == hashlib.sha256(expired.encode()).hexdigest())
+                   .values(expires_at=datetime.now() - timedelta(seconds=1)))
+        db.commit()
+
+    async def cleanup():
+        async with open_session() as db:
+            return await session_repository.cleanup_sessions(db, pause=0)
+
+    result = run(cleanup())
+    assert (result["expired"], result["rotated_tokens"]) == (1, 1)
+    with SessionLocal() as db:
+        assert db.scalar(select(func.count()).select_from(SessionRefreshToken)) == 0
+
+    # 기록이 지워진 RT는 알 수 없는 RT로 거절 (세션은 유지)
+    rejected = run(refresh(first))
+    assert isinstance(rejected, HTTPException) and "reuse" not in rejected.detail
+    assert isinstance(run(refresh(second)), str)
+
+def test_unknown_token_does_not_revoke():
+    user_id = insert_user()
+    create_session(user_id)
+
+    rejected = run(refresh(create_refresh_token()))
+    assert isinstance(rejected, HTTPException) and rejected.status_code == 401
+    assert revocation_reasons() == [None]
+
+def test_refresh_cookie_flow(client):
+    client.post("/auth/signup", json={"fullname": "user", "email": "flow@test.example.com", "password": "password123"})
+    login = client.post("/auth/login", json={"email": "flow@test.example.com", "password": "password123"})
+    assert login.status_code == 200
+    first = client.cookies["refresh_token"]
+
+    assert client.post("/auth/refresh").status_code == 200
+    assert client.cookies["refresh_token"] != first
+
+    # 교체된 RT를 다시 쓰면 세션 무효화, 기존 AT도 차단
+    client.cookies.set("refresh_token", first)
+    reused = client.post("/auth/refresh")
+    assert reused.status_code == 401 and "reuse" in reused.json()["detail"]
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    assert client.get("/auth/sessions", headers=headers).status_code == 401
@@ -0,0 +1,99 @@
+import asyncio
+import time
+import infra.scheduler
+from infra.scheduler import Scheduler
+from starlette.concurrency import run_in_threadpool
+from tests.conftest import run
+
+class BlockingJob:
+    """스레드풀에서 duration초 동안 실행되는 작업 (동기 DB 모드의 문장 흉내)"""
+
+    def __init__(self, duration: float):
+        self.duration = duration
+        self.started = asyncio.Event()
+        self.finished = []
+
+    def _block(self):
+        time.sleep(self.duration)
+        self.finished.append(time.perf_counter())
+
+    async def __call__(self):
+        self.started.set()
+        await run_in_threadpool(self._block)
+        return {"ok": True}
+
+def test_first_run_after_startup_delay(monkeypatch):
+    monkeypatch.setattr(infra.scheduler, "SCHEDULER_STARTUP_DELAY", 0.05)
+    scheduler = Scheduler()
+    runs = []
+
+    async def job():
+        runs.append(time.perf_counter())
+
+    async def scenario():
+        scheduler.add("startup", job, interval=3600, timeout=10)
+        scheduler.start()
+        await asyncio.sleep(0.3)
+        await scheduler.stop()
+
+    run(scenario())
+    # 한 주기(1시간)를 기다리지 않고 시작 직후 한 번 실행
+    assert len(runs) == 1
+
+def test_cancellable_job_is_cancelled_on_timeout():
+    scheduler = Scheduler()
+    cancelled = []
+
+    async def job():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def scenario():
+        scheduler.add("cancellable", job, interval=1, timeout=0.05)
+        started = time.perf_counter()
+        await scheduler.run_once(scheduler.jobs["cancellable"])
+        return time.perf_counter() - started, (await scheduler.stats())["jobs"]["cancellable"]
+
+    elapsed, stats = run(scenario())
+    assert elapsed < 1 and cancelled == [True]
+    assert stats["last_run"]["status"] == "timeout"
+    assert stats["worker"]["failures"] == 1
+
+def test_non_cancellable_job_keeps_lease_until_finished():
+    first, second = Scheduler(), Scheduler()
+    job = BlockingJob(0.5)
+
+    async def scenario():
+        # 락 임대(0.15초)보다 오래 실행되므로 연장하지 않으면 다른 워커가 겹쳐 실행함
+        for scheduler in (first, second):
+            scheduler.add("blocking", job, interval=0.15, timeout=0.05, cancellable=False)
+        running = asyncio.create_task(first.run_once(first.jobs["blocking"]))
+        await job.started.wait()
+        await asyncio.sleep(0.3)
+        overlapped = await second.run_once(second.jobs["blocking"])
+        await running
+        return overlapped, time.perf_counter(), (await first.stats())["jobs"]["blocking"]["last_run"]
+
+    overlapped, returned_at, last_run = run(scenario())
+    assert overlapped is False
+    # 제한 시간을 넘겨도 스레드가 끝난 뒤에 기록
+    assert job.finished and job.finished[0] <= returned_at
+    assert last_run["status"] == "timeout" and "not cancellable" in last_run["error"]
+    assert last_run["duration_seconds"] >= 0.5
+
+def test_stop_waits_for_non_cancellable_job(monkeypatch):
+    monkeypatch.setattr(infra.scheduler, "SCHEDULER_STARTUP_DELAY", 0)
+    scheduler = Scheduler()
+    job = BlockingJob(0.3)
+
+    async def scenario():
+        scheduler.add("blocking", job, interval=60, timeout=30, cancellable=False)
+        scheduler.start()
+        await job.started.wait()
+        await scheduler.stop()
+        return list(job.finished)
+
+    assert len(run(scenario())) == 1
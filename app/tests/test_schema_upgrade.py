@@ -0,0 +1,32 @@
+from sqlalchemy import text
+from entities.post import POST_SEARCH_DDL
+from infra.database import engine, upgrade_schema
+from tests.conftest import insert_user, insert_board
+
+def test_fresh_schema_needs_no_upgrade():
+    with engine.begin() as conn:
+        assert upgrade_schema(conn) == []
+
+def test_upgrade_adds_missing_search_index_and_fills_it():
+    board_id = insert_board(insert_user())
+    with engine.begin() as conn:
+        # 전문 검색 인덱스가 생기기 전의 DB (게시글은 이미 있음)
+        for name in ("posts_fts_insert", "posts_fts_delete", "posts_fts_update"):
+            conn.execute(text(f"DROP TRIGGER {name}"))
+        conn.execute(text("DROP TABLE posts_fts"))
+        conn.execute(text("INSERT INTO posts (title, content, board_id, author_id) VALUES ('hello world', 'before upgrade', :board_id, 1)"),
+                     {"board_id": board_id})
+
+    with engine.begin() as conn:
+        statements = upgrade_schema(conn)
+    assert statements[:len(POST_SEARCH_DDL["sqlite"])] == list(POST_SEARCH_DDL["sqlite"].values())
+    assert "rebuild" in statements[-1]
+
+    with engine.begin() as conn:
+        # 기존 게시글도 검색되고, 이후 게시글은 트리거로 반영
+        conn.execute(text("INSERT INTO posts (title, content, board_id, author_id) VALUES ('hello again', 'after upgrade', :board_id, 1)"),
+                     {"board_id": board_id})
+        matched = conn.execute(text("SELECT rowid FROM posts_fts WHERE posts_fts MATCH 'hello' ORDER BY rowid")).scalars().all()
+        assert len(matched) == 2
+        # 다시 실행해도 바꾸는 것이 없음
+        assert upgrade_schema(conn) == []